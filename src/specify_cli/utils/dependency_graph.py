@@ -5,7 +5,7 @@ Provides dependency management and ordering using Kahn's algorithm
 for resource deployment sequencing.
 """
 
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set
 from collections import deque
 import logging
 
@@ -33,6 +33,16 @@ class DependencyGraph:
         self.graph: Dict[str, List[str]] = {}  # node -> [dependent nodes]
         self.reverse_graph: Dict[str, List[str]] = {}  # node -> [dependency nodes]
         self.nodes: Set[str] = set()
+        
+        # Topological order and batches are cached until the graph changes;
+        # callers receive copies so they can't corrupt the cache
+        self._ordered_cache: Optional[List[str]] = None
+        self._batches_cache: Optional[List[List[str]]] = None
+    
+    def _invalidate_cache(self) -> None:
+        """Drop cached orderings after the graph is modified"""
+        self._ordered_cache = None
+        self._batches_cache = None
     
     def add_node(self, node: str) -> None:
         """
@@ -45,6 +55,7 @@ class DependencyGraph:
             self.nodes.add(node)
             self.graph[node] = []
             self.reverse_graph[node] = []
+            self._invalidate_cache()
             logger.debug(f"Added node: {node}")
     
     def add_dependency(self, node: str, depends_on: str) -> None:
@@ -62,10 +73,12 @@ class DependencyGraph:
         # Add edge: depends_on -> node
         if node not in self.graph[depends_on]:
             self.graph[depends_on].append(node)
+            self._invalidate_cache()
         
         # Add reverse edge for tracking: node <- depends_on
         if depends_on not in self.reverse_graph[node]:
             self.reverse_graph[node].append(depends_on)
+            self._invalidate_cache()
         
         logger.debug(f"Added dependency: {node} depends on {depends_on}")
     
@@ -79,6 +92,9 @@ class DependencyGraph:
         Raises:
             CyclicDependencyError: If circular dependencies detected
         """
+        if self._ordered_cache is not None:
+            return list(self._ordered_cache)
+        
         # Calculate in-degree for each node
         in_degree: Dict[str, int] = {node: len(self.reverse_graph[node]) for node in self.nodes}
         
@@ -109,7 +125,8 @@ class DependencyGraph:
             raise CyclicDependencyError(cycle_path)
         
         logger.info(f"Topological sort complete: {len(ordered)} nodes ordered")
-        return ordered
+        self._ordered_cache = ordered
+        return list(ordered)
     
     def _find_cycle_path(self, nodes_in_cycle: List[str]) -> List[str]:
         """
@@ -216,6 +233,9 @@ class DependencyGraph:
         Returns:
             List of batches, where each batch is a list of resource IDs
         """
+        if self._batches_cache is not None:
+            return [list(batch) for batch in self._batches_cache]
+        
         ordered = self.get_ordered_resources()
         batches: List[List[str]] = []
         deployed: Set[str] = set()
@@ -240,11 +260,13 @@ class DependencyGraph:
             deployed.update(batch)
         
         logger.info(f"Created {len(batches)} deployment batches")
-        return batches
+        self._batches_cache = batches
+        return [list(batch) for batch in batches]
     
     def clear(self) -> None:
         """Clear all nodes and edges from the graph"""
         self.graph.clear()
         self.reverse_graph.clear()
         self.nodes.clear()
+        self._invalidate_cache()
         logger.debug("Graph cleared")
@@ -22,7 +22,7 @@ Usage:
     result = await session.run()
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 from pathlib import Path
 from enum import Enum
@@ -124,7 +124,7 @@ class ProjectInfo:
     last_modified: float  # Unix timestamp
 
 
-@dataclass
+@dataclass(slots=True)
 class AppSetting:
     """Represents an application configuration setting"""
     setting_id: str
@@ -154,6 +154,11 @@ class ResourceDeployment:
     deployment_status: DeploymentState
     bicep_template_path: Path
     output_values: Dict[str, str]
+    # ARM name (last resource_id segment); resource_name is only a display name
+    arm_name: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.arm_name = self.resource_id.rsplit('/', 1)[-1]
 
 
 @dataclass
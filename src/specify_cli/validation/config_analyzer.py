@@ -6,9 +6,12 @@ required application settings, secure values, and resource dependencies.
 """
 
 import json
+import os
 import re
+import string
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set, Tuple
 import logging
 
 from specify_cli.validation import (
@@ -18,10 +21,36 @@ from specify_cli.validation import (
     SourceType,
     ConfigAnalysisError
 )
-from specify_cli.utils.dependency_graph import DependencyGraph
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Key Vault secret names allow lowercase alphanumerics and hyphens only.
+# Maps ASCII separators to hyphens, uppercase to lowercase and drops every
+# other invalid ASCII character in a single str.translate pass.
+_SECRET_NAME_TABLE = str.maketrans({
+    **{chr(c): None for c in range(128)},
+    **{c: c for c in string.ascii_lowercase + string.digits + "-"},
+    **{c: c.lower() for c in string.ascii_uppercase},
+    **{c: "-" for c in ":_."},
+})
+_INVALID_SECRET_CHARS = re.compile(r'[^a-z0-9-]')
+
+# Upper-case module-level assignment in a Python config file: NAME = value
+_PY_ASSIGNMENT_MATCH = re.compile(r'^([A-Z_][A-Z0-9_]*)\s*=\s*(.+)$').match
+
+
+def _unquote(value: str) -> str:
+    """Remove one pair of matching surrounding quotes from a value."""
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
+        return value[1:-1]
+    return value
+
 
 class ConfigAnalyzer:
     """
@@ -30,18 +59,23 @@ class ConfigAnalyzer:
     Supports multiple frameworks with framework-specific parsers.
     """
     
-    # Patterns for identifying secure values
-    SECURE_PATTERNS = [
-        r"password",
-        r"secret",
-        r"apikey",
-        r"api[_-]?key",
-        r"connectionstring",
-        r"connection[_-]?string",
-        r"token",
-        r"credential",
-        r"private[_-]?key",
-    ]
+    # Lowercase substrings identifying secure values (separator variants
+    # are spelled out so a plain substring check is enough)
+    SECURE_TOKENS = (
+        "password",
+        "secret",
+        "apikey",
+        "api_key",
+        "api-key",
+        "connectionstring",
+        "connection_string",
+        "connection-string",
+        "token",
+        "credential",
+        "privatekey",
+        "private_key",
+        "private-key",
+    )
     
     # Resource type detection patterns
     RESOURCE_PATTERNS = {
@@ -76,12 +110,23 @@ class ConfigAnalyzer:
         ]
     }
     
+    # Shortest value any RESOURCE_PATTERNS entry can match ("SqlConnection")
+    MIN_RESOURCE_VALUE_LENGTH = 13
+    
+    # Config files larger than this are stream-parsed (when ijson is available)
+    # instead of being materialised with json.loads
+    STREAMING_THRESHOLD_BYTES = 64 * 1024
+    
+    # Config files are parsed on a thread pool once there are at least this many
+    PARALLEL_PARSE_MIN_FILES = 3
+    MAX_PARSE_WORKERS = 8
+    
     def __init__(self):
         """Initialize configuration analyzer"""
-        self.secure_regex = re.compile(
-            "|".join(self.SECURE_PATTERNS),
-            re.IGNORECASE
-        )
+        self.resource_regexes = {
+            resource_type: re.compile("|".join(patterns), re.IGNORECASE)
+            for resource_type, patterns in self.RESOURCE_PATTERNS.items()
+        }
     
     def analyze_project(self, project: ProjectInfo) -> AnalysisResult:
         """
@@ -134,106 +179,200 @@ class ConfigAnalyzer:
             List of discovered app settings
         """
         settings = []
+        appsettings_files, env_files, package_json = self._scan_config_files(
+            project.source_code_path
+        )
         
         if project.framework == "dotnet":
-            settings.extend(self._parse_appsettings(project))
+            settings.extend(self._parse_files(appsettings_files))
         elif project.framework == "nodejs":
-            settings.extend(self._parse_env_file(project))
-            settings.extend(self._parse_package_json(project))
+            settings.extend(self._parse_files(env_files))
+            settings.extend(self._parse_package_json(package_json))
         elif project.framework == "python":
             settings.extend(self._parse_python_config(project))
-            settings.extend(self._parse_env_file(project))
+            settings.extend(self._parse_files(env_files))
         else:
             # Try generic parsing
-            settings.extend(self._parse_env_file(project))
+            settings.extend(self._parse_files(env_files))
         
         return settings
     
-    def _parse_appsettings(self, project: ProjectInfo) -> List[AppSetting]:
+    def _scan_config_files(
+        self,
+        source_path: Path
+    ) -> Tuple[List[Path], List[Path], Optional[Path]]:
         """
-        Parse ASP.NET appsettings.json files.
+        Collect top-level config files with a single directory scan.
+        
+        Matches ASP.NET appsettings.json / appsettings.*.json files, .env*
+        files (except .env.local overrides) and package.json.
         
         Args:
-            project: Project to parse
+            source_path: Project source directory
+            
+        Returns:
+            Tuple of (appsettings files, env files, package.json path or None)
+        """
+        appsettings_files: List[Path] = []
+        env_files: List[Path] = []
+        package_json: Optional[Path] = None
+        
+        try:
+            with os.scandir(source_path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    
+                    if name == "appsettings.json":
+                        # Base settings are parsed before environment overrides
+                        appsettings_files.insert(0, Path(entry.path))
+                    elif name.startswith("appsettings.") and name.endswith(".json"):
+                        if len(name) >= len("appsettings..json"):
+                            appsettings_files.append(Path(entry.path))
+                    elif name.startswith(".env"):
+                        if name != ".env.local":  # Skip local overrides
+                            env_files.append(Path(entry.path))
+                    elif name == "package.json":
+                        package_json = Path(entry.path)
+        except OSError as e:
+            logger.debug(f"Cannot scan {source_path} for config files: {e}")
+        
+        return appsettings_files, env_files, package_json
+    
+    def _parse_files(self, paths: List[Path]) -> List[AppSetting]:
+        """
+        Parse configuration files, overlapping file I/O across threads.
+        
+        Small batches are parsed serially to avoid thread pool overhead.
+        Settings are returned in the order of the given paths.
+        
+        Args:
+            paths: Configuration files to parse
             
         Returns:
             List of app settings
         """
         settings = []
         
-        # Look for appsettings files
-        for pattern in ["appsettings.json", "appsettings.*.json"]:
-            for config_file in project.source_code_path.glob(pattern):
-                try:
-                    data = json.loads(config_file.read_text())
-                    settings.extend(self._extract_settings_from_json(data))
-                except Exception as e:
-                    logger.warning(f"Failed to parse {config_file}: {e}")
+        if len(paths) < self.PARALLEL_PARSE_MIN_FILES:
+            for path in paths:
+                settings.extend(self._parse_single_file(path))
+            return settings
+        
+        workers = min(self.MAX_PARSE_WORKERS, len(paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for result in executor.map(self._parse_single_file, paths):
+                settings.extend(result)
         
         return settings
     
-    def _parse_env_file(self, project: ProjectInfo) -> List[AppSetting]:
+    def _parse_single_file(self, path: Path) -> List[AppSetting]:
         """
-        Parse .env or .env.example files.
+        Parse one configuration file, dispatching on its name.
         
         Args:
-            project: Project to parse
+            path: Configuration file to parse
             
         Returns:
             List of app settings
         """
-        settings = []
+        if path.name.startswith(".env"):
+            return self._parse_env_entries(path)
+        if path.suffix == ".json":
+            return self._parse_json_config(path)
+        if path.suffix == ".py":
+            return self._parse_python_file(path)
+        
+        logger.debug(f"Skipping unsupported config file: {path}")
+        return []
+    
+    def _parse_json_config(self, config_file: Path) -> List[AppSetting]:
+        """
+        Parse a JSON configuration file such as appsettings.json.
         
-        for env_file in project.source_code_path.glob(".env*"):
-            if env_file.name == ".env.local":
-                continue  # Skip local overrides
+        Args:
+            config_file: JSON file to parse
             
-            try:
-                for line in env_file.read_text().splitlines():
-                    line = line.strip()
-                    
-                    # Skip comments and empty lines
-                    if not line or line.startswith("#"):
-                        continue
-                    
-                    # Parse KEY=VALUE
-                    if "=" in line:
-                        key, value = line.split("=", 1)
-                        key = key.strip()
-                        value = value.strip().strip('"').strip("'")
-                        
-                        is_secure = self._is_secure_value(key)
-                        
-                        setting = AppSetting(
-                            setting_id=f"env_{key}",
-                            name=key,
-                            value=value if not is_secure else None,
-                            source_type=SourceType.KEYVAULT if is_secure else SourceType.HARDCODED,
-                            is_secure=is_secure,
-                            environment="test",
-                            keyvault_secret_name=self._format_secret_name(key) if is_secure else None
-                        )
-                        settings.append(setting)
-                        
-            except Exception as e:
-                logger.warning(f"Failed to parse {env_file}: {e}")
+        Returns:
+            List of app settings
+        """
+        try:
+            if (
+                IJSON_AVAILABLE
+                and config_file.stat().st_size > self.STREAMING_THRESHOLD_BYTES
+            ):
+                return self._extract_settings_streaming(config_file)
+            
+            data = json.loads(config_file.read_text())
+            return self._extract_settings_from_json(data)
+        except Exception as e:
+            logger.warning(f"Failed to parse {config_file}: {e}")
+            return []
+    
+    def _parse_env_entries(self, env_file: Path) -> List[AppSetting]:
+        """
+        Parse KEY=VALUE entries from a single .env file.
+        
+        Args:
+            env_file: .env file to parse
+            
+        Returns:
+            List of app settings
+        """
+        settings = []
+        
+        # Bind loop invariants to locals
+        _kv = SourceType.KEYVAULT
+        _hc = SourceType.HARDCODED
+        _classify = self._classify_key
+        _append = settings.append
+        _AppSetting = AppSetting
+        
+        try:
+            for line in env_file.read_text().splitlines():
+                line = line.strip()
+                
+                # Skip comments and empty lines
+                if not line or line.startswith("#"):
+                    continue
+                
+                # Parse KEY=VALUE (lines without a key are ignored)
+                eq = line.find("=")
+                if eq <= 0:
+                    continue
+                
+                key = line[:eq].rstrip()
+                value = _unquote(line[eq + 1:].lstrip())
+                
+                is_secure, secret_name = _classify(key)
+                
+                _append(_AppSetting(
+                    setting_id=f"env_{key}",
+                    name=key,
+                    value=value if not is_secure else None,
+                    source_type=_kv if is_secure else _hc,
+                    is_secure=is_secure,
+                    environment="test",
+                    keyvault_secret_name=secret_name
+                ))
+                
+        except Exception as e:
+            logger.warning(f"Failed to parse {env_file}: {e}")
         
         return settings
     
-    def _parse_package_json(self, project: ProjectInfo) -> List[AppSetting]:
+    def _parse_package_json(self, package_json: Optional[Path]) -> List[AppSetting]:
         """
         Parse Node.js package.json for config hints.
         
         Args:
-            project: Project to parse
+            package_json: package.json path, or None if the project has none
             
         Returns:
             List of app settings
         """
         settings = []
-        package_json = project.source_code_path / "package.json"
         
-        if not package_json.exists():
+        if package_json is None:
             return settings
         
         try:
@@ -258,15 +397,12 @@ class ConfigAnalyzer:
         Returns:
             List of app settings
         """
-        settings = []
-        
-        for config_file in project.source_code_path.glob("**/config.py"):
-            settings.extend(self._parse_python_file(config_file))
-        
-        for settings_file in project.source_code_path.glob("**/settings.py"):
-            settings.extend(self._parse_python_file(settings_file))
+        python_files = [
+            *project.source_code_path.glob("**/config.py"),
+            *project.source_code_path.glob("**/settings.py"),
+        ]
         
-        return settings
+        return self._parse_files(python_files)
     
     def _parse_python_file(self, file_path: Path) -> List[AppSetting]:
         """
@@ -280,6 +416,14 @@ class ConfigAnalyzer:
         """
         settings = []
         
+        # Bind loop invariants to locals
+        _kv = SourceType.KEYVAULT
+        _hc = SourceType.HARDCODED
+        _classify = self._classify_key
+        _append = settings.append
+        _AppSetting = AppSetting
+        _match = _PY_ASSIGNMENT_MATCH
+        
         try:
             content = file_path.read_text()
             
@@ -288,7 +432,7 @@ class ConfigAnalyzer:
                 line = line.strip()
                 
                 # Match: VARIABLE_NAME = value
-                match = re.match(r'^([A-Z_][A-Z0-9_]*)\s*=\s*(.+)$', line)
+                match = _match(line)
                 if match:
                     key = match.group(1)
                     
@@ -296,18 +440,17 @@ class ConfigAnalyzer:
                     if key in ["DEBUG", "TESTING", "VERSION"]:
                         continue
                     
-                    is_secure = self._is_secure_value(key)
+                    is_secure, secret_name = _classify(key)
                     
-                    setting = AppSetting(
+                    _append(_AppSetting(
                         setting_id=f"py_{key}",
                         name=key,
                         value=None,
-                        source_type=SourceType.KEYVAULT if is_secure else SourceType.HARDCODED,
+                        source_type=_kv if is_secure else _hc,
                         is_secure=is_secure,
                         environment="test",
-                        keyvault_secret_name=self._format_secret_name(key) if is_secure else None
-                    )
-                    settings.append(setting)
+                        keyvault_secret_name=secret_name
+                    ))
                     
         except Exception as e:
             logger.warning(f"Failed to parse {file_path}: {e}")
@@ -320,7 +463,11 @@ class ConfigAnalyzer:
         prefix: str = ""
     ) -> List[AppSetting]:
         """
-        Recursively extract settings from JSON structure.
+        Extract settings from JSON structure.
+        
+        Walks nested objects with an explicit stack of item iterators, so
+        deep configs cannot hit the recursion limit and settings keep
+        document order.
         
         Args:
             data: JSON data dictionary
@@ -331,29 +478,126 @@ class ConfigAnalyzer:
         """
         settings = []
         
-        for key, value in data.items():
-            full_key = f"{prefix}:{key}" if prefix else key
-            
-            if isinstance(value, dict):
-                # Recurse into nested structures
-                settings.extend(self._extract_settings_from_json(value, full_key))
-            else:
-                # Leaf value - create setting
-                is_secure = self._is_secure_value(full_key)
+        # Bind loop invariants to locals
+        _build = self._build_json_setting
+        _append = settings.append
+        
+        stack = [(prefix, iter(data.items()))]
+        while stack:
+            prefix, items = stack[-1]
+            for key, value in items:
+                full_key = f"{prefix}:{key}" if prefix else key
                 
-                setting = AppSetting(
-                    setting_id=f"json_{full_key.replace(':', '_')}",
-                    name=full_key,
-                    value=str(value) if not is_secure else None,
-                    source_type=SourceType.KEYVAULT if is_secure else SourceType.HARDCODED,
-                    is_secure=is_secure,
-                    environment="test",
-                    keyvault_secret_name=self._format_secret_name(full_key) if is_secure else None
-                )
-                settings.append(setting)
+                if isinstance(value, dict):
+                    # Descend into nested structure, resume this one afterwards
+                    stack.append((full_key, iter(value.items())))
+                    break
+                
+                # Leaf value - create setting
+                _append(_build(full_key, value))
+            else:
+                stack.pop()
+        
+        return settings
+    
+    def _extract_settings_streaming(self, config_file: Path) -> List[AppSetting]:
+        """
+        Extract settings from a JSON file without materialising the document.
+        
+        Walks the ijson event stream, tracking the key path of open objects,
+        and emits the same settings as _extract_settings_from_json. Arrays are
+        leaf values, so only the array itself is built in memory.
+        
+        Args:
+            config_file: JSON configuration file
+            
+        Returns:
+            List of app settings
+            
+        Raises:
+            ValueError: If the document root is not a JSON object
+        """
+        settings = []
+        keys: List[str] = []  # Current key of each open object
+        builder = None  # Collects an array value until it is closed
+        array_depth = 0
+        
+        # Bind loop invariants to locals
+        _build = self._build_json_setting
+        _append = settings.append
+        _join = ":".join
+        
+        with open(config_file, "rb") as f:
+            for _, event, value in ijson.parse(f, use_float=True):
+                if builder is not None:
+                    builder.event(event, value)
+                    if event in ("start_array", "start_map"):
+                        array_depth += 1
+                    elif event in ("end_array", "end_map"):
+                        array_depth -= 1
+                    if array_depth == 0:
+                        _append(_build(_join(keys), builder.value))
+                        builder = None
+                elif event == "map_key":
+                    keys[-1] = value
+                elif event == "start_map":
+                    keys.append("")
+                elif event == "end_map":
+                    keys.pop()
+                elif not keys:
+                    raise ValueError("JSON root must be an object")
+                elif event == "start_array":
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                    array_depth = 1
+                else:
+                    # Leaf scalar - create setting
+                    _append(_build(_join(keys), value))
         
         return settings
     
+    def _build_json_setting(self, full_key: str, value) -> AppSetting:
+        """
+        Create an app setting for a leaf value of a JSON document.
+        
+        Args:
+            full_key: Colon-separated key path
+            value: Leaf value
+            
+        Returns:
+            App setting
+        """
+        is_secure, secret_name = self._classify_key(full_key)
+        
+        return AppSetting(
+            setting_id=f"json_{full_key.replace(':', '_')}",
+            name=full_key,
+            value=str(value) if not is_secure else None,
+            source_type=SourceType.KEYVAULT if is_secure else SourceType.HARDCODED,
+            is_secure=is_secure,
+            environment="test",
+            keyvault_secret_name=secret_name
+        )
+    
+    def _classify_key(self, key: str) -> Tuple[bool, Optional[str]]:
+        """
+        Determine if a setting key is secure and derive its secret name.
+        
+        Lowercases the key once and shares it between the secure-token
+        check and secret name formatting.
+        
+        Args:
+            key: Setting key/name
+            
+        Returns:
+            Tuple of (is_secure, Key Vault secret name or None)
+        """
+        lowered = key.lower()
+        for token in self.SECURE_TOKENS:
+            if token in lowered:
+                return True, self._format_secret_name(lowered)
+        return False, None
+    
     def _is_secure_value(self, key: str) -> bool:
         """
         Determine if a setting key indicates a secure value.
@@ -364,7 +608,11 @@ class ConfigAnalyzer:
         Returns:
             True if key suggests secure value
         """
-        return bool(self.secure_regex.search(key))
+        key = key.lower()
+        for token in self.SECURE_TOKENS:
+            if token in key:
+                return True
+        return False
     
     def _format_secret_name(self, key: str) -> str:
         """
@@ -381,19 +629,14 @@ class ConfigAnalyzer:
         Returns:
             Formatted secret name
         """
-        # Replace common separators with hyphens
-        name = key.replace(":", "-").replace("_", "-").replace(".", "-")
-        
-        # Convert to lowercase
-        name = name.lower()
+        name = key.translate(_SECRET_NAME_TABLE)
         
-        # Remove invalid characters
-        name = re.sub(r'[^a-z0-9-]', '', name)
+        if not name.isascii():
+            # Non-ASCII characters may lowercase to valid ones (e.g. 'İ')
+            name = _INVALID_SECRET_CHARS.sub('', name.lower())
         
         # Trim to max length
-        name = name[:127]
-        
-        return name
+        return name[:127]
     
     def _identify_dependencies(
         self,
@@ -411,19 +654,31 @@ class ConfigAnalyzer:
             List of resource type identifiers
         """
         dependencies: Set[str] = set()
+        remaining = dict(self.resource_regexes)
         
-        # Check setting values for resource patterns
+        # Check setting values for resource patterns, skipping resource
+        # types that are already detected
         for setting in settings:
-            if setting.value:
-                for resource_type, patterns in self.RESOURCE_PATTERNS.items():
-                    for pattern in patterns:
-                        if re.search(pattern, setting.value, re.IGNORECASE):
-                            dependencies.add(resource_type)
-                            logger.debug(
-                                f"Detected {resource_type} dependency "
-                                f"from setting: {setting.name}"
-                            )
-                            break
+            if not remaining:
+                break
+            
+            value = setting.value
+            if not value or len(value) < self.MIN_RESOURCE_VALUE_LENGTH:
+                continue
+            
+            # Every resource pattern needs a '.' except the bare SqlConnection
+            # marker, so most plain values never reach the regexes
+            if "." not in value and "sqlconnection" not in value.lower():
+                continue
+            
+            for resource_type, regex in list(remaining.items()):
+                if regex.search(value):
+                    dependencies.add(resource_type)
+                    del remaining[resource_type]
+                    logger.debug(
+                        f"Detected {resource_type} dependency "
+                        f"from setting: {setting.name}"
+                    )
         
         return list(dependencies)
     
@@ -437,24 +692,15 @@ class ConfigAnalyzer:
         Returns:
             Dependency graph dictionary
         """
-        graph = DependencyGraph()
-        
-        # Add all resources as nodes
-        for resource in dependencies:
-            graph.add_node(resource)
-        
-        # Define common dependency relationships
-        # Example: Key Vault typically needed first for secrets
-        if "Microsoft.KeyVault/vaults" in dependencies:
-            for resource in dependencies:
-                if resource != "Microsoft.KeyVault/vaults":
-                    # Other resources may depend on Key Vault for secrets
-                    graph.add_dependency(resource, "Microsoft.KeyVault/vaults")
-        
-        # SQL Server should be deployed before apps using it
-        if "Microsoft.Sql/servers" in dependencies:
-            # No dependencies (can be deployed first)
-            pass
-        
-        # Convert graph to dictionary format
-        return {node: graph.get_dependencies(node) for node in graph.nodes}
+        keyvault = "Microsoft.KeyVault/vaults"
+        
+        # Key Vault is typically needed first for secrets, so every other
+        # resource depends on it. The rules are simple enough to build the
+        # adjacency dictionary directly instead of going through DependencyGraph.
+        if keyvault not in dependencies:
+            return {resource: [] for resource in dependencies}
+        
+        return {
+            resource: [] if resource == keyvault else [keyvault]
+            for resource in dependencies
+        }
@@ -8,17 +8,69 @@ Part of User Story 3: Test Deployment and Endpoint Validation
 """
 
 import asyncio
+import json
 import logging
+import random
+import re
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Set
 from enum import Enum
 import httpx
 
 from specify_cli.validation.endpoint_discoverer import Endpoint
 from specify_cli.utils.retry_policies import ExponentialBackoff
 
+# httpx needs the h2 package (httpx[http2]) to negotiate HTTP/2
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Shared by every request that sends no extra headers (never mutated)
+_EMPTY_HEADERS: Dict[str, str] = {}
+
+# Status codes accepted when a test does not specify its own (any 2xx)
+_DEFAULT_EXPECTED_STATUS_CODES: FrozenSet[int] = frozenset(range(200, 300))
+
+# Error message recorded for authenticated endpoints that are skipped
+_SKIPPED_AUTH_MESSAGE = "Authentication required (skipped)"
+
+# Shared empty JSON body for methods that send one (never mutated)
+_EMPTY_JSON: Dict = {}
+
+
+def _body_preview(response: httpx.Response, limit: int = 200) -> str:
+    """First characters of a response body, decoding only the bytes needed"""
+    content = response.content
+    if not content:
+        return '(empty)'
+    
+    # No supported encoding uses more than 4 bytes per character
+    return content[:limit * 4].decode(response.encoding or 'utf-8', errors='replace')[:limit]
+
+
+def _json_bytes(data) -> bytes:
+    """Encode data as compact UTF-8 JSON, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+@lru_cache(maxsize=128)
+def _compile_path_pattern(path_pattern: str) -> re.Pattern:
+    """Compile an endpoint path filter, reusing patterns across filter calls"""
+    return re.compile(path_pattern)
+
 
 class TestStatus(Enum):
     """Endpoint test result status"""
@@ -30,7 +82,16 @@ class TestStatus(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+# Statuses counted as failed test results
+_FAILURE_STATUSES = frozenset({
+    TestStatus.FAILURE,
+    TestStatus.TIMEOUT,
+    TestStatus.AUTH_ERROR,
+    TestStatus.SERVER_ERROR,
+})
+
+
+@dataclass(slots=True)
 class TestResult:
     """Result from testing an endpoint"""
     
@@ -58,11 +119,29 @@ class TestResult:
             "error_message": self.error_message,
             "retry_count": self.retry_count,
         }
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to compact UTF-8 JSON (same fields as to_dict)"""
+        return _json_bytes(self.to_dict())
 
 
 class EndpointTester:
     """Tests deployed API endpoints with retry logic and concurrent execution"""
     
+    # HTTP method -> (AsyncClient method name, JSON body or None)
+    _METHOD_DISPATCH = {
+        'GET': ('get', None),
+        'POST': ('post', _EMPTY_JSON),
+        'PUT': ('put', _EMPTY_JSON),
+        'DELETE': ('delete', None),
+        'PATCH': ('patch', _EMPTY_JSON),
+        'HEAD': ('head', None),
+        'OPTIONS': ('options', None),
+    }
+    
+    # Upper bound for the warm-up request sent before concurrent tests
+    WARM_UP_TIMEOUT_SECONDS = 5.0
+    
     def __init__(
         self,
         base_url: str,
@@ -72,6 +151,9 @@ class EndpointTester:
         auth_token: Optional[str] = None,
         skip_auth_endpoints: bool = False,
         verbose: bool = False,
+        max_keepalive_connections: Optional[int] = None,
+        max_connections: Optional[int] = None,
+        warm_up_connections: bool = False,
     ):
         """
         Initialize endpoint tester
@@ -79,26 +161,50 @@ class EndpointTester:
         Args:
             base_url: Base URL of deployed application (e.g., https://myapp.azurewebsites.net)
             timeout_seconds: HTTP request timeout in seconds
-            max_concurrent: Maximum number of concurrent tests
+            max_concurrent: Maximum number of concurrent requests (also the worker
+                count used by test_multiple_endpoints)
             retry_policy: Retry policy for failed requests (default: 3 attempts)
             auth_token: Optional authentication token (Bearer token)
             skip_auth_endpoints: Skip testing endpoints that require authentication
             verbose: Enable verbose logging (detailed HTTP request/response)
+            max_keepalive_connections: Idle connections kept in the pool
+                (default: max(20, max_concurrent))
+            max_connections: Total connection limit (default: max(50, 2 * max_concurrent))
+            warm_up_connections: Send one HEAD request to base_url before testing
+                several endpoints concurrently, so DNS, TCP and TLS setup happen once
+                (default: off; the request is not covered by the test results)
+        
+        The pool is sized from max_concurrent by default, so raising concurrency
+        does not evict keep-alive connections that are about to be reused.
         """
         self.base_url = base_url.rstrip('/')
         self.timeout_seconds = timeout_seconds
         self.max_concurrent = max_concurrent
         self.retry_policy = retry_policy or ExponentialBackoff(base_delay=2.0, max_delay=30.0, max_attempts=3)
         self.auth_token = auth_token
+        # Authorization header prepared once and reused by every authenticated test
+        self._auth_header: Optional[Dict[str, str]] = (
+            {'Authorization': f'Bearer {auth_token}'} if auth_token else None
+        )
         self.skip_auth_endpoints = skip_auth_endpoints
         self.verbose = verbose
+        self.warm_up_connections = warm_up_connections
         
-        # Semaphore for concurrent request limiting
+        # Limits in-flight requests, including direct test_endpoint callers.
+        # Held per request, not across retry backoff delays.
         self._semaphore = asyncio.Semaphore(max_concurrent)
         
         # Shared HTTP client with connection pooling (for performance)
-        # Limits: connections per host and total connections
-        limits = httpx.Limits(max_keepalive_connections=20, max_connections=50)
+        # Limits: idle and total connections, sized to cover max_concurrent.
+        # Idle connections are kept for 30s so they outlive retry backoff
+        # delays and are reused instead of re-handshaking. The pool does not
+        # bound in-flight requests (HTTP/2 multiplexes streams on one
+        # connection); the semaphore above does.
+        limits = httpx.Limits(
+            max_keepalive_connections=max_keepalive_connections or max(20, max_concurrent),
+            max_connections=max_connections or max(50, max_concurrent * 2),
+            keepalive_expiry=30.0,
+        )
         self._http_client: Optional[httpx.AsyncClient] = None
         self._client_limits = limits
         
@@ -122,41 +228,42 @@ class EndpointTester:
         Returns:
             Filtered list of endpoints
         """
-        import re
-        
         filtered = endpoints
         
         # Filter by HTTP method
         if methods:
             methods_upper = [m.upper() for m in methods]
-            filtered = [ep for ep in filtered if ep.method.upper() in methods_upper]
+            methods_set = frozenset(methods_upper)
+            filtered = [ep for ep in filtered if ep.method.upper() in methods_set]
             logger.info(f"Filtered by methods {methods_upper}: {len(filtered)} endpoints")
         
         # Filter by path pattern
         if path_pattern:
-            pattern = re.compile(path_pattern)
+            pattern = _compile_path_pattern(path_pattern)
             filtered = [ep for ep in filtered if pattern.search(ep.path)]
             logger.info(f"Filtered by pattern '{path_pattern}': {len(filtered)} endpoints")
         
         return filtered
     
-    async def _get_or_create_client(self, timeout: float) -> httpx.AsyncClient:
+    def _open_client(self) -> httpx.AsyncClient:
         """
-        Get or create shared HTTP client with connection pooling (for performance).
+        Create the shared HTTP client with connection pooling (for performance).
+        
+        The client is created once, on context manager entry or by the first
+        test outside a context manager. Per-test timeout overrides are passed
+        with each request. HTTP/2 is enabled when h2 is installed, so concurrent
+        tests against the same host multiplex over one connection.
         
-        Args:
-            timeout: Request timeout in seconds
-            
         Returns:
             Configured AsyncClient instance with connection pooling
         """
-        if self._http_client is None:
-            self._http_client = httpx.AsyncClient(
-                timeout=timeout,
-                limits=self._client_limits,
-                follow_redirects=False  # Don't follow redirects automatically
-            )
-            logger.debug(f"Created shared HTTP client (timeout={timeout}s, limits={self._client_limits})")
+        self._http_client = httpx.AsyncClient(
+            timeout=self.timeout_seconds,
+            limits=self._client_limits,
+            follow_redirects=False,  # Don't follow redirects automatically
+            http2=HTTP2_AVAILABLE,
+        )
+        logger.debug(f"Created shared HTTP client (timeout={self.timeout_seconds}s, limits={self._client_limits})")
         return self._http_client
     
     async def close(self) -> None:
@@ -167,7 +274,9 @@ class EndpointTester:
             logger.debug("Closed shared HTTP client and released connections")
     
     async def __aenter__(self):
-        """Async context manager entry."""
+        """Async context manager entry - creates the shared HTTP client."""
+        if self._http_client is None:
+            self._open_client()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -193,7 +302,7 @@ class EndpointTester:
             Test result
         """
         if expected_status_codes is None:
-            expected_status_codes = set(range(200, 300))
+            expected_status_codes = _DEFAULT_EXPECTED_STATUS_CODES
         
         # Use provided timeout or fall back to instance timeout
         timeout = timeout_seconds if timeout_seconds is not None else self.timeout_seconds
@@ -202,12 +311,15 @@ class EndpointTester:
         url = f"{self.base_url}{endpoint.path}"
         
         # Prepare headers
-        headers = {}
-        if endpoint.requires_auth and self.auth_token:
-            headers['Authorization'] = f'Bearer {self.auth_token}'
+        headers = self._auth_header if (endpoint.requires_auth and self._auth_header) else _EMPTY_HEADERS
         
-        logger.info(f"Testing: {endpoint.method} {url}")
-        if self.verbose:
+        # Per-test log lines are formatted only when INFO is enabled
+        log_info = logger.isEnabledFor(logging.INFO)
+        log_verbose = self.verbose and log_info
+        
+        if log_info:
+            logger.info(f"Testing: {endpoint.method} {url}")
+        if log_verbose:
             logger.info(f"  Request timeout: {timeout}s")
             logger.info(f"  Expected status codes: {expected_status_codes}")
             if headers:
@@ -216,84 +328,88 @@ class EndpointTester:
         # Test with retry logic
         retry_count = 0
         last_error = None
-        
-        async with self._semaphore:
-            # Get or create shared HTTP client (reuses connections for performance)
-            client = await self._get_or_create_client(timeout)
-            
-            for attempt in range(self.retry_policy.max_attempts):
-                try:
-                    # Make HTTP request using shared client
-                    start_time = asyncio.get_event_loop().time()
-                    
+        last_error_status = TestStatus.FAILURE
+        prev_delay = self.retry_policy.base_delay
+        
+        # Shared HTTP client (reuses connections for performance)
+        client = self._http_client or self._open_client()
+        loop_time = asyncio.get_running_loop().time
+        
+        for attempt in range(self.retry_policy.max_attempts):
+            try:
+                # Make HTTP request using shared client
+                async with self._semaphore:
+                    start_time = loop_time()
                     response = await self._make_request(
-                        client, endpoint.method, url, headers
+                        client, endpoint.method, url, headers, timeout
                     )
-                    
-                    end_time = asyncio.get_event_loop().time()
-                    response_time_ms = (end_time - start_time) * 1000
-                    
-                    # Validate response
-                    if response.status_code in expected_status_codes:
-                        logger.info(f"✓ {endpoint} -> {response.status_code} ({response_time_ms:.0f}ms)")
-                        if self.verbose:
-                            logger.info(f"  Response headers: {dict(response.headers)}")
-                            logger.info(f"  Response body preview: {response.text[:200] if response.text else '(empty)'}")
-                        return TestResult(
-                            endpoint=endpoint,
-                            status=TestStatus.SUCCESS,
-                            status_code=response.status_code,
-                            response_time_ms=response_time_ms,
-                            retry_count=retry_count,
-                        )
-                    else:
-                        # Unexpected status code
-                        status = self._classify_status_code(response.status_code)
-                        error_msg = f"Unexpected status code: {response.status_code}"
-                        
-                        logger.warning(f"✗ {endpoint} -> {response.status_code} (expected {expected_status_codes})")
-                        
-                        return TestResult(
-                            endpoint=endpoint,
-                            status=status,
-                            status_code=response.status_code,
-                            response_time_ms=response_time_ms,
-                            error_message=error_msg,
-                            retry_count=retry_count,
-                        )
+                    end_time = loop_time()
                 
-                except httpx.TimeoutException as e:
-                    retry_count += 1
-                    last_error = str(e)
-                    
-                    if attempt < self.retry_policy.max_attempts - 1:
-                        delay = self.retry_policy.get_delay(attempt)
-                        logger.warning(f"Request timeout (attempt {attempt + 1}), retrying in {delay:.1f}s...")
-                        await asyncio.sleep(delay)
-                    else:
-                        logger.error(f"✗ {endpoint} -> Timeout after {retry_count} attempts")
+                response_time_ms = (end_time - start_time) * 1000
                 
-                except httpx.HTTPError as e:
-                    retry_count += 1
-                    last_error = str(e)
+                # Validate response
+                if response.status_code in expected_status_codes:
+                    if log_info:
+                        logger.info(f"✓ {endpoint} -> {response.status_code} ({response_time_ms:.0f}ms)")
+                    if log_verbose:
+                        logger.info(f"  Response headers: {dict(response.headers)}")
+                        logger.info(f"  Response body preview: {_body_preview(response)}")
+                    return TestResult(
+                        endpoint=endpoint,
+                        status=TestStatus.SUCCESS,
+                        status_code=response.status_code,
+                        response_time_ms=response_time_ms,
+                        retry_count=retry_count,
+                    )
+                else:
+                    # Unexpected status code
+                    status = self._classify_status_code(response.status_code)
+                    error_msg = f"Unexpected status code: {response.status_code}"
                     
-                    if attempt < self.retry_policy.max_attempts - 1:
-                        delay = self.retry_policy.get_delay(attempt)
-                        logger.warning(f"HTTP error (attempt {attempt + 1}), retrying in {delay:.1f}s...")
-                        await asyncio.sleep(delay)
-                    else:
-                        logger.error(f"✗ {endpoint} -> HTTP error after {retry_count} attempts: {e}")
+                    logger.warning(f"✗ {endpoint} -> {response.status_code} (expected {expected_status_codes})")
+                    
+                    return TestResult(
+                        endpoint=endpoint,
+                        status=status,
+                        status_code=response.status_code,
+                        response_time_ms=response_time_ms,
+                        error_message=error_msg,
+                        retry_count=retry_count,
+                    )
+            
+            except httpx.TimeoutException as e:
+                retry_count += 1
+                last_error, last_error_status = str(e), TestStatus.TIMEOUT
                 
-                except Exception as e:
-                    retry_count += 1
-                    last_error = str(e)
-                    logger.error(f"✗ {endpoint} -> Unexpected error: {e}")
-                    break  # Don't retry on unexpected errors
-        
-        # All retries exhausted or unexpected error
+                if attempt < self.retry_policy.max_attempts - 1:
+                    delay = prev_delay = self._retry_delay(attempt, prev_delay)
+                    logger.warning(f"Request timeout (attempt {attempt + 1}), retrying in {delay:.1f}s...")
+                    await asyncio.sleep(delay)
+                else:
+                    logger.error(f"✗ {endpoint} -> Timeout after {retry_count} attempts")
+            
+            except httpx.HTTPError as e:
+                retry_count += 1
+                last_error, last_error_status = str(e), TestStatus.FAILURE
+                
+                if attempt < self.retry_policy.max_attempts - 1:
+                    delay = prev_delay = self._retry_delay(attempt, prev_delay)
+                    logger.warning(f"HTTP error (attempt {attempt + 1}), retrying in {delay:.1f}s...")
+                    await asyncio.sleep(delay)
+                else:
+                    logger.error(f"✗ {endpoint} -> HTTP error after {retry_count} attempts: {e}")
+            
+            except Exception as e:
+                retry_count += 1
+                last_error, last_error_status = str(e), TestStatus.FAILURE
+                logger.error(f"✗ {endpoint} -> Unexpected error: {e}")
+                break  # Don't retry on unexpected errors
+    
+        # All retries exhausted or unexpected error; the status follows the
+        # type of the last exception rather than its message
         return TestResult(
             endpoint=endpoint,
-            status=TestStatus.TIMEOUT if last_error and "timeout" in last_error.lower() else TestStatus.FAILURE,
+            status=last_error_status,
             error_message=last_error or "Request failed",
             retry_count=retry_count,
         )
@@ -319,37 +435,51 @@ class EndpointTester:
         """
         logger.info(f"Testing {len(endpoints)} endpoints (max {self.max_concurrent} concurrent)...")
         
-        # Filter endpoints if needed
+        # Split off authenticated endpoints in one pass if they are skipped
         endpoints_to_test = endpoints
+        skipped_results: List[TestResult] = []
         if skip_auth_endpoints:
-            endpoints_to_test = [e for e in endpoints if not e.requires_auth]
-            skipped_count = len(endpoints) - len(endpoints_to_test)
-            if skipped_count > 0:
-                logger.info(f"Skipping {skipped_count} authenticated endpoints")
-        
-        # Create test tasks
-        tasks = [
-            self.test_endpoint(endpoint, expected_status_codes, timeout_seconds)
-            for endpoint in endpoints_to_test
-        ]
-        
-        # Execute tests concurrently
-        results = await asyncio.gather(*tasks, return_exceptions=False)
-        
-        # Add skipped results
-        if skip_auth_endpoints:
+            endpoints_to_test = []
             for endpoint in endpoints:
                 if endpoint.requires_auth:
-                    results.append(TestResult(
+                    skipped_results.append(TestResult(
                         endpoint=endpoint,
                         status=TestStatus.SKIPPED,
-                        error_message="Authentication required (skipped)",
+                        error_message=_SKIPPED_AUTH_MESSAGE,
                     ))
+                else:
+                    endpoints_to_test.append(endpoint)
+            if skipped_results:
+                logger.info(f"Skipping {len(skipped_results)} authenticated endpoints")
+        
+        # Execute tests concurrently with a bounded pool of workers pulling from
+        # a shared iterator, so only max_concurrent tests are live at a time.
+        # Results are stored by position to keep the input order.
+        results: List[Optional[TestResult]] = [None] * len(endpoints_to_test)
+        pending = iter(enumerate(endpoints_to_test))
+        
+        async def worker() -> None:
+            for index, endpoint in pending:
+                results[index] = await self.test_endpoint(endpoint, expected_status_codes, timeout_seconds)
+        
+        worker_count = min(self.max_concurrent, len(endpoints_to_test))
+        if worker_count > 1 and self.warm_up_connections:
+            await self._warm_up(self._http_client or self._open_client())
+        await asyncio.gather(*(worker() for _ in range(worker_count)))
         
-        # Log summary
-        success_count = sum(1 for r in results if r.status == TestStatus.SUCCESS)
-        failure_count = sum(1 for r in results if r.status in [TestStatus.FAILURE, TestStatus.TIMEOUT, TestStatus.AUTH_ERROR, TestStatus.SERVER_ERROR])
-        skipped_count = sum(1 for r in results if r.status == TestStatus.SKIPPED)
+        # Add skipped results
+        results.extend(skipped_results)
+        
+        # Log summary (counted in a single pass)
+        success_count = failure_count = skipped_count = 0
+        for r in results:
+            status = r.status
+            if status is TestStatus.SUCCESS:
+                success_count += 1
+            elif status is TestStatus.SKIPPED:
+                skipped_count += 1
+            elif status in _FAILURE_STATUSES:
+                failure_count += 1
         
         logger.info(f"Test summary: {success_count} passed, {failure_count} failed, {skipped_count} skipped")
         
@@ -361,26 +491,53 @@ class EndpointTester:
         method: str,
         url: str,
         headers: Dict[str, str],
+        timeout: float,
     ) -> httpx.Response:
         """Make HTTP request with specified method"""
-        method_upper = method.upper()
-        
-        if method_upper == 'GET':
-            return await client.get(url, headers=headers)
-        elif method_upper == 'POST':
-            return await client.post(url, headers=headers, json={})
-        elif method_upper == 'PUT':
-            return await client.put(url, headers=headers, json={})
-        elif method_upper == 'DELETE':
-            return await client.delete(url, headers=headers)
-        elif method_upper == 'PATCH':
-            return await client.patch(url, headers=headers, json={})
-        elif method_upper == 'HEAD':
-            return await client.head(url, headers=headers)
-        elif method_upper == 'OPTIONS':
-            return await client.options(url, headers=headers)
-        else:
+        dispatch = self._METHOD_DISPATCH.get(method.upper())
+        if dispatch is None:
             raise ValueError(f"Unsupported HTTP method: {method}")
+        
+        attr, json_body = dispatch
+        send = getattr(client, attr)
+        if json_body is None:
+            return await send(url, headers=headers, timeout=timeout)
+        return await send(url, headers=headers, json=json_body, timeout=timeout)
+    
+    async def _warm_up(self, client: httpx.AsyncClient) -> None:
+        """
+        Open a pooled connection to base_url before concurrent tests fan out
+        
+        Without it, every worker starts on a cold pool and opens its own
+        connection at once. Any failure is ignored; the tests themselves
+        report connectivity problems.
+        """
+        try:
+            await client.head(self.base_url, timeout=min(self.WARM_UP_TIMEOUT_SECONDS, self.timeout_seconds))
+        except Exception as e:
+            logger.debug(f"Connection warm-up to {self.base_url} failed: {e}")
+    
+    def _retry_delay(self, attempt: int, prev_delay: float) -> float:
+        """
+        Delay before the next retry, using decorrelated jitter
+        
+        Each delay is drawn between the base delay and three times the previous
+        one, so endpoints failing together do not retry in lockstep. Policies
+        with jitter disabled keep their deterministic backoff.
+        
+        Args:
+            attempt: Attempt number that just failed (0-indexed)
+            prev_delay: Previous delay (base delay before the first retry)
+            
+        Returns:
+            Delay in seconds, capped at the policy's max delay
+        """
+        policy = self.retry_policy
+        if not policy.jitter:
+            return policy.get_delay(attempt)
+        
+        upper = max(policy.base_delay, prev_delay * 3)
+        return min(policy.max_delay, random.uniform(policy.base_delay, upper))
     
     def _classify_status_code(self, status_code: int) -> TestStatus:
         """Classify HTTP status code into test status"""
@@ -393,14 +550,16 @@ class EndpointTester:
     
     def get_failed_results(self, results: List[TestResult]) -> List[TestResult]:
         """Get all failed test results"""
-        return [
-            r for r in results
-            if r.status in [TestStatus.FAILURE, TestStatus.TIMEOUT, TestStatus.AUTH_ERROR, TestStatus.SERVER_ERROR]
-        ]
+        return [r for r in results if r.status in _FAILURE_STATUSES]
+    
+    def results_to_json(self, results: List[TestResult]) -> bytes:
+        """Serialize test results as one JSON array (same fields as to_dict)"""
+        return _json_bytes([r.to_dict() for r in results])
     
     def get_successful_results(self, results: List[TestResult]) -> List[TestResult]:
         """Get all successful test results"""
-        return [r for r in results if r.status == TestStatus.SUCCESS]
+        success = TestStatus.SUCCESS
+        return [r for r in results if r.status is success]
     
     def calculate_success_rate(self, results: List[TestResult]) -> float:
         """Calculate success rate (0.0 to 1.0)"""
@@ -412,5 +571,6 @@ class EndpointTester:
         if not testable_results:
             return 0.0
         
-        success_count = sum(1 for r in testable_results if r.status == TestStatus.SUCCESS)
+        success = TestStatus.SUCCESS
+        success_count = sum(1 for r in testable_results if r.status is success)
         return success_count / len(testable_results)
@@ -8,17 +8,30 @@ Part of User Story 3: Test Deployment and Endpoint Validation
 """
 
 import asyncio
+import inspect
 import logging
-import subprocess
+import re
+from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from specify_cli.validation.endpoint_tester import TestResult, TestStatus
 
+# pyahocorasick matches every deployment error keyword in a single pass
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Upper bound for one /speckit.bicep template fix run (5 minutes)
+TEMPLATE_FIX_TIMEOUT_SECONDS = 300
+
 
 class ErrorCategory(Enum):
     """Categories of validation errors"""
@@ -32,6 +45,73 @@ class ErrorCategory(Enum):
     UNKNOWN = "unknown"
 
 
+# Deployment error keywords per category, in priority order: the first
+# category with a keyword anywhere in the lowercased message wins
+_DEPLOYMENT_ERROR_KEYWORDS = (
+    # Template syntax or validation issues
+    (ErrorCategory.TEMPLATE_ISSUE, ('template', 'bicep', 'syntax', 'validation', 'schema')),
+    # Dependency issues
+    (ErrorCategory.DEPENDENCY_ISSUE, ('dependency', 'resource not found', 'does not exist')),
+    # Configuration issues
+    (ErrorCategory.CONFIGURATION_ISSUE, ('configuration', 'setting', 'parameter', 'invalid value')),
+    # Network issues
+    (ErrorCategory.NETWORK_ISSUE, ('network', 'timeout', 'connection', 'unreachable')),
+    # Authentication/authorization issues
+    (ErrorCategory.AUTH_ERROR, ('auth', 'permission', 'forbidden', 'unauthorized')),
+)
+
+# One compiled alternation per category, so each category is a single scan
+_DEPLOYMENT_ERROR_PATTERNS = tuple(
+    (category, re.compile('|'.join(map(re.escape, keywords))))
+    for category, keywords in _DEPLOYMENT_ERROR_KEYWORDS
+)
+
+
+def _build_deployment_error_automaton():
+    """Aho-Corasick automaton mapping each keyword to its category priority"""
+    automaton = ahocorasick.Automaton()
+    for priority, (_, keywords) in enumerate(_DEPLOYMENT_ERROR_KEYWORDS):
+        for keyword in keywords:
+            automaton.add_word(keyword, priority)
+    automaton.make_automaton()
+    return automaton
+
+
+_DEPLOYMENT_ERROR_AUTOMATON = _build_deployment_error_automaton() if AHOCORASICK_AVAILABLE else None
+
+
+@lru_cache(maxsize=1024)
+def _classify_deployment_error_cached(error_message: str) -> ErrorCategory:
+    """
+    Classify a deployment error message
+    
+    Pure function of the message, cached because deployments tend to repeat
+    the same diagnostic for many resources.
+    """
+    # Lowercased once for every matcher below. str.lower already has an
+    # ASCII fast path in CPython, which beats encoding and translating
+    # the message as bytes.
+    error_lower = error_message.lower()
+    
+    if _DEPLOYMENT_ERROR_AUTOMATON is not None:
+        # Single scan reporting every keyword hit; keep the highest priority
+        best = len(_DEPLOYMENT_ERROR_KEYWORDS)
+        for _, priority in _DEPLOYMENT_ERROR_AUTOMATON.iter(error_lower):
+            if priority < best:
+                best = priority
+                if priority == 0:
+                    break
+        if best < len(_DEPLOYMENT_ERROR_KEYWORDS):
+            return _DEPLOYMENT_ERROR_KEYWORDS[best][0]
+        return ErrorCategory.UNKNOWN
+    
+    for category, pattern in _DEPLOYMENT_ERROR_PATTERNS:
+        if pattern.search(error_lower):
+            return category
+    
+    return ErrorCategory.UNKNOWN
+
+
 class FixStrategy(Enum):
     """Fix strategies for different error categories"""
     RETRY = "retry"  # Simple retry with backoff
@@ -41,7 +121,35 @@ class FixStrategy(Enum):
     MANUAL_INTERVENTION = "manual_intervention"  # Cannot auto-fix
 
 
-@dataclass
+# Error category and message template for each failed endpoint test status
+_STATUS_CATEGORIES = {
+    TestStatus.TIMEOUT: (ErrorCategory.TIMEOUT, "Endpoint timeout: {method} {path}"),
+    TestStatus.AUTH_ERROR: (ErrorCategory.AUTH_ERROR, "Authentication error: {method} {path}"),
+    TestStatus.SERVER_ERROR: (ErrorCategory.SERVER_ERROR, "Server error ({status_code}): {method} {path}"),
+    TestStatus.FAILURE: (ErrorCategory.UNKNOWN, "Test failure: {method} {path} - {error}"),
+}
+
+# Fix strategy for each error category
+_STRATEGY_MAP = {
+    ErrorCategory.TIMEOUT: FixStrategy.RETRY,
+    ErrorCategory.AUTH_ERROR: FixStrategy.RECONFIGURE,
+    ErrorCategory.SERVER_ERROR: FixStrategy.UPDATE_TEMPLATE,
+    ErrorCategory.TEMPLATE_ISSUE: FixStrategy.UPDATE_TEMPLATE,
+    ErrorCategory.DEPENDENCY_ISSUE: FixStrategy.UPDATE_DEPENDENCIES,
+    ErrorCategory.CONFIGURATION_ISSUE: FixStrategy.RECONFIGURE,
+    ErrorCategory.NETWORK_ISSUE: FixStrategy.RETRY,
+    ErrorCategory.UNKNOWN: FixStrategy.MANUAL_INTERVENTION,
+}
+
+# FixOrchestrator coroutine (by name) that applies each automated strategy
+_STRATEGY_HANDLERS = {
+    FixStrategy.UPDATE_TEMPLATE: '_fix_template_issues',
+    FixStrategy.UPDATE_DEPENDENCIES: '_fix_dependency_issues',
+    FixStrategy.RECONFIGURE: '_fix_configuration_issues',
+}
+
+
+@dataclass(slots=True)
 class FixAttempt:
     """Record of a fix attempt"""
     
@@ -81,6 +189,10 @@ class FixOrchestrator:
         self.fix_attempts: List[FixAttempt] = []
         self.circuit_breaker_open = False
         
+        # (attempt list, attempts counted, successes among them) as of the
+        # last summary, so later summaries only count newly appended attempts
+        self._counted_attempts: Tuple[Optional[List[FixAttempt]], int, int] = (None, 0, 0)
+        
         logger.info(f"Initialized FixOrchestrator for: {self.project_root}")
         logger.info(f"Config: max_attempts={max_fix_attempts}, template_fixes={enable_template_fixes}")
     
@@ -134,104 +246,74 @@ class FixOrchestrator:
         Returns:
             Dictionary mapping error categories to error messages
         """
-        classifications: Dict[ErrorCategory, List[str]] = {}
+        classifications: Dict[ErrorCategory, List[str]] = defaultdict(list)
         
-        # Classify endpoint test failures
+        # Classify endpoint test failures (successful and skipped tests have no entry)
+        status_categories = _STATUS_CATEGORIES
         for result in test_results:
-            if result.status == TestStatus.TIMEOUT:
-                category = ErrorCategory.TIMEOUT
-                message = f"Endpoint timeout: {result.endpoint.method} {result.endpoint.path}"
-                classifications.setdefault(category, []).append(message)
-            
-            elif result.status == TestStatus.AUTH_ERROR:
-                category = ErrorCategory.AUTH_ERROR
-                message = f"Authentication error: {result.endpoint.method} {result.endpoint.path}"
-                classifications.setdefault(category, []).append(message)
+            entry = status_categories.get(result.status)
+            if entry is None:
+                continue
             
-            elif result.status == TestStatus.SERVER_ERROR:
-                category = ErrorCategory.SERVER_ERROR
-                message = f"Server error ({result.status_code}): {result.endpoint.method} {result.endpoint.path}"
-                classifications.setdefault(category, []).append(message)
-            
-            elif result.status == TestStatus.FAILURE:
-                category = ErrorCategory.UNKNOWN
-                message = f"Test failure: {result.endpoint.method} {result.endpoint.path} - {result.error_message}"
-                classifications.setdefault(category, []).append(message)
+            category, template = entry
+            endpoint = result.endpoint
+            classifications[category].append(template.format(
+                method=endpoint.method,
+                path=endpoint.path,
+                status_code=result.status_code,
+                error=result.error_message,
+            ))
         
         # Classify deployment errors
         if deployment_errors:
             for error in deployment_errors:
-                category = self._classify_deployment_error(error)
-                classifications.setdefault(category, []).append(error)
+                classifications[self._classify_deployment_error(error)].append(error)
         
         # Log classifications
         for category, messages in classifications.items():
             logger.info(f"Found {len(messages)} {category.value} error(s)")
         
-        return classifications
+        return dict(classifications)
     
     def _classify_deployment_error(self, error_message: str) -> ErrorCategory:
         """Classify a deployment error message"""
-        error_lower = error_message.lower()
-        
-        # Template syntax or validation issues
-        if any(keyword in error_lower for keyword in ['template', 'bicep', 'syntax', 'validation', 'schema']):
-            return ErrorCategory.TEMPLATE_ISSUE
-        
-        # Dependency issues
-        if any(keyword in error_lower for keyword in ['dependency', 'resource not found', 'does not exist']):
-            return ErrorCategory.DEPENDENCY_ISSUE
-        
-        # Configuration issues
-        if any(keyword in error_lower for keyword in ['configuration', 'setting', 'parameter', 'invalid value']):
-            return ErrorCategory.CONFIGURATION_ISSUE
-        
-        # Network issues
-        if any(keyword in error_lower for keyword in ['network', 'timeout', 'connection', 'unreachable']):
-            return ErrorCategory.NETWORK_ISSUE
-        
-        # Authentication/authorization issues
-        if any(keyword in error_lower for keyword in ['auth', 'permission', 'forbidden', 'unauthorized']):
-            return ErrorCategory.AUTH_ERROR
-        
-        return ErrorCategory.UNKNOWN
+        return _classify_deployment_error_cached(error_message)
     
     async def _dispatch_fixes(self, error_classifications: Dict[ErrorCategory, List[str]]) -> bool:
         """
         Dispatch appropriate fix strategies based on error categories
         
+        Categories are fixed concurrently. Categories that share a strategy
+        (e.g., server and template errors both update the template) take turns,
+        so the same fix never runs twice at once. Fix attempts are recorded in
+        category order.
+        
         Returns:
             True if all fixes succeeded, False otherwise
         """
+        plan = [
+            (category, self._select_fix_strategy(category), messages)
+            for category, messages in error_classifications.items()
+        ]
+        strategy_locks = {strategy: asyncio.Lock() for _, strategy, _ in plan}
+        
+        async def run_fix(category: ErrorCategory, strategy: FixStrategy, messages: List[str]) -> bool:
+            async with strategy_locks[strategy]:
+                return await self._apply_fix_strategy(category, strategy, messages)
+        
+        outcomes = await asyncio.gather(
+            *(run_fix(category, strategy, messages) for category, strategy, messages in plan),
+            return_exceptions=True,
+        )
+        
         all_fixes_successful = True
         
-        for category, messages in error_classifications.items():
-            strategy = self._select_fix_strategy(category)
-            
-            logger.info(f"Applying fix strategy: {strategy.value} for {category.value}")
-            
-            # Execute fix strategy
-            if strategy == FixStrategy.UPDATE_TEMPLATE:
-                success = await self._fix_template_issues(messages)
-            
-            elif strategy == FixStrategy.UPDATE_DEPENDENCIES:
-                success = await self._fix_dependency_issues(messages)
-            
-            elif strategy == FixStrategy.RECONFIGURE:
-                success = await self._fix_configuration_issues(messages)
-            
-            elif strategy == FixStrategy.RETRY:
-                # Retry is handled by the caller (validation session)
-                success = True
-                logger.info("Will retry after other fixes are applied")
-            
-            elif strategy == FixStrategy.MANUAL_INTERVENTION:
+        for (category, strategy, messages), outcome in zip(plan, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"Error applying {strategy.value} for {category.value}: {outcome}")
                 success = False
-                logger.warning(f"Manual intervention required for {category.value}")
-            
             else:
-                success = False
-                logger.warning(f"No fix strategy for {category.value}")
+                success = outcome
             
             # Record fix attempt
             fix_attempt = FixAttempt(
@@ -248,20 +330,48 @@ class FixOrchestrator:
         
         return all_fixes_successful
     
+    async def _apply_fix_strategy(
+        self,
+        category: ErrorCategory,
+        strategy: FixStrategy,
+        messages: List[str],
+    ) -> bool:
+        """
+        Execute one fix strategy for the errors of a category
+        
+        Strategy handlers may be coroutines or plain functions returning bool.
+        
+        Returns:
+            True if the fix succeeded, False otherwise
+        """
+        logger.info(f"Applying fix strategy: {strategy.value} for {category.value}")
+        
+        # Execute fix strategy (handlers are looked up by name on the instance).
+        # Handlers that do no I/O are plain functions; only awaitables are awaited.
+        handler = _STRATEGY_HANDLERS.get(strategy)
+        if handler is not None:
+            success = getattr(self, handler)(messages)
+            if inspect.isawaitable(success):
+                success = await success
+        
+        elif strategy == FixStrategy.RETRY:
+            # Retry is handled by the caller (validation session)
+            success = True
+            logger.info("Will retry after other fixes are applied")
+        
+        elif strategy == FixStrategy.MANUAL_INTERVENTION:
+            success = False
+            logger.warning(f"Manual intervention required for {category.value}")
+        
+        else:
+            success = False
+            logger.warning(f"No fix strategy for {category.value}")
+        
+        return success
+    
     def _select_fix_strategy(self, category: ErrorCategory) -> FixStrategy:
         """Select appropriate fix strategy for an error category"""
-        strategy_map = {
-            ErrorCategory.TIMEOUT: FixStrategy.RETRY,
-            ErrorCategory.AUTH_ERROR: FixStrategy.RECONFIGURE,
-            ErrorCategory.SERVER_ERROR: FixStrategy.UPDATE_TEMPLATE,
-            ErrorCategory.TEMPLATE_ISSUE: FixStrategy.UPDATE_TEMPLATE,
-            ErrorCategory.DEPENDENCY_ISSUE: FixStrategy.UPDATE_DEPENDENCIES,
-            ErrorCategory.CONFIGURATION_ISSUE: FixStrategy.RECONFIGURE,
-            ErrorCategory.NETWORK_ISSUE: FixStrategy.RETRY,
-            ErrorCategory.UNKNOWN: FixStrategy.MANUAL_INTERVENTION,
-        }
-        
-        return strategy_map.get(category, FixStrategy.MANUAL_INTERVENTION)
+        return _STRATEGY_MAP.get(category, FixStrategy.MANUAL_INTERVENTION)
     
     async def _fix_template_issues(self, error_messages: List[str]) -> bool:
         """
@@ -309,32 +419,39 @@ class FixOrchestrator:
         logger.info(f"Calling /speckit.bicep with issue: {issue_description}")
         
         try:
-            # Call the speckit.bicep command via subprocess
+            # Call the speckit.bicep command via an async subprocess, so the
+            # event loop keeps running other fixes while it works
             # In production, this would be integrated with the agent command system
             # For now, we'll simulate the call
             
             # TODO: Integrate with actual /speckit.bicep command
             # For Phase 5 implementation, we'll create a placeholder
             
-            result = subprocess.run(
-                ["specify", "bicep", "--issue", issue_description],
+            process = await asyncio.create_subprocess_exec(
+                "specify", "bicep", "--issue", issue_description,
                 cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                timeout=300,  # 5 minute timeout
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
             
-            if result.returncode == 0:
+            try:
+                _, stderr = await asyncio.wait_for(
+                    process.communicate(),
+                    timeout=TEMPLATE_FIX_TIMEOUT_SECONDS,
+                )
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                logger.error("Template fix command timed out")
+                return False
+            
+            if process.returncode == 0:
                 logger.info("Template fix command completed successfully")
                 return True
             else:
-                logger.error(f"Template fix command failed: {result.stderr}")
+                logger.error(f"Template fix command failed: {stderr.decode(errors='replace')}")
                 return False
         
-        except subprocess.TimeoutExpired:
-            logger.error("Template fix command timed out")
-            return False
-        
         except FileNotFoundError:
             logger.warning("specify CLI not found, simulating template fix")
             # In test/dev environment, simulate success
@@ -344,7 +461,7 @@ class FixOrchestrator:
             logger.error(f"Error calling template fix: {e}")
             return False
     
-    async def _fix_dependency_issues(self, error_messages: List[str]) -> bool:
+    def _fix_dependency_issues(self, error_messages: List[str]) -> bool:
         """
         Fix dependency issues (placeholder for future implementation)
         
@@ -358,7 +475,7 @@ class FixOrchestrator:
         # TODO: Implement dependency resolution (e.g., ensure resources exist in correct order)
         return False
     
-    async def _fix_configuration_issues(self, error_messages: List[str]) -> bool:
+    def _fix_configuration_issues(self, error_messages: List[str]) -> bool:
         """
         Fix configuration issues (placeholder for future implementation)
         
@@ -378,12 +495,38 @@ class FixOrchestrator:
         self.fix_attempts = []
         logger.info("Circuit breaker reset")
     
+    def _fix_counts(self) -> Tuple[int, int]:
+        """
+        Count total and successful fix attempts
+        
+        fix_attempts is a plain list that callers may append to directly, so
+        counts are kept per list object and only the attempts appended since
+        the last call are scanned. A replaced or shortened list is recounted.
+        
+        Returns:
+            (total attempts, successful attempts)
+        """
+        attempts = self.fix_attempts
+        total = len(attempts)
+        counted_list, counted, successful = self._counted_attempts
+        if counted_list is not attempts or counted > total:
+            counted = successful = 0
+        
+        for i in range(counted, total):
+            if attempts[i].success:
+                successful += 1
+        
+        self._counted_attempts = (attempts, total, successful)
+        return total, successful
+    
     def get_fix_summary(self) -> Dict:
         """Get summary of all fix attempts"""
+        total, successful = self._fix_counts()
+        
         return {
-            "total_attempts": len(self.fix_attempts),
-            "successful_fixes": sum(1 for a in self.fix_attempts if a.success),
-            "failed_fixes": sum(1 for a in self.fix_attempts if not a.success),
+            "total_attempts": total,
+            "successful_fixes": successful,
+            "failed_fixes": total - successful,
             "circuit_breaker_open": self.circuit_breaker_open,
             "attempts": [
                 {
@@ -5,13 +5,176 @@ Validates project paths, Azure resource names, subscription IDs,
 and other user inputs to prevent errors and security issues.
 """
 
+import os
 import re
+import stat
 import logging
 from pathlib import Path
 from typing import Optional, List
 
 logger = logging.getLogger(__name__)
 
+# Azure naming conventions
+# https://learn.microsoft.com/en-us/azure/azure-resource-manager/management/resource-name-rules
+_RESOURCE_GROUP_RE = re.compile(r'^[\w\-\.\(\)]{1,90}$')
+_SUBSCRIPTION_ID_RE = re.compile(r'^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$')
+_KEYVAULT_URL_RE = re.compile(r'^https://[a-zA-Z0-9\-]{3,24}\.vault\.azure\.net/?$')
+_ENVIRONMENT_NAME_RE = re.compile(r'^[a-zA-Z0-9\-_]{1,50}$')
+
+# Bound match methods used by the validators (one global lookup per call)
+_RESOURCE_GROUP_MATCH = _RESOURCE_GROUP_RE.match
+_SUBSCRIPTION_ID_MATCH = _SUBSCRIPTION_ID_RE.match
+_KEYVAULT_URL_MATCH = _KEYVAULT_URL_RE.match
+_ENVIRONMENT_NAME_MATCH = _ENVIRONMENT_NAME_RE.match
+
+# Guardrails for user-supplied endpoint filter patterns: a length cap, and a
+# check for groups repeated by an unbounded quantifier whose body can match
+# the same text in more than one way, e.g. (.+)+, (\w+\s?)+, (x+x+)+ or
+# (a|aa)+, which backtrack exponentially on non-matching paths (ReDoS).
+# Groups where every repetition starts with a delimiter the rest of the body
+# can't consume, like (/\w+)+ or (\.\w+)*, are fine.
+MAX_REGEX_PATTERN_LENGTH = 1024
+_QUANTIFIER_RE = re.compile(r'[*+?]|\{(\d*)(,?)(\d*)\}')
+
+
+class _RegexToken:
+    """One atom of a scanned pattern: a literal, escape, class, '.', or group"""
+    __slots__ = ("text", "literal", "quantified", "group")
+    
+    def __init__(self, text: str, literal: Optional[str] = None, group: "Optional[_RegexGroup]" = None):
+        self.text = text
+        self.literal = literal  # The character matched, for plain literals
+        self.quantified = False
+        self.group = group
+
+
+class _RegexGroup:
+    """A group being scanned: its alternation branches and unbounded atoms"""
+    __slots__ = ("start", "branches", "unbounded")
+    
+    def __init__(self, start: int):
+        self.start = start
+        self.branches: List[List[_RegexToken]] = [[]]
+        self.unbounded: List[str] = []  # Texts of atoms repeated without bound
+    
+    def is_ambiguous(self) -> bool:
+        """True if repeating this group can split the same text several ways"""
+        if len(self.branches) == 1 and not self.unbounded:
+            return False
+        
+        # Every branch must open with a distinct, unquantified literal that no
+        # unbounded atom in the body can also consume
+        delimiters = []
+        for branch in self.branches:
+            if not branch or branch[0].literal is None or branch[0].quantified:
+                return True
+            delimiters.append(branch[0].literal)
+        if len(set(delimiters)) != len(delimiters):
+            return True
+        
+        for atom in self.unbounded:
+            for delimiter in delimiters:
+                try:
+                    if re.fullmatch(atom, delimiter):
+                        return True
+                except re.error:
+                    return True
+        return False
+
+
+def _has_nested_quantifier(pattern: str) -> bool:
+    """
+    Check a compilable regex for an ambiguous group repeated without bound
+    
+    Args:
+        pattern: Regex pattern that re.compile accepts
+        
+    Returns:
+        True if matching can backtrack exponentially
+    """
+    stack = [_RegexGroup(0)]
+    last: Optional[_RegexToken] = None
+    i, n = 0, len(pattern)
+    
+    while i < n:
+        char = pattern[i]
+        quantifier = _QUANTIFIER_RE.match(pattern, i) if last is not None else None
+        
+        if quantifier:
+            i = quantifier.end()
+            # Lazy and possessive suffixes don't change the repetition count
+            if i < n and pattern[i] in "?+":
+                i += 1
+            _, comma, high = quantifier.groups()
+            unbounded = quantifier.group() in "*+" or (comma and not high)
+            last.quantified = True
+            if unbounded:
+                if last.group is not None and last.group.is_ambiguous():
+                    return True
+                stack[-1].unbounded.append(last.text)
+            last = None
+            continue
+        
+        start = i
+        if char == "\\":
+            i += 2
+            escaped = pattern[start + 1:i]
+            last = _RegexToken(pattern[start:i], None if escaped.isalnum() else escaped)
+        elif char == "[":
+            # Skip a leading ']' or '^]', then scan to the closing bracket
+            i += 1
+            if pattern.startswith("^", i):
+                i += 1
+            if pattern.startswith("]", i):
+                i += 1
+            while pattern[i] != "]":
+                i += 2 if pattern[i] == "\\" else 1
+            i += 1
+            last = _RegexToken(pattern[start:i])
+        elif char == "(":
+            i += 1
+            if pattern.startswith("?", i):
+                # Skip the extension prefix: ?:, ?P<name>, ?=, ?<!, inline flags...
+                if pattern.startswith("?(", i):
+                    # Conditional: the (id) that follows scans as a group
+                    i += 1
+                elif pattern.startswith("?P<", i) or pattern.startswith("?<", i) and pattern[i + 2] not in "=!":
+                    i = pattern.index(">", i) + 1
+                else:
+                    i += 1
+                    while pattern[i] not in ":)=!" and not pattern.startswith("<=", i) and not pattern.startswith("<!", i):
+                        i += 1
+                    i += 2 if pattern[i] == "<" else 1
+                    if pattern[i - 1] == ")":
+                        # Inline flags like (?i) match nothing
+                        last = None
+                        continue
+            stack.append(_RegexGroup(start))
+            last = None
+            continue
+        elif char == ")":
+            i += 1
+            group = stack.pop()
+            stack[-1].unbounded.extend(group.unbounded)
+            last = _RegexToken(pattern[group.start:i], group=group)
+        elif char == "|":
+            i += 1
+            stack[-1].branches.append([])
+            last = None
+            continue
+        else:
+            i += 1
+            last = _RegexToken(char, None if char in ".^$" else char)
+        
+        stack[-1].branches[-1].append(last)
+    
+    return False
+
+
+# HTTP methods accepted by --methods
+_VALID_HTTP_METHODS = frozenset({"GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"})
+_SORTED_VALID_HTTP_METHODS = ", ".join(sorted(_VALID_HTTP_METHODS))
+
 
 class ValidationError(Exception):
     """Raised when input validation fails"""
@@ -21,12 +184,11 @@ class ValidationError(Exception):
 class InputValidator:
     """Validates user inputs for the validate command"""
     
-    # Azure naming conventions
-    # https://learn.microsoft.com/en-us/azure/azure-resource-manager/management/resource-name-rules
-    RESOURCE_GROUP_PATTERN = re.compile(r'^[\w\-\.\(\)]{1,90}$')
-    SUBSCRIPTION_ID_PATTERN = re.compile(r'^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$')
-    KEYVAULT_URL_PATTERN = re.compile(r'^https://[a-zA-Z0-9\-]{3,24}\.vault\.azure\.net/?$')
-    ENVIRONMENT_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9\-_]{1,50}$')
+    # Azure naming conventions (aliases of the module-level patterns)
+    RESOURCE_GROUP_PATTERN = _RESOURCE_GROUP_RE
+    SUBSCRIPTION_ID_PATTERN = _SUBSCRIPTION_ID_RE
+    KEYVAULT_URL_PATTERN = _KEYVAULT_URL_RE
+    ENVIRONMENT_NAME_PATTERN = _ENVIRONMENT_NAME_RE
     
     @staticmethod
     def validate_project_path(path: Path) -> Path:
@@ -45,14 +207,17 @@ class InputValidator:
         try:
             resolved = path.resolve()
             
-            if not resolved.exists():
+            # One stat call answers both the existence and directory checks
+            try:
+                mode = resolved.stat().st_mode
+            except (FileNotFoundError, NotADirectoryError):
                 raise ValidationError(f"Project path does not exist: {path}")
             
-            if not resolved.is_dir():
+            if not stat.S_ISDIR(mode):
                 raise ValidationError(f"Project path is not a directory: {path}")
             
-            # Check read access
-            if not resolved.stat().st_mode & 0o444:
+            # Check read access for this process (honours ownership and ACLs)
+            if not os.access(resolved, os.R_OK):
                 raise ValidationError(f"Project path is not readable: {path}")
             
             logger.debug(f"Validated project path: {resolved}")
@@ -83,7 +248,7 @@ class InputValidator:
         if len(name) > 90:
             raise ValidationError(f"Resource group name too long (max 90 chars): {name}")
         
-        if not InputValidator.RESOURCE_GROUP_PATTERN.match(name):
+        if not _RESOURCE_GROUP_MATCH(name):
             raise ValidationError(
                 f"Invalid resource group name: {name}\n"
                 "Must contain only alphanumerics, underscores, parentheses, hyphens, periods"
@@ -113,7 +278,8 @@ class InputValidator:
         if not subscription_id:
             raise ValidationError("Subscription ID cannot be empty")
         
-        if not InputValidator.SUBSCRIPTION_ID_PATTERN.match(subscription_id):
+        # A GUID is always 36 characters; reject anything else before the regex
+        if len(subscription_id) != 36 or not _SUBSCRIPTION_ID_MATCH(subscription_id):
             raise ValidationError(
                 f"Invalid subscription ID format: {subscription_id}\n"
                 "Expected GUID format: xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx"
@@ -139,7 +305,7 @@ class InputValidator:
         if not url:
             return None
         
-        if not InputValidator.KEYVAULT_URL_PATTERN.match(url):
+        if not _KEYVAULT_URL_MATCH(url):
             raise ValidationError(
                 f"Invalid Key Vault URL: {url}\n"
                 "Expected format: https://<vault-name>.vault.azure.net/"
@@ -168,7 +334,7 @@ class InputValidator:
         if len(name) > 50:
             raise ValidationError(f"Environment name too long (max 50 chars): {name}")
         
-        if not InputValidator.ENVIRONMENT_NAME_PATTERN.match(name):
+        if not _ENVIRONMENT_NAME_MATCH(name):
             raise ValidationError(
                 f"Invalid environment name: {name}\n"
                 "Must contain only alphanumerics, hyphens, underscores"
@@ -194,15 +360,15 @@ class InputValidator:
         if not methods_str:
             return None
         
-        valid_methods = {"GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"}
-        
-        methods = [m.strip().upper() for m in methods_str.split(',')]
+        # Uppercase the whole string once; only surrounding whitespace is
+        # dropped, so "G ET" and empty entries are still rejected
+        methods = [m.strip() for m in methods_str.upper().split(',')]
         
-        invalid_methods = [m for m in methods if m not in valid_methods]
+        invalid_methods = [m for m in methods if m not in _VALID_HTTP_METHODS]
         if invalid_methods:
             raise ValidationError(
                 f"Invalid HTTP methods: {', '.join(invalid_methods)}\n"
-                f"Valid methods: {', '.join(sorted(valid_methods))}"
+                f"Valid methods: {_SORTED_VALID_HTTP_METHODS}"
             )
         
         logger.debug(f"Validated HTTP methods: {methods}")
@@ -225,13 +391,20 @@ class InputValidator:
         if not codes_str:
             return None
         
+        # Parse and range-check (100-599 per HTTP spec) in one pass; int()
+        # ignores surrounding whitespace
+        codes = []
+        invalid_codes = []
         try:
-            codes = [int(c.strip()) for c in codes_str.split(',')]
+            for part in codes_str.split(','):
+                code = int(part)
+                if 100 <= code <= 599:
+                    codes.append(code)
+                else:
+                    invalid_codes.append(code)
         except ValueError as e:
             raise ValidationError(f"Invalid status code format: {codes_str}") from e
         
-        # Validate range (100-599 per HTTP spec)
-        invalid_codes = [c for c in codes if c < 100 or c > 599]
         if invalid_codes:
             raise ValidationError(
                 f"Status codes out of range (100-599): {', '.join(map(str, invalid_codes))}"
@@ -283,11 +456,23 @@ class InputValidator:
         if not pattern:
             return None
         
+        if len(pattern) > MAX_REGEX_PATTERN_LENGTH:
+            raise ValidationError(
+                f"Regex pattern too long (max {MAX_REGEX_PATTERN_LENGTH} chars): {pattern[:50]}..."
+            )
+        
         try:
             re.compile(pattern)
         except re.error as e:
             raise ValidationError(f"Invalid regex pattern: {pattern} - {e}") from e
         
+        # Checked after compiling, so the scan only sees well-formed patterns
+        if _has_nested_quantifier(pattern):
+            raise ValidationError(
+                f"Regex pattern has nested unbounded quantifiers: {pattern}\n"
+                "Patterns like (.+)+ can take exponential time to match"
+            )
+        
         logger.debug(f"Validated regex pattern: {pattern}")
         return pattern
     
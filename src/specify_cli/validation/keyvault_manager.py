@@ -7,14 +7,19 @@ Managed Identity authentication and RBAC.
 
 import logging
 import re
-from typing import List, Dict, Optional
+import string
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from urllib.parse import urlparse
+from typing import Awaitable, Callable, List, Dict, Optional, Tuple, TypeVar
 import asyncio
 
 from azure.identity.aio import DefaultAzureCredential
 
 try:
     from azure.keyvault.secrets.aio import SecretClient
-    from azure.core.exceptions import ResourceNotFoundError, AzureError
+    from azure.core.exceptions import ResourceNotFoundError, AzureError, HttpResponseError
     AZURE_KEYVAULT_AVAILABLE = True
 except ImportError:
     AZURE_KEYVAULT_AVAILABLE = False
@@ -23,13 +28,96 @@ except ImportError:
         pass
     class AzureError(Exception):
         pass
+    class HttpResponseError(AzureError):
+        status_code = None
+        response = None
     class SecretClient:
         pass
 
 from specify_cli.validation import KeyVaultError, AppSetting
+from specify_cli.utils.retry_policies import ExponentialBackoff
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
+# Key Vault secret names allow lowercase alphanumerics and hyphens only.
+# Lowercases ASCII, expands ':' to '--' (ASP.NET convention), maps '_' to
+# '-' and drops every other invalid ASCII character in one str.translate.
+_SECRET_NAME_TABLE = str.maketrans({
+    **{chr(c): None for c in range(128)},
+    **{c: c for c in string.ascii_lowercase + string.digits + "-"},
+    **{c: c.lower() for c in string.ascii_uppercase},
+    ":": "--",
+    "_": "-",
+})
+_INVALID_SECRET_CHARS = re.compile(r'[^a-z0-9-]')
+
+# Throttled (429) and temporarily unavailable (503) responses are transient;
+# everything else is surfaced to the caller immediately
+_RETRYABLE_STATUS_CODES = frozenset({429, 503})
+
+
+@dataclass(slots=True)
+class _PooledClient:
+    """A SecretClient and its credential shared by managers of one vault"""
+    client: SecretClient
+    credential: DefaultAzureCredential
+    references: int = 0
+    # Token request started at construction so the credential chain is
+    # probed while the first batch is being prepared
+    warm_up: Optional[asyncio.Task] = None
+
+
+# vault URL -> shared client. Managers for the same vault reuse one HTTP
+# connection pool and one credential chain; the last one to close shuts
+# them down.
+_CLIENT_POOL: Dict[str, _PooledClient] = {}
+
+
+@lru_cache(maxsize=2048)
+def _format_secret_name_cached(name: str) -> str:
+    """
+    Format a secret name for Key Vault, memoized by input name.
+    
+    store_app_settings formats every secure setting twice (once to store it,
+    once to build its reference), so repeated names are served from here.
+    """
+    formatted = name.translate(_SECRET_NAME_TABLE)
+    
+    if not formatted.isascii():
+        # Non-ASCII characters may lowercase to valid ones (e.g. 'İ')
+        formatted = _INVALID_SECRET_CHARS.sub('', formatted.lower())
+    
+    # Enforce max 127 characters, then remove leading/trailing hyphens
+    return formatted[:127].strip("-")
+
+
+def _token_scope(vault_url: str) -> str:
+    """Return the Key Vault token scope for a vault URL's cloud."""
+    # https://<vault>.vault.azure.net/ -> https://vault.azure.net/.default
+    host = urlparse(vault_url).hostname or ""
+    suffix = host.partition(".")[2] or "vault.azure.net"
+    return f"https://{suffix}/.default"
+
+
+def _log_warm_up_failure(task: asyncio.Task) -> None:
+    """Retrieve a failed warm-up's exception; the first real call reports it."""
+    if not task.cancelled() and task.exception() is not None:
+        logger.debug(f"Credential warm-up failed: {task.exception()}")
+
+
+def _retry_after_seconds(error: HttpResponseError) -> Optional[float]:
+    """Return the server's Retry-After hint in seconds, if it sent one."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
 
 class KeyVaultManager:
     """
@@ -42,12 +130,30 @@ class KeyVaultManager:
     - Key Vault reference generation for App Service
     """
     
-    def __init__(self, vault_url: str):
+    # Upper bound on in-flight set_secret calls, kept under the per-vault
+    # write throttling limit so large batches don't turn into 429 storms
+    MAX_PARALLEL_WRITES = 8
+    
+    # store_multiple_secrets creates coroutines for this many secrets at a time
+    STORE_BATCH_SIZE = 50
+    
+    # How long a value read by get_secret is served from memory
+    SECRET_CACHE_TTL_SECONDS = 60.0
+    
+    def __init__(
+        self,
+        vault_url: str,
+        max_parallel_writes: Optional[int] = None,
+        retry_policy: Optional[ExponentialBackoff] = None,
+    ):
         """
         Initialize Key Vault manager.
         
         Args:
             vault_url: Azure Key Vault URL (https://<vault-name>.vault.azure.net/)
+            max_parallel_writes: Maximum concurrent secret writes
+                (defaults to MAX_PARALLEL_WRITES)
+            retry_policy: Backoff policy for throttled requests (default: 5 attempts)
         
         Raises:
             ImportError: If azure-keyvault-secrets is not installed
@@ -59,11 +165,91 @@ class KeyVaultManager:
             )
         
         self.vault_url = vault_url
-        self.credential = DefaultAzureCredential()
-        self.client = SecretClient(vault_url=vault_url, credential=self.credential)
+        
+        pooled = _CLIENT_POOL.get(vault_url)
+        if pooled is None:
+            credential = DefaultAzureCredential()
+            pooled = _CLIENT_POOL[vault_url] = _PooledClient(
+                client=SecretClient(vault_url=vault_url, credential=credential),
+                credential=credential,
+            )
+        pooled.references += 1
+        if pooled.warm_up is None:
+            pooled.warm_up = self._start_credential_warm_up(pooled.credential)
+        self._pooled: Optional[_PooledClient] = pooled
+        self.credential = pooled.credential
+        self.client = pooled.client
+        self._vault_name = self._extract_vault_name()
+        self._write_semaphore = asyncio.Semaphore(
+            max_parallel_writes or self.MAX_PARALLEL_WRITES
+        )
+        self.retry_policy = retry_policy or ExponentialBackoff(
+            base_delay=0.5, max_delay=30.0, max_attempts=5
+        )
+        
+        # formatted name -> (monotonic fetch time, value); one lock per name
+        # so concurrent readers of the same secret share a single round trip
+        self._secret_cache: Dict[str, Tuple[float, str]] = {}
+        self._secret_locks: Dict[str, asyncio.Lock] = {}
         
         logger.info(f"Initialized KeyVaultManager for: {vault_url}")
     
+    def _start_credential_warm_up(
+        self,
+        credential: DefaultAzureCredential
+    ) -> Optional[asyncio.Task]:
+        """
+        Start acquiring a Key Vault token in the background.
+        
+        Only possible when constructed inside a running event loop;
+        otherwise the token is acquired by the first request as before.
+        
+        Args:
+            credential: Credential to warm up
+            
+        Returns:
+            The warm-up task, or None if no event loop is running
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+        
+        task = loop.create_task(credential.get_token(_token_scope(self.vault_url)))
+        task.add_done_callback(_log_warm_up_failure)
+        return task
+    
+    async def _with_retry(self, operation: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run a Key Vault call, retrying throttled (429/503) responses.
+        
+        Waits for the server's Retry-After hint when present, otherwise for
+        the retry policy's exponential delay with jitter. Other errors, and
+        the last throttled error once attempts run out, propagate unchanged.
+        
+        Args:
+            operation: Zero-argument callable returning a fresh awaitable
+            
+        Returns:
+            Result of the first successful call
+        """
+        max_attempts = self.retry_policy.max_attempts
+        for attempt in range(max_attempts):
+            try:
+                return await operation()
+            except HttpResponseError as e:
+                if e.status_code not in _RETRYABLE_STATUS_CODES or attempt == max_attempts - 1:
+                    raise
+                delay = _retry_after_seconds(e)
+                if delay is None:
+                    delay = self.retry_policy.get_delay(attempt)
+                logger.warning(
+                    f"Key Vault returned {e.status_code} (attempt {attempt + 1}), "
+                    f"retrying in {delay:.1f}s..."
+                )
+                await asyncio.sleep(delay)
+        raise RuntimeError("retry_policy.max_attempts must be at least 1")
+    
     async def store_secret(
         self,
         secret_name: str,
@@ -90,11 +276,17 @@ class KeyVaultManager:
         try:
             logger.debug(f"Storing secret: {formatted_name}")
             
-            secret = await self.client.set_secret(
-                name=formatted_name,
-                value=secret_value,
-                tags=tags or {}
-            )
+            async def set_secret():
+                # The write slot is released while backing off between attempts
+                async with self._write_semaphore:
+                    return await self.client.set_secret(
+                        name=formatted_name,
+                        value=secret_value,
+                        tags=tags or {}
+                    )
+            
+            secret = await self._with_retry(set_secret)
+            self._secret_cache.pop(formatted_name, None)
             
             logger.info(f"Secret stored: {formatted_name}")
             return secret.id
@@ -117,16 +309,42 @@ class KeyVaultManager:
         """
         formatted_name = self._format_secret_name(secret_name)
         
-        try:
-            secret = await self.client.get_secret(formatted_name)
-            return secret.value
+        cached = self._cached_secret(formatted_name)
+        if cached is not None:
+            return cached
+        
+        lock = self._secret_locks.setdefault(formatted_name, asyncio.Lock())
+        async with lock:
+            # Another reader may have fetched it while we waited for the lock
+            cached = self._cached_secret(formatted_name)
+            if cached is not None:
+                return cached
             
-        except ResourceNotFoundError:
-            logger.warning(f"Secret not found: {formatted_name}")
-            return None
+            try:
+                secret = await self._with_retry(
+                    lambda: self.client.get_secret(formatted_name)
+                )
+                
+            except ResourceNotFoundError:
+                logger.warning(f"Secret not found: {formatted_name}")
+                return None
+                
+            except AzureError as e:
+                raise KeyVaultError(f"Failed to get secret {formatted_name}: {e}")
             
-        except AzureError as e:
-            raise KeyVaultError(f"Failed to get secret {formatted_name}: {e}")
+            if secret.value is not None:
+                self._secret_cache[formatted_name] = (time.monotonic(), secret.value)
+            return secret.value
+    
+    def _cached_secret(self, formatted_name: str) -> Optional[str]:
+        """Return a cached secret value if it is still within the TTL."""
+        hit = self._secret_cache.get(formatted_name)
+        if hit is None:
+            return None
+        if time.monotonic() - hit[0] < self.SECRET_CACHE_TTL_SECONDS:
+            return hit[1]
+        del self._secret_cache[formatted_name]
+        return None
     
     async def store_multiple_secrets(
         self,
@@ -136,6 +354,11 @@ class KeyVaultManager:
         """
         Store multiple secrets in parallel.
         
+        Secrets are submitted in batches of STORE_BATCH_SIZE so at most one
+        batch of coroutines exists at a time; within a batch, writes are
+        bounded by the manager's write semaphore and one failed secret does
+        not cancel the others.
+        
         Args:
             secrets: Dictionary of secret name -> value
             environment: Environment name for tagging
@@ -144,24 +367,57 @@ class KeyVaultManager:
             Dictionary of secret name -> secret ID
             
         Raises:
-            KeyVaultError: If any storage fails
+            KeyVaultError: If any storage fails (lists every failed secret)
         """
         logger.info(f"Storing {len(secrets)} secrets in Key Vault")
         
-        tasks = []
-        names = []
-        
-        for name, value in secrets.items():
-            tags = {"environment": environment, "managed-by": "specify-validate"}
-            tasks.append(self.store_secret(name, value, tags))
-            names.append(name)
+        tags = {"environment": environment, "managed-by": "specify-validate"}
+        
+        # Let the credential finish its first token request before fanning
+        # out, so parallel writes don't each wait on (or repeat) it
+        warm_up = self._pooled.warm_up if self._pooled else None
+        if warm_up is not None and not warm_up.done():
+            await asyncio.wait([warm_up])
+        
+        # Names that format to the same Key Vault secret are written once,
+        # with the last value given, and all of them get its secret ID
+        groups: Dict[str, List[str]] = {}
+        for name in secrets:
+            groups.setdefault(self._format_secret_name(name), []).append(name)
+        
+        for formatted_name, group in groups.items():
+            if len({secrets[name] for name in group}) > 1:
+                logger.warning(
+                    f"Secrets {', '.join(group)} all map to {formatted_name}; "
+                    f"storing the value of {group[-1]}"
+                )
+        
+        unique = list(groups.values())
+        results: List = []
+        for start in range(0, len(unique), self.STORE_BATCH_SIZE):
+            batch = unique[start:start + self.STORE_BATCH_SIZE]
+            results.extend(await asyncio.gather(
+                *(self.store_secret(group[-1], secrets[group[-1]], dict(tags)) for group in batch),
+                return_exceptions=True
+            ))
+        
+        stored: Dict[str, str] = {}
+        failures: List[str] = []
+        failed_count = 0
+        for group, result in zip(unique, results):
+            if isinstance(result, BaseException):
+                failures.append(f"{', '.join(group)}: {result}")
+                failed_count += len(group)
+            else:
+                stored.update(dict.fromkeys(group, result))
+        
+        if failures:
+            raise KeyVaultError(
+                f"Failed to store multiple secrets "
+                f"({failed_count} of {len(secrets)} failed): " + "; ".join(failures)
+            )
         
-        try:
-            results = await asyncio.gather(*tasks)
-            return dict(zip(names, results))
-            
-        except Exception as e:
-            raise KeyVaultError(f"Failed to store multiple secrets: {e}")
+        return stored
     
     async def store_app_settings(
         self,
@@ -194,14 +450,11 @@ class KeyVaultManager:
         
         secret_ids = await self.store_multiple_secrets(secrets, environment)
         
-        # Build Key Vault references
-        references = {}
-        for setting in secure_settings:
-            if setting.name in secret_ids:
-                ref = self.build_app_setting_reference(setting.name)
-                references[setting.name] = ref
-        
-        return references
+        # Build Key Vault references (secret_ids is keyed by setting name)
+        return {
+            name: self.build_app_setting_reference(name)
+            for name in secret_ids
+        }
     
     def build_app_setting_reference(
         self,
@@ -219,10 +472,9 @@ class KeyVaultManager:
             Key Vault reference string
         """
         formatted_name = self._format_secret_name(secret_name)
-        vault_name = self._extract_vault_name()
         
         reference = (
-            f"@Microsoft.KeyVault(VaultName={vault_name};"
+            f"@Microsoft.KeyVault(VaultName={self._vault_name};"
             f"SecretName={formatted_name})"
         )
         
@@ -245,26 +497,7 @@ class KeyVaultManager:
         Returns:
             Formatted secret name
         """
-        # Convert to lowercase
-        formatted = name.lower()
-        
-        # Replace colons with double hyphens (for ASP.NET config keys)
-        formatted = formatted.replace(":", "--")
-        
-        # Replace underscores with hyphens
-        formatted = formatted.replace("_", "-")
-        
-        # Remove any non-alphanumeric characters except hyphens
-        formatted = re.sub(r'[^a-z0-9-]', '', formatted)
-        
-        # Ensure max 127 characters
-        if len(formatted) > 127:
-            formatted = formatted[:127]
-        
-        # Remove leading/trailing hyphens
-        formatted = formatted.strip("-")
-        
-        return formatted
+        return _format_secret_name_cached(name)
     
     def _extract_vault_name(self) -> str:
         """
@@ -274,10 +507,9 @@ class KeyVaultManager:
             Vault name
         """
         # URL format: https://<vault-name>.vault.azure.net/
-        if "://" in self.vault_url:
-            domain = self.vault_url.split("://")[1]
-            vault_name = domain.split(".")[0]
-            return vault_name
+        host = urlparse(self.vault_url).hostname
+        if host:
+            return host.partition(".")[0]
         
         return "unknown"
     
@@ -294,7 +526,10 @@ class KeyVaultManager:
         formatted_name = self._format_secret_name(secret_name)
         
         try:
-            await self.client.begin_delete_secret(formatted_name)
+            await self._with_retry(
+                lambda: self.client.begin_delete_secret(formatted_name)
+            )
+            self._secret_cache.pop(formatted_name, None)
             logger.info(f"Secret deleted: {formatted_name}")
             
         except ResourceNotFoundError:
@@ -304,9 +539,26 @@ class KeyVaultManager:
             raise KeyVaultError(f"Failed to delete secret {formatted_name}: {e}")
     
     async def close(self) -> None:
-        """Close the Key Vault client and credential"""
-        await self.client.close()
-        await self.credential.close()
+        """
+        Release the Key Vault client and credential.
+        
+        They are shared with other managers for the same vault and are only
+        closed once the last of those managers is closed.
+        """
+        pooled, self._pooled = self._pooled, None
+        if pooled is None:
+            return
+        
+        pooled.references -= 1
+        if pooled.references > 0:
+            return
+        
+        if _CLIENT_POOL.get(self.vault_url) is pooled:
+            del _CLIENT_POOL[self.vault_url]
+        if pooled.warm_up is not None:
+            pooled.warm_up.cancel()
+        await pooled.client.close()
+        await pooled.credential.close()
     
     async def __aenter__(self):
         """Async context manager entry"""
@@ -6,17 +6,49 @@ provides caching for performance optimization.
 """
 
 import json
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
 
 from specify_cli.validation import ProjectInfo, ProjectDiscoveryError
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+def _build_signature_indexes(
+    signatures: Dict[str, List[str]]
+) -> Tuple[Dict[str, Tuple[int, str]], Dict[str, Tuple[int, str]]]:
+    """
+    Invert framework signatures into file-name and extension lookups.
+    
+    Each signature maps to (priority, framework), where priority is the
+    framework's position in ``signatures`` so earlier frameworks still win
+    when a project matches more than one.
+    
+    Returns:
+        Tuple of (file name index, extension index)
+    """
+    file_index: Dict[str, Tuple[int, str]] = {}
+    ext_index: Dict[str, Tuple[int, str]] = {}
+    for priority, (framework, patterns) in enumerate(signatures.items()):
+        for pattern in patterns:
+            if pattern.startswith("*."):
+                ext_index.setdefault(pattern[1:], (priority, framework))
+            else:
+                file_index.setdefault(pattern, (priority, framework))
+    return file_index, ext_index
+
+
 class ProjectDiscovery:
     """
     Discovers projects with generated Bicep templates.
@@ -26,7 +58,8 @@ class ProjectDiscovery:
     """
     
     CACHE_FILE = ".bicep-cache.json"
-    CACHE_TTL = 300  # 5 minutes
+    CACHE_TTL = 300  # 5 minutes, for caches without directory mtimes
+    CACHE_MAX_AGE = 24 * 60 * 60  # Safety net for mtime-validated caches
     
     # Signature files for framework detection
     FRAMEWORK_SIGNATURES = {
@@ -37,14 +70,43 @@ class ProjectDiscovery:
         "java": ["pom.xml", "build.gradle", "build.gradle.kts"],
         "ruby": ["Gemfile", "config.ru"],
     }
+    _FILE_INDEX, _EXT_INDEX = _build_signature_indexes(FRAMEWORK_SIGNATURES)
+    
+    # Extension signatures are matched this many directory levels below the
+    # project root; named signature files only at the root itself
+    FRAMEWORK_SCAN_DEPTH = 3
+    
+    # Common Bicep template directory names (matched case-insensitively)
+    BICEP_DIRS = frozenset({"bicep-templates", "bicep", "infrastructure", "iac", "templates"})
+    
+    # Dependency, virtualenv and build output directories are never scanned
+    EXCLUDED_DIRS = frozenset({
+        "node_modules", "venv", ".venv", "bin", "obj",
+        "__pycache__", "target", "dist", "build",
+    })
+    
+    # Bicep template directories are looked for at most this many levels
+    # below the workspace root
+    MAX_DEPTH = 5
+    
+    # Frameworks are detected on a thread pool once there are this many projects
+    PARALLEL_DETECT_MIN_PROJECTS = 3
+    MAX_DETECT_WORKERS = 8
     
-    def __init__(self, workspace_root: Path, use_cache: bool = True):
+    def __init__(
+        self,
+        workspace_root: Path,
+        use_cache: bool = True,
+        max_depth: Optional[int] = None,
+    ):
         """
         Initialize project discovery.
         
         Args:
             workspace_root: Root directory to search for projects
             use_cache: Whether to use cached results (default: True)
+            max_depth: Deepest directory level scanned for Bicep templates
+                (default: MAX_DEPTH)
             
         Raises:
             FileNotFoundError: If workspace_root doesn't exist
@@ -52,8 +114,16 @@ class ProjectDiscovery:
         """
         self.workspace_root = Path(workspace_root).resolve()
         self.use_cache = use_cache
+        self.max_depth = self.MAX_DEPTH if max_depth is None else max_depth
         self.cache_file = self.workspace_root / self.CACHE_FILE
         
+        # Relative path -> st_mtime_ns of every directory the last scan
+        # listed, saved with the cache to detect added or removed projects
+        self._dir_mtimes: Dict[str, int] = {}
+        # Relative path -> st_mtime_ns of every .bicep file found; a file
+        # edited in place leaves its directory's mtime unchanged
+        self._file_mtimes: Dict[str, int] = {}
+        
         # Validate workspace root
         if not self.workspace_root.exists():
             raise ProjectDiscoveryError(f"Workspace root does not exist: {self.workspace_root}")
@@ -148,49 +218,135 @@ class ProjectDiscovery:
             List of discovered projects
         """
         projects = []
+        template_dirs: List[Tuple[Path, float]] = []
         
-        # Common Bicep template directory names
-        bicep_dirs = ["bicep-templates", "bicep", "infrastructure", "iac", "templates"]
+        root = str(self.workspace_root)
+        dir_mtimes = {".": os.stat(root).st_mtime_ns}
+        file_mtimes: Dict[str, int] = {}
         
-        # Scan workspace (limit depth to avoid excessive scanning)
-        for path in self.workspace_root.rglob("*"):
-            # Skip hidden directories and common exclusions
-            if any(part.startswith('.') for part in path.parts):
-                continue
-            
-            if any(exclude in path.parts for exclude in ["node_modules", "venv", ".venv", "bin", "obj"]):
+        # Walk directories with os.scandir so hidden and excluded subtrees are
+        # pruned before they are entered rather than filtered file by file
+        stack = [(root, 0)]
+        while stack:
+            directory, depth = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    subdirs = [
+                        entry for entry in entries
+                        if not entry.name.startswith('.')
+                        and entry.name not in self.EXCLUDED_DIRS
+                        and entry.is_dir()
+                    ]
+            except OSError as e:
+                logger.debug(f"Skipping unreadable directory: {e}")
                 continue
             
-            # Check if directory contains Bicep files
-            if path.is_dir() and path.name.lower() in bicep_dirs:
-                bicep_files = list(path.glob("*.bicep"))
+            for entry in subdirs:
+                # Don't descend through directory symlinks (matches rglob)
+                # or past the depth limit
+                is_bicep_dir = entry.name.lower() in self.BICEP_DIRS
+                if depth + 1 < self.max_depth and not entry.is_symlink():
+                    stack.append((entry.path, depth + 1))
+                elif not is_bicep_dir:
+                    continue
+                
+                # Recorded before the directory is listed, so changes made
+                # during the scan still invalidate the cache
+                try:
+                    mtime_ns = entry.stat().st_mtime_ns
+                except OSError:
+                    continue
+                dir_mtimes[os.path.relpath(entry.path, root)] = mtime_ns
+                
+                # Check if directory contains Bicep files
+                if not is_bicep_dir:
+                    continue
                 
-                if bicep_files:
-                    # Found a project with Bicep templates
-                    project_root = path.parent
-                    
-                    # Detect framework
-                    framework = self._detect_framework(project_root)
-                    
-                    # Get last modified time (most recent .bicep file)
-                    last_modified = max(f.stat().st_mtime for f in bicep_files)
-                    
-                    # Create project info
-                    project = ProjectInfo(
-                        project_id=str(project_root.relative_to(self.workspace_root)),
-                        name=project_root.name,
-                        path=project_root,
-                        source_code_path=project_root,
-                        bicep_templates_path=path,
-                        framework=framework,
-                        last_modified=last_modified
-                    )
-                    
-                    projects.append(project)
-                    logger.debug(f"Found project: {project.name} ({framework})")
+                # Get last modified time (most recent .bicep file) from the
+                # same listing that finds the templates
+                last_modified = self._latest_bicep_mtime(entry.path, file_mtimes)
+                if last_modified is not None:
+                    template_dirs.append((Path(entry.path), last_modified))
         
+        # Detect frameworks once every project root is known so detection
+        # can overlap across projects
+        frameworks = self._detect_frameworks([path.parent for path, _ in template_dirs])
+        
+        for (path, last_modified), framework in zip(template_dirs, frameworks):
+            # Found a project with Bicep templates
+            project_root = path.parent
+            
+            # Create project info
+            project = ProjectInfo(
+                project_id=str(project_root.relative_to(self.workspace_root)),
+                name=project_root.name,
+                path=project_root,
+                source_code_path=project_root,
+                bicep_templates_path=path,
+                framework=framework,
+                last_modified=last_modified
+            )
+            
+            projects.append(project)
+            logger.debug(f"Found project: {project.name} ({framework})")
+        
+        # Directory listing order is filesystem dependent
+        projects.sort(key=lambda p: (p.name, p.project_id))
+        self._dir_mtimes = dir_mtimes
+        self._file_mtimes = file_mtimes
         return projects
     
+    def _latest_bicep_mtime(
+        self,
+        directory: str,
+        file_mtimes: Optional[Dict[str, int]] = None,
+    ) -> Optional[float]:
+        """
+        Find the most recent modification time among a directory's .bicep files.
+        
+        Args:
+            directory: Candidate Bicep template directory
+            file_mtimes: Optional mapping that receives each file's relative
+                path -> st_mtime_ns
+            
+        Returns:
+            Latest st_mtime, or None if the directory has no .bicep files
+        """
+        latest = None
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".bicep") and entry.is_file():
+                        stat = entry.stat()
+                        mtime = stat.st_mtime
+                        if latest is None or mtime > latest:
+                            latest = mtime
+                        if file_mtimes is not None:
+                            file_mtimes[os.path.relpath(entry.path, self.workspace_root)] = stat.st_mtime_ns
+        except OSError as e:
+            logger.debug(f"Skipping unreadable directory: {e}")
+        return latest
+    
+    def _detect_frameworks(self, project_paths: List[Path]) -> List[str]:
+        """
+        Detect frameworks for several projects, overlapping filesystem I/O
+        across threads.
+        
+        Small batches are detected serially to avoid thread pool overhead.
+        
+        Args:
+            project_paths: Project roots
+            
+        Returns:
+            Framework names in the order of the given paths
+        """
+        if len(project_paths) < self.PARALLEL_DETECT_MIN_PROJECTS:
+            return [self._detect_framework(path) for path in project_paths]
+        
+        workers = min(self.MAX_DETECT_WORKERS, len(project_paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self._detect_framework, project_paths))
+    
     def _detect_framework(self, project_path: Path) -> str:
         """
         Detect project framework based on signature files.
@@ -201,19 +357,38 @@ class ProjectDiscovery:
         Returns:
             Framework name or "unknown"
         """
-        for framework, signatures in self.FRAMEWORK_SIGNATURES.items():
-            for signature in signatures:
-                if signature.startswith("*."):
-                    # Extension pattern
-                    ext = signature[1:]  # Remove *
-                    if list(project_path.glob(f"**/*{ext}")):
-                        return framework
-                else:
-                    # Specific file
-                    if (project_path / signature).exists():
-                        return framework
+        # Walk the project once, matching every entry against the reverse
+        # signature indexes instead of globbing once per signature
+        best: Optional[Tuple[int, str]] = None
+        stack = [(str(project_path), 0)]
+        while stack:
+            directory, depth = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        match = self._EXT_INDEX.get(os.path.splitext(name)[1])
+                        if depth == 0:
+                            file_match = self._FILE_INDEX.get(name)
+                            if file_match is not None and (match is None or file_match < match):
+                                match = file_match
+                        if match is not None and (best is None or match < best):
+                            best = match
+                            if best[0] == 0:
+                                # Nothing outranks the first framework
+                                return best[1]
+                        
+                        if (
+                            depth < self.FRAMEWORK_SCAN_DEPTH
+                            and not name.startswith('.')
+                            and name not in self.EXCLUDED_DIRS
+                            and entry.is_dir(follow_symlinks=False)
+                        ):
+                            stack.append((entry.path, depth + 1))
+            except OSError as e:
+                logger.debug(f"Skipping unreadable directory: {e}")
         
-        return "unknown"
+        return best[1] if best is not None else "unknown"
     
     def _load_from_cache(self) -> Optional[List[ProjectInfo]]:
         """
@@ -226,7 +401,8 @@ class ProjectDiscovery:
             return None
         
         try:
-            cache_data = json.loads(self.cache_file.read_text())
+            raw = self.cache_file.read_bytes()
+            cache_data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
             
             # Check cache age
             cache_time = cache_data.get("timestamp", 0)
@@ -238,7 +414,20 @@ class ProjectDiscovery:
                     cache_time = 0
             age = time.time() - cache_time
             
-            if age > self.CACHE_TTL:
+            dir_mtimes = cache_data.get("dir_mtimes")
+            if dir_mtimes:
+                # Valid while no scanned directory or template has changed
+                if age > self.CACHE_MAX_AGE:
+                    logger.debug(f"Cache expired (age: {age:.0f}s)")
+                    return None
+                if not self._mtimes_match(dir_mtimes):
+                    logger.debug("Cache invalidated: workspace directories changed")
+                    return None
+                file_mtimes = cache_data.get("file_mtimes")
+                if file_mtimes is None or not self._mtimes_match(file_mtimes):
+                    logger.debug("Cache invalidated: Bicep templates changed")
+                    return None
+            elif age > self.CACHE_TTL:
                 logger.debug(f"Cache expired (age: {age:.0f}s)")
                 return None
             
@@ -262,6 +451,24 @@ class ProjectDiscovery:
             logger.warning(f"Cache file corrupted: {e}")
             return None
     
+    def _mtimes_match(self, mtimes: Dict[str, int]) -> bool:
+        """
+        Check recorded directory or file mtimes against the filesystem.
+        
+        Args:
+            mtimes: Relative path -> st_mtime_ns from the cache
+            
+        Returns:
+            True if every path still exists with the same mtime
+        """
+        for rel_path, mtime_ns in mtimes.items():
+            try:
+                if os.stat(self.workspace_root / rel_path).st_mtime_ns != mtime_ns:
+                    return False
+            except OSError:
+                return False
+        return True
+    
     def _save_to_cache(self, projects: List[ProjectInfo]) -> None:
         """
         Save projects to cache.
@@ -270,8 +477,16 @@ class ProjectDiscovery:
             projects: List of projects to cache
         """
         try:
+            dir_mtimes = dict(self._dir_mtimes)
+            if dir_mtimes and not self.cache_file.exists():
+                # Creating the cache file bumps the workspace root mtime
+                self.cache_file.touch()
+                dir_mtimes["."] = os.stat(self.workspace_root).st_mtime_ns
+            
             cache_data = {
                 "timestamp": time.time(),
+                "dir_mtimes": dir_mtimes,
+                "file_mtimes": self._file_mtimes,
                 "projects": [
                     {
                         "project_id": p.project_id,
@@ -286,7 +501,12 @@ class ProjectDiscovery:
                 ]
             }
             
-            self.cache_file.write_text(json.dumps(cache_data, indent=2))
+            # The cache is machine-read only, so it is written compactly
+            if ORJSON_AVAILABLE:
+                payload = orjson.dumps(cache_data)
+            else:
+                payload = json.dumps(cache_data, separators=(",", ":")).encode("utf-8")
+            self.cache_file.write_bytes(payload)
             logger.debug(f"Saved {len(projects)} projects to cache")
             
         except Exception as e:
@@ -246,7 +246,7 @@ class ResourceDeployer:
         """
         try:
             # Try to get resource by name
-            resource_name = deployment.resource_id.split('/')[-1]
+            resource_name = deployment.arm_name
             
             result = await asyncio.to_thread(
                 self.cli.get_resource,
@@ -372,7 +372,7 @@ class ResourceDeployer:
         # Rollback in reverse order
         for deployment in reversed(self.deployed_resources):
             try:
-                resource_name = deployment.resource_id.split('/')[-1]
+                resource_name = deployment.arm_name
                 
                 logger.info(f"Deleting resource: {resource_name}")
                 await asyncio.to_thread(
@@ -407,7 +407,7 @@ class ResourceDeployer:
         
         for deployment in reversed(matching):
             try:
-                resource_name = deployment.resource_id.split('/')[-1]
+                resource_name = deployment.arm_name
                 await asyncio.to_thread(
                     self.cli.delete_resource,
                     resource_name,
@@ -7,7 +7,7 @@ Handles deployment of Azure resources using Azure CLI with correct data models.
 import asyncio
 import logging
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import Callable, List, Optional, Dict
 from datetime import datetime
 import uuid
 
@@ -91,14 +91,12 @@ class ResourceDeployer:
         if dependency_graph and dependency_graph.has_cycle():
             raise ValidationError("Circular dependency detected in resource graph")
         
-        # Order deployments
+        # Group deployments into batches; without a graph the dependencies
+        # are unknown, so resources are deployed one at a time in order
+        batches = [[deployment] for deployment in deployments]
         if dependency_graph:
             try:
-                ordered_ids = dependency_graph.get_ordered_resources()
-                deployments = sorted(
-                    deployments,
-                    key=lambda d: ordered_ids.index(d.resource_id) if d.resource_id in ordered_ids else 999
-                )
+                batches = self._batch_by_depth(deployments, dependency_graph)
             except Exception as e:
                 logger.warning(f"Could not order deployments: {e}")
         
@@ -108,9 +106,9 @@ class ResourceDeployer:
         error_messages: List[str] = []
         
         if show_progress and RICH_AVAILABLE:
-            deployed_resources, deployment_outputs, error_messages = await self._deploy_with_progress(deployments)
+            deployed_resources, deployment_outputs, error_messages = await self._deploy_with_progress(batches)
         else:
-            deployed_resources, deployment_outputs, error_messages = await self._deploy_without_progress(deployments)
+            deployed_resources, deployment_outputs, error_messages = await self._deploy_without_progress(batches)
         
         # Calculate duration
         end_time = datetime.now()
@@ -224,59 +222,68 @@ class ResourceDeployer:
         except Exception:
             return False
     
-    async def _deploy_with_progress(
+    def _batch_by_depth(
         self,
-        deployments: List[ResourceDeployment]
-    ) -> tuple[List[ResourceDeployment], Dict[str, str], List[str]]:
-        """Deploy resources with Rich progress bars."""
-        deployed_resources: List[ResourceDeployment] = []
-        deployment_outputs: Dict[str, str] = {}
-        error_messages: List[str] = []
+        deployments: List[ResourceDeployment],
+        dependency_graph: DependencyGraph
+    ) -> List[List[ResourceDeployment]]:
+        """
+        Group deployments into layers of equal topological depth.
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-        ) as progress:
-            task = progress.add_task("[cyan]Deploying resources...", total=len(deployments))
-            
-            for deployment in deployments:
-                progress.update(task, description=f"[cyan]Deploying {deployment.resource_name}...")
-                try:
-                    result = await self._deploy_single(deployment)
-                    if result:
-                        deployed_resources.append(deployment)
-                        if deployment.output_values:
-                            for key, value in deployment.output_values.items():
-                                deployment_outputs[f"{deployment.resource_id}/{key}"] = str(value)
-                    else:
-                        # Deployment failed (returned False)
-                        error_msg = f"Deployment failed for {deployment.resource_name}"
-                        logger.error(error_msg)
-                        error_messages.append(error_msg)
-                except Exception as e:
-                    error_msg = f"Failed to deploy {deployment.resource_id}: {e}"
-                    logger.error(error_msg)
-                    error_messages.append(error_msg)
-                
-                progress.advance(task)
+        Resources in one layer don't depend on each other and are deployed
+        concurrently. Resources missing from the graph have unknown
+        dependencies and follow the layers one at a time, in input order.
+        """
+        by_id: Dict[str, List[ResourceDeployment]] = {}
+        for deployment in deployments:
+            by_id.setdefault(deployment.resource_id, []).append(deployment)
         
-        return deployed_resources, deployment_outputs, error_messages
+        batches: List[List[ResourceDeployment]] = []
+        for layer in dependency_graph.get_deployment_batches():
+            batch = [d for resource_id in layer for d in by_id.pop(resource_id, ())]
+            if batch:
+                batches.append(batch)
+        
+        batches.extend([d] for remaining in by_id.values() for d in remaining)
+        return batches
     
-    async def _deploy_without_progress(
+    async def _deploy_batches(
         self,
-        deployments: List[ResourceDeployment]
+        batches: List[List[ResourceDeployment]],
+        on_start: Optional[Callable[[ResourceDeployment], None]] = None,
+        on_done: Optional[Callable[[], None]] = None
     ) -> tuple[List[ResourceDeployment], Dict[str, str], List[str]]:
-        """Deploy resources without progress bars."""
+        """
+        Deploy batches in order, running each batch's resources concurrently.
+        
+        Concurrency within a batch is bounded by the deployment semaphore.
+        Results are collected in batch order regardless of completion order.
+        """
         deployed_resources: List[ResourceDeployment] = []
         deployment_outputs: Dict[str, str] = {}
         error_messages: List[str] = []
         
-        for deployment in deployments:
+        async def deploy(deployment: ResourceDeployment) -> bool:
+            if on_start:
+                on_start(deployment)
             try:
-                result = await self._deploy_single(deployment)
-                if result:
+                return await self._deploy_single(deployment)
+            finally:
+                if on_done:
+                    on_done()
+        
+        for batch in batches:
+            results = await asyncio.gather(
+                *(deploy(deployment) for deployment in batch),
+                return_exceptions=True
+            )
+            
+            for deployment, result in zip(batch, results):
+                if isinstance(result, BaseException):
+                    error_msg = f"Failed to deploy {deployment.resource_id}: {result}"
+                    logger.error(error_msg)
+                    error_messages.append(error_msg)
+                elif result:
                     deployed_resources.append(deployment)
                     if deployment.output_values:
                         for key, value in deployment.output_values.items():
@@ -286,13 +293,36 @@ class ResourceDeployer:
                     error_msg = f"Deployment failed for {deployment.resource_name}"
                     logger.error(error_msg)
                     error_messages.append(error_msg)
-            except Exception as e:
-                error_msg = f"Failed to deploy {deployment.resource_id}: {e}"
-                logger.error(error_msg)
-                error_messages.append(error_msg)
         
         return deployed_resources, deployment_outputs, error_messages
     
+    async def _deploy_with_progress(
+        self,
+        batches: List[List[ResourceDeployment]]
+    ) -> tuple[List[ResourceDeployment], Dict[str, str], List[str]]:
+        """Deploy resource batches with Rich progress bars."""
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+        ) as progress:
+            total = sum(len(batch) for batch in batches)
+            task = progress.add_task("[cyan]Deploying resources...", total=total)
+            
+            return await self._deploy_batches(
+                batches,
+                on_start=lambda d: progress.update(task, description=f"[cyan]Deploying {d.resource_name}..."),
+                on_done=lambda: progress.advance(task),
+            )
+    
+    async def _deploy_without_progress(
+        self,
+        batches: List[List[ResourceDeployment]]
+    ) -> tuple[List[ResourceDeployment], Dict[str, str], List[str]]:
+        """Deploy resource batches without progress bars."""
+        return await self._deploy_batches(batches)
+    
     async def _rollback_deployments(self, deployed_resources: List[ResourceDeployment]) -> None:
         """Rollback deployed resources by deleting them."""
         logger.warning(f"Rolling back {len(deployed_resources)} deployed resources...")
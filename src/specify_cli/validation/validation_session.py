@@ -356,7 +356,7 @@ class ValidationSession:
         # TODO: Get base URL from deployment outputs
         base_url = self.deployment_outputs.get("app_url", "https://example.com")
         
-        async with EndpointTester(base_url=base_url) as endpoint_tester:
+        async with EndpointTester(base_url=base_url, warm_up_connections=True) as endpoint_tester:
             self.endpoint_tester = endpoint_tester
             self.test_results = await endpoint_tester.test_multiple_endpoints(
                 self.discovered_endpoints
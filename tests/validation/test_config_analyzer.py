@@ -233,6 +233,25 @@ class TestDotNetConfigParsing:
         assert conn_string.source_type == SourceType.KEYVAULT
 
 
+    def test_parse_multiple_appsettings_files(self, dotnet_project):
+        """Test that environment-specific appsettings files are all parsed"""
+        project_path = dotnet_project.source_code_path
+        for env in ["Development", "Staging", "Production"]:
+            (project_path / f"appsettings.{env}.json").write_text(
+                json.dumps({"Environment": {"Name": env}})
+            )
+        
+        analyzer = ConfigAnalyzer()
+        result = analyzer.analyze_project(dotnet_project)
+        
+        env_names = sorted(
+            s.value for s in result.app_settings if s.name == "Environment:Name"
+        )
+        assert env_names == ["Development", "Production", "Staging"]
+        # Base appsettings.json is still parsed first
+        assert result.app_settings[0].name == "Logging:LogLevel:Default"
+
+
 class TestNodeJsConfigParsing:
     """Tests for Node.js .env file parsing"""
     
@@ -250,6 +269,42 @@ class TestNodeJsConfigParsing:
         assert port_setting.value == "3000"
         assert port_setting.source_type == SourceType.HARDCODED
     
+    def test_scan_config_files(self, nodejs_project):
+        """Test that the directory scan picks only recognised config files"""
+        project_path = nodejs_project.source_code_path
+        (project_path / ".env.local").write_text("LOCAL_ONLY=1")
+        (project_path / ".env.example").write_text("EXAMPLE=1")
+        (project_path / "appsettings.json").write_text("{}")
+        (project_path / "appsettings.Production.json").write_text("{}")
+        (project_path / "appsettingsBackup.json").write_text("{}")
+        (project_path / "package.json").write_text(json.dumps({"name": "app"}))
+        
+        analyzer = ConfigAnalyzer()
+        appsettings_files, env_files, package_json = analyzer._scan_config_files(project_path)
+        
+        assert [f.name for f in appsettings_files] == [
+            "appsettings.json", "appsettings.Production.json"
+        ]
+        assert sorted(f.name for f in env_files) == [".env", ".env.example"]
+        assert package_json == project_path / "package.json"
+    
+    def test_parse_env_file_quoting(self, nodejs_project):
+        """Test that matching quotes are removed and keyless lines skipped"""
+        (nodejs_project.source_code_path / ".env").write_text(
+            'DOUBLE = "a b"\n'
+            "SINGLE='c'\n"
+            'MIXED="d\'\n'
+            "EMPTY=\n"
+            "=orphan\n"
+        )
+        
+        analyzer = ConfigAnalyzer()
+        settings = {s.name: s.value for s in analyzer._parse_env_entries(
+            nodejs_project.source_code_path / ".env"
+        )}
+        
+        assert settings == {"DOUBLE": "a b", "SINGLE": "c", "MIXED": "\"d'", "EMPTY": ""}
+    
     def test_parse_env_file_endpoints(self, nodejs_project):
         """Test parsing endpoint URLs from .env"""
         analyzer = ConfigAnalyzer()
@@ -348,6 +403,26 @@ class TestSecureValueDetection:
             assert timeout_setting.is_secure is False
 
 
+    def test_secure_key_separator_variants(self):
+        """Test secure detection across casing and separator variants"""
+        analyzer = ConfigAnalyzer()
+        
+        for key in ["API_KEY", "api-key", "ApiKey", "Private_Key", "Db:ConnectionString",
+                    "connection-string", "JWT_TOKEN", "AzureCredential", "DB_PASSWORD"]:
+            assert analyzer._is_secure_value(key) is True, key
+        
+        for key in ["API__KEY", "Timeout", "PORT", "StorageAccountName"]:
+            assert analyzer._is_secure_value(key) is False, key
+    
+    def test_classify_key(self):
+        """Test that key classification returns the secret name for secure keys only"""
+        analyzer = ConfigAnalyzer()
+        
+        assert analyzer._classify_key("Api:ApiKey") == (True, "api-apikey")
+        assert analyzer._classify_key("ConnectionStrings:Db") == (True, "connectionstrings-db")
+        assert analyzer._classify_key("Api:Timeout") == (False, None)
+
+
 class TestResourceDependencyDetection:
     """Tests for Azure resource dependency detection"""
     
@@ -404,6 +479,51 @@ class TestResourceDependencyDetection:
         assert isinstance(result.resource_dependencies, list)
 
 
+    def test_detects_each_resource_type_once(self, dotnet_project):
+        """Test that every resource type is detected and matching stops once all are found"""
+        values = [
+            "Server=tcp:x.database.windows.net",
+            "https://x.blob.core.windows.net",
+            "https://x.documents.azure.com:443/",
+            "x.servicebus.windows.net",
+            "https://x.vault.azure.net/",
+            "x.redis.cache.windows.net:6380",
+        ]
+        settings = [
+            AppSetting(
+                setting_id=f"s{i}",
+                name=f"S{i}",
+                value=value,
+                source_type=SourceType.HARDCODED,
+                is_secure=False,
+                environment="test"
+            )
+            for i, value in enumerate(values * 2)
+        ]
+        
+        analyzer = ConfigAnalyzer()
+        dependencies = analyzer._identify_dependencies(settings, dotnet_project)
+        
+        assert sorted(dependencies) == sorted(ConfigAnalyzer.RESOURCE_PATTERNS)
+    
+    def test_dependency_prefilter_keeps_dotless_patterns(self, dotnet_project):
+        """Test that values skipped by the prefilter cannot match and SqlConnection still does"""
+        def make(value):
+            return AppSetting(
+                setting_id="s", name="S", value=value,
+                source_type=SourceType.HARDCODED, is_secure=False, environment="test"
+            )
+        
+        analyzer = ConfigAnalyzer()
+        
+        assert analyzer._identify_dependencies(
+            [make("30"), make("true"), make("Information")], dotnet_project
+        ) == []
+        assert analyzer._identify_dependencies(
+            [make("SqlConnection")], dotnet_project
+        ) == ["Microsoft.Sql/servers"]
+
+
 class TestDependencyGraph:
     """Tests for dependency graph building"""
     
@@ -442,6 +562,22 @@ class TestDependencyGraph:
                 for resource, deps in result.dependency_graph.items():
                     if resource != kv_resource and len(deps) > 0:
                         assert kv_resource in deps
+    
+    def test_dependency_graph_key_vault_fan_out(self):
+        """Test that every resource depends on Key Vault when it is present"""
+        analyzer = ConfigAnalyzer()
+        
+        graph = analyzer._build_dependency_graph([
+            "Microsoft.Sql/servers", "Microsoft.KeyVault/vaults", "Microsoft.Cache/redis"
+        ])
+        assert graph == {
+            "Microsoft.Sql/servers": ["Microsoft.KeyVault/vaults"],
+            "Microsoft.KeyVault/vaults": [],
+            "Microsoft.Cache/redis": ["Microsoft.KeyVault/vaults"],
+        }
+        
+        graph = analyzer._build_dependency_graph(["Microsoft.Sql/servers"])
+        assert graph == {"Microsoft.Sql/servers": []}
 
 
 class TestSecretNameFormatting:
@@ -470,6 +606,16 @@ class TestSecretNameFormatting:
                 import re
                 assert re.match(r'^[a-z0-9-]+$', secret_name)
     
+    def test_format_secret_name(self):
+        """Test Key Vault secret name formatting"""
+        analyzer = ConfigAnalyzer()
+        
+        assert analyzer._format_secret_name("ConnectionStrings:Default") == "connectionstrings-default"
+        assert analyzer._format_secret_name("API_KEY.v2") == "api-key-v2"
+        assert analyzer._format_secret_name("My@Secret#Key!") == "mysecretkey"
+        assert analyzer._format_secret_name("Ünïcode_İd") == "ncode-id"
+        assert len(analyzer._format_secret_name("Key" * 100)) == 127
+    
     def test_secret_name_length_limit(self, tmp_path):
         """Test that secret names respect 127 character limit"""
         # Create project with very long setting name
@@ -591,3 +737,52 @@ class TestEdgeCases:
         
         assert isinstance(result, AnalysisResult)
         assert len(result.app_settings) == 0
+    
+    def test_large_config_streaming_matches_full_parse(self, tmp_path):
+        """Test that large configs are stream-parsed with identical results"""
+        pytest.importorskip("ijson")
+        
+        project_path = tmp_path / "large-config-project"
+        project_path.mkdir()
+        
+        appsettings = {
+            "Logging": {"LogLevel": {"Default": "Information"}},
+            "ConnectionStrings": {"DefaultConnection": "Server=tcp:x.database.windows.net"},
+            "AllowedHosts": ["a.example.com", "b.example.com"],
+            "Features": {
+                f"Feature{i}": {"Enabled": i % 2 == 0, "Ratio": i / 4, "Owner": None}
+                for i in range(2000)
+            },
+            "Empty": {}
+        }
+        config_file = project_path / "appsettings.json"
+        config_file.write_text(json.dumps(appsettings, indent=2))
+        assert config_file.stat().st_size > ConfigAnalyzer.STREAMING_THRESHOLD_BYTES
+        
+        analyzer = ConfigAnalyzer()
+        streamed = analyzer._extract_settings_streaming(config_file)
+        expected = analyzer._extract_settings_from_json(appsettings)
+        
+        assert streamed == expected
+        hosts = next(s for s in streamed if s.name == "AllowedHosts")
+        assert hosts.value == str(["a.example.com", "b.example.com"])
+    
+    def test_deeply_nested_json(self):
+        """Test that deeply nested JSON does not hit the recursion limit"""
+        import sys
+        
+        depth = sys.getrecursionlimit() + 100
+        data = leaf = {}
+        for i in range(depth):
+            leaf["Index"] = i
+            leaf["Level"] = {}
+            leaf = leaf["Level"]
+        leaf["Value"] = "bottom"
+        
+        analyzer = ConfigAnalyzer()
+        settings = analyzer._extract_settings_from_json(data)
+        
+        assert len(settings) == depth + 1
+        assert settings[0].name == "Index"
+        assert settings[-1].name == ":".join(["Level"] * depth + ["Value"])
+        assert settings[-1].value == "bottom"
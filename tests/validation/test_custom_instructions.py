@@ -139,7 +139,10 @@ class TestCustomTestCriteria:
             mock_response.headers = {}
             
             # Mock all HTTP methods to return the mock_response
+            request_timeouts = []
+            
             async def mock_http_method(*args, **kwargs):
+                request_timeouts.append(kwargs.get('timeout'))
                 return mock_response
             
             mock_client.get = mock_http_method
@@ -152,15 +155,17 @@ class TestCustomTestCriteria:
             mock_client.aclose = AsyncMock()
             mock_client_class.return_value = mock_client
             
-            # Test with custom timeout (should be passed to AsyncClient)
+            # Test with custom timeout (should be passed with the request)
             result = await tester.test_endpoint(endpoint, timeout_seconds=60)
             
-            # Verify AsyncClient was called with custom timeout (and connection pooling params)
+            # Verify the shared AsyncClient uses the default timeout (and connection
+            # pooling params) while the request carries the override
             mock_client_class.assert_called_once()
             call_kwargs = mock_client_class.call_args.kwargs
-            assert call_kwargs['timeout'] == 60
+            assert call_kwargs['timeout'] == 30
             assert 'limits' in call_kwargs
             assert call_kwargs['follow_redirects'] is False
+            assert request_timeouts == [60]
             assert result.status == TestStatus.SUCCESS
     
     @pytest.mark.asyncio
@@ -179,7 +184,10 @@ class TestCustomTestCriteria:
             mock_response.headers = {}
             
             # Mock all HTTP methods to return the mock_response
+            request_timeouts = []
+            
             async def mock_http_method(*args, **kwargs):
+                request_timeouts.append(kwargs.get('timeout'))
                 return mock_response
             
             mock_client.get = mock_http_method
@@ -200,6 +208,8 @@ class TestCustomTestCriteria:
             
             assert result.status == TestStatus.SUCCESS
             assert result.status_code == 201
+            # Without an override the request carries the instance timeout
+            assert request_timeouts == [30]
 
 
 class TestSkipAuthentication:
@@ -234,7 +244,10 @@ class TestSkipAuthentication:
             mock_response.headers = {}
             
             # Mock all HTTP methods to return the mock_response
+            request_timeouts = []
+            
             async def mock_http_method(*args, **kwargs):
+                request_timeouts.append(kwargs.get('timeout'))
                 return mock_response
             
             mock_client.get = mock_http_method
@@ -261,6 +274,8 @@ class TestSkipAuthentication:
             assert len(success_results) == 1
             assert len(skipped_results) == 2
             assert success_results[0].endpoint.path == "/health"
+            # Only the public endpoint is requested, with the instance timeout
+            assert request_timeouts == [30]
 
 
 class TestVerboseLogging:
@@ -291,13 +306,18 @@ class TestVerboseLogging:
         # Mock HTTP client
         with patch('httpx.AsyncClient') as mock_client_class:
             mock_client = AsyncMock()
-            mock_response = Mock(spec=['status_code', 'text', 'headers'])
+            mock_response = Mock(spec=['status_code', 'text', 'content', 'encoding', 'headers'])
             mock_response.status_code = 200
             mock_response.text = "Test response body"
+            mock_response.content = b"Test response body"
+            mock_response.encoding = "utf-8"
             mock_response.headers = {"Content-Type": "application/json"}
             
             # Mock all HTTP methods to return the mock_response
+            request_timeouts = []
+            
             async def mock_http_method(*args, **kwargs):
+                request_timeouts.append(kwargs.get('timeout'))
                 return mock_response
             
             mock_client.get = mock_http_method
@@ -319,6 +339,8 @@ class TestVerboseLogging:
             assert "Expected status codes:" in log_text
             assert "Response headers:" in log_text
             assert "Response body preview:" in log_text
+            assert "Request timeout: 30s" in log_text
+            assert request_timeouts == [30]
 
 
 if __name__ == "__main__":
@@ -5,12 +5,14 @@ Tests endpoint discovery from various frameworks (ASP.NET, Express, FastAPI)
 and OpenAPI specifications.
 """
 
+import logging
 import pytest
 from pathlib import Path
 import tempfile
 import yaml
 import json
 
+from specify_cli.validation import endpoint_discoverer
 from specify_cli.validation.endpoint_discoverer import EndpointDiscoverer, Endpoint
 
 
@@ -404,6 +406,379 @@ def get_users_v2():
         
         assert len(endpoints) == 0
     
+    def test_collect_files_single_walk(self, tmp_path):
+        """Test that files are bucketed by parser and pruned directories skipped"""
+        (tmp_path / "src" / "api").mkdir(parents=True)
+        (tmp_path / "src" / "api" / "routes.py").write_text("")
+        (tmp_path / "src" / "server.js").write_text("")
+        (tmp_path / "src" / "app.ts").write_text("")
+        (tmp_path / "Controllers").mkdir()
+        (tmp_path / "Controllers" / "UsersController.cs").write_text("")
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "openapi.yaml").write_text("")
+        for pruned in ["node_modules", "bin", "obj", ".git", "dist", ".venv", "target"]:
+            (tmp_path / pruned / "nested").mkdir(parents=True)
+            (tmp_path / pruned / "nested" / "index.js").write_text("")
+            (tmp_path / pruned / "nested" / "Generated.cs").write_text("")
+        
+        discoverer = EndpointDiscoverer(tmp_path)
+        files = discoverer._collect_files()
+        
+        def rel(paths):
+            return sorted(p.relative_to(tmp_path).as_posix() for p in paths)
+        
+        assert rel(files["py"]) == ["src/api/routes.py"]
+        assert rel(files["js_ts"]) == ["src/app.ts", "src/server.js"]
+        assert rel(files["cs"]) == ["Controllers/UsersController.cs"]
+        assert rel(files["openapi"]) == ["docs/openapi.yaml"]
+    
+    def test_route_line_numbers_and_chains(self, tmp_path):
+        """Test whole-content matching reports correct lines and chained routes"""
+        (tmp_path / "server.js").write_text(
+            "const app = express();\n"
+            "\n"
+            "app.get('/health', handler);\n"
+            "app.post('/login', requireAuth, handler);\n"
+            "app.route('/items')\n"
+            "  .get(listItems)\n"
+            "  .put(updateItems);\n"
+        )
+        (tmp_path / "Program.cs").write_text(
+            'var app = builder.Build();\n'
+            'app.MapGet("/open", () => "ok");\n'
+            '\n'
+            '\n'
+            '\n'
+            'app.MapPost("/secure", () => "ok")\n'
+            '    .RequireAuthorization();\n'
+        )
+        
+        discoverer = EndpointDiscoverer(tmp_path)
+        endpoints = {(e.method, e.path): e for e in discoverer.discover_endpoints()}
+        
+        assert endpoints[("GET", "/health")].line_number == 3
+        assert endpoints[("GET", "/health")].requires_auth is False
+        assert endpoints[("POST", "/login")].line_number == 4
+        assert endpoints[("POST", "/login")].requires_auth is True
+        assert endpoints[("GET", "/items")].line_number == 5
+        assert endpoints[("PUT", "/items")].line_number == 5
+        assert endpoints[("GET", "/open")].line_number == 2
+        assert endpoints[("GET", "/open")].requires_auth is False
+        assert endpoints[("POST", "/secure")].line_number == 6
+        assert endpoints[("POST", "/secure")].requires_auth is True
+    
+    def test_anchor_matcher(self):
+        """Test the anchor prefilter on raw file contents"""
+        matches = endpoint_discoverer._build_anchor_matcher((b"[Http", b"app.Map"))
+        
+        assert matches(b'[HttpGet("x")]')
+        assert matches(b'app.MapPost("/y", h);')
+        assert not matches(b"public class Helper { }")
+    
+    def test_express_anchors_require_app_or_router(self):
+        """Test generic .get( calls do not pass the Express prefilter"""
+        matches = endpoint_discoverer._build_anchor_matcher(endpoint_discoverer._EXPRESS_ANCHORS)
+        
+        assert not matches(b"const v = cache.get(key); axios.post(url);")
+        assert matches(b"router.delete('/x', h);")
+        assert matches(b"app.route('/y').get(h);")
+    
+    def test_files_without_anchors_are_skipped(self, tmp_path):
+        """Test source files lacking route anchors yield no endpoints"""
+        (tmp_path / "util.py").write_text("def helper():\n    return 1\n")
+        (tmp_path / "util.js").write_text("module.exports = { x: 1 };\n")
+        (tmp_path / "Util.cs").write_text("public static class Util { }\n")
+        
+        discoverer = EndpointDiscoverer(tmp_path)
+        
+        assert discoverer.discover_endpoints() == []
+    
+    def test_parallel_parsing_matches_serial(self, tmp_path, monkeypatch):
+        """Test process-pool parsing returns the same endpoints as serial parsing"""
+        for i in range(6):
+            (tmp_path / f"routes_{i}.py").write_text(
+                f'@app.get("/items/{i}")\n'
+                f'def get_{i}(user = Depends(get_current_user)):\n'
+                f'    pass\n'
+            )
+        
+        serial = EndpointDiscoverer(tmp_path).discover_endpoints()
+        
+        monkeypatch.setenv("SPECIFY_PARSE_WORKERS", "2")
+        monkeypatch.setattr(EndpointDiscoverer, "PARALLEL_PARSE_MIN_FILES", 2)
+        monkeypatch.setattr(EndpointDiscoverer, "PARSE_CHUNK_SIZE", 2)
+        parallel = EndpointDiscoverer(tmp_path).discover_endpoints()
+        
+        assert len(serial) == 6
+        assert parallel == serial
+    
+    def test_one_parse_pool_per_discovery(self, tmp_path, monkeypatch):
+        """Test every framework parser in a discovery run shares one worker pool"""
+        for i in range(3):
+            (tmp_path / f"routes_{i}.py").write_text(f'@app.get("/py/{i}")\ndef get_{i}():\n    pass\n')
+            (tmp_path / f"routes_{i}.js").write_text(f"app.get('/js/{i}', handler);\n")
+        
+        created = []
+        
+        class CountingPool(endpoint_discoverer.ProcessPoolExecutor):
+            def __init__(self, *args, **kwargs):
+                created.append(self)
+                super().__init__(*args, **kwargs)
+        
+        monkeypatch.setattr(endpoint_discoverer, "ProcessPoolExecutor", CountingPool)
+        monkeypatch.setenv("SPECIFY_PARSE_WORKERS", "2")
+        monkeypatch.setattr(EndpointDiscoverer, "PARALLEL_PARSE_MIN_FILES", 2)
+        
+        discoverer = EndpointDiscoverer(tmp_path)
+        endpoints = discoverer.discover_endpoints()
+        
+        assert len(created) == 1
+        assert discoverer._parse_pool is None
+        assert {e.path for e in endpoints} == {f"/{kind}/{i}" for kind in ("py", "js") for i in range(3)}
+    
+    def test_small_projects_parse_without_pool(self, tmp_path, monkeypatch):
+        """Test no worker pool is created below PARALLEL_PARSE_MIN_FILES"""
+        (tmp_path / "main.py").write_text('@app.get("/health")\ndef health():\n    pass\n')
+        monkeypatch.setenv("SPECIFY_PARSE_WORKERS", "4")
+        monkeypatch.setattr(
+            endpoint_discoverer, "ProcessPoolExecutor",
+            lambda *args, **kwargs: pytest.fail("pool created for a small project"),
+        )
+        
+        assert len(EndpointDiscoverer(tmp_path).discover_endpoints()) == 1
+    
+    def test_parse_worker_init_is_quiet(self, tmp_path, caplog, monkeypatch):
+        """Test worker initialization builds parsing state without init logging"""
+        monkeypatch.setattr(endpoint_discoverer, "_worker_discoverer", None)
+        caplog.set_level(logging.INFO, logger="specify_cli.validation.endpoint_discoverer")
+        (tmp_path / "main.py").write_text('@app.get("/health")\ndef health():\n    pass\n')
+        
+        endpoint_discoverer._init_parse_worker(tmp_path)
+        endpoints = endpoint_discoverer._parse_in_worker("_parse_py_file", tmp_path / "main.py")
+        
+        assert endpoint_discoverer._worker_discoverer.project_root == tmp_path
+        assert [e.path for e in endpoints] == ["/health"]
+        assert "Initialized EndpointDiscoverer" not in caplog.text
+    
+    def test_parse_workers_env_override(self, monkeypatch):
+        """Test SPECIFY_PARSE_WORKERS controls the worker count"""
+        monkeypatch.setenv("SPECIFY_PARSE_WORKERS", "3")
+        assert endpoint_discoverer._parse_workers() == 3
+        
+        monkeypatch.setenv("SPECIFY_PARSE_WORKERS", "many")
+        assert endpoint_discoverer._parse_workers() >= 1
+    
+    def test_openapi_spec_cache_invalidated_on_change(self, tmp_path, monkeypatch):
+        """Test parsed specs are reused until the file changes"""
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_text(json.dumps({"paths": {"/a": {"get": {}}}}))
+        discoverer = EndpointDiscoverer(tmp_path)
+        
+        loads = []
+        real_loads = json.loads
+        monkeypatch.setattr(endpoint_discoverer, "_optional_import", lambda name: None)
+        monkeypatch.setattr(json, "loads", lambda data: loads.append(1) or real_loads(data))
+        
+        assert [e.path for e in discoverer.parse_openapi_spec(spec_file)] == ["/a"]
+        assert [e.path for e in discoverer.parse_openapi_spec(spec_file)] == ["/a"]
+        assert len(loads) == 1
+        
+        spec_file.write_text(json.dumps({"paths": {"/a": {"get": {}}, "/bb": {"post": {}}}}))
+        
+        assert [e.path for e in discoverer.parse_openapi_spec(spec_file)] == ["/a", "/bb"]
+        assert len(loads) == 2
+    
+    def test_openapi_cache_results_independent(self, tmp_path):
+        """Test callers can't change the endpoints later callers get from the cache"""
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_text(json.dumps({"paths": {"/a": {"get": {"summary": "A"}}}}))
+        discoverer = EndpointDiscoverer(tmp_path)
+        
+        first = discoverer.parse_openapi_spec(spec_file)
+        first[0].path = "/changed"
+        first.clear()
+        
+        second = discoverer.parse_openapi_spec(spec_file)
+        assert [(e.path, e.description) for e in second] == [("/a", "A")]
+    
+    def test_openapi_cache_bounded(self, tmp_path, monkeypatch):
+        """Test the spec cache keeps only the most recently used specs"""
+        monkeypatch.setattr(endpoint_discoverer, "_SPEC_CACHE", endpoint_discoverer.OrderedDict())
+        monkeypatch.setattr(endpoint_discoverer, "_SPEC_CACHE_MAX_ENTRIES", 2)
+        discoverer = EndpointDiscoverer(tmp_path)
+        
+        specs = []
+        for name in ("a", "b", "c"):
+            spec_file = tmp_path / f"{name}.json"
+            spec_file.write_text(json.dumps({"paths": {f"/{name}": {"get": {}}}}))
+            specs.append(spec_file)
+        
+        discoverer.parse_openapi_spec(specs[0])
+        discoverer.parse_openapi_spec(specs[1])
+        discoverer.parse_openapi_spec(specs[0])  # a is now most recent
+        discoverer.parse_openapi_spec(specs[2])
+        
+        cached = set(endpoint_discoverer._SPEC_CACHE)
+        assert cached == {str(specs[0].resolve()), str(specs[2].resolve())}
+    
+    def test_openapi_file_names_case_insensitive(self, tmp_path):
+        """Test OpenAPI specs are found regardless of file name case"""
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "OpenAPI.YAML").write_text(
+            yaml.dump({"openapi": "3.0.0", "paths": {"/ping": {"get": {}}}})
+        )
+        
+        discoverer = EndpointDiscoverer(tmp_path)
+        endpoints = discoverer.discover_endpoints()
+        
+        assert [(e.method, e.path) for e in endpoints] == [("GET", "/ping")]
+    
+    def test_auth_detection_windows(self, tmp_path):
+        """Test auth checks look at the expected lines around each route"""
+        (tmp_path / "ItemsController.cs").write_text(
+            '[Authorize]\n'
+            '[Route("api/items")]\n'
+            'public class ItemsController {\n'
+            '    [HttpGet]\n'
+            '    public void List() {}\n'
+            '\n'
+            '\n'
+            '\n'
+            '\n'
+            '    [HttpDelete("{id}")]\n'
+            '    public void Delete() {}\n'
+            '}\n'
+        )
+        (tmp_path / "main.py").write_text(
+            '@app.get("/me")\n'
+            'def me(\n'
+            '    user = Depends(get_current_user),\n'
+            '):\n'
+            '    pass\n'
+            '@app.get("/open")\n'
+            'def open_route():\n'
+            '    pass\n'
+            '@app.get("/next")\n'
+            'def next_route(user = Depends(get_current_user)):\n'
+            '    pass\n'
+        )
+        
+        discoverer = EndpointDiscoverer(tmp_path)
+        auth = {e.path: e.requires_auth for e in discoverer.discover_endpoints()}
+        
+        assert auth["api/items"] is True
+        assert auth["/api/items/{id}"] is False
+        assert auth["/me"] is True
+        assert auth["/open"] is False
+        assert auth["/next"] is True
+    
+    def test_large_files_are_memory_mapped(self, tmp_path, monkeypatch):
+        """Test mmap-backed parsing matches parsing of read contents"""
+        (tmp_path / "server.js").write_text(
+            "// padding\n" * 50
+            + "app.get('/caf\u00e9', requireAuth, h);\r\n"
+            + "router.route('/r')\r\n  .post(h);\r\n",
+            encoding="utf-8",
+        )
+        (tmp_path / "Program.cs").write_text('app.MapGet("/m", h).RequireAuthorization();\n')
+        
+        read = EndpointDiscoverer(tmp_path).discover_endpoints()
+        monkeypatch.setattr(EndpointDiscoverer, "MMAP_MIN_BYTES", 1)
+        mapped = EndpointDiscoverer(tmp_path).discover_endpoints()
+        
+        assert mapped == read
+        assert [(e.method, e.path, e.line_number, e.requires_auth) for e in read] == [
+            ("GET", "/m", 1, True),
+            ("GET", "/caf\u00e9", 51, True),
+            ("POST", "/r", 52, False),
+        ]
+    
+    def test_duplicate_endpoints_keep_first(self, tmp_path):
+        """Test endpoints with the same method and path are reported once"""
+        (tmp_path / "Program.cs").write_text('app.MapGet("/health", h);\n')
+        (tmp_path / "server.js").write_text("app.get('/health', h);\napp.get('/health', h);\n")
+        
+        discoverer = EndpointDiscoverer(tmp_path)
+        endpoints = discoverer.discover_endpoints()
+        
+        assert len(endpoints) == 1
+        assert endpoints[0].source_file == "Program.cs"
+    
+    def test_openapi_loaders_agree(self, tmp_path, monkeypatch):
+        """Test the fast and fallback spec loaders produce the same endpoints"""
+        spec = {
+            "openapi": "3.0.0",
+            "security": [{"bearer": []}],
+            "paths": {"/caf\u00e9": {"get": {"summary": "Caf\u00e9"}, "parameters": []}},
+        }
+        (tmp_path / "openapi.json").write_text(json.dumps(spec), encoding="utf-8")
+        (tmp_path / "swagger.yaml").write_text(yaml.dump(spec, allow_unicode=True), encoding="utf-8")
+        discoverer = EndpointDiscoverer(tmp_path)
+        
+        fast = [
+            discoverer.parse_openapi_spec(tmp_path / name)
+            for name in ("openapi.json", "swagger.yaml")
+        ]
+        endpoint_discoverer._SPEC_CACHE.clear()
+        monkeypatch.setattr(endpoint_discoverer, "_optional_import", lambda name: None)
+        monkeypatch.delattr(yaml, "CSafeLoader", raising=False)
+        fallback = [
+            discoverer.parse_openapi_spec(tmp_path / name)
+            for name in ("openapi.json", "swagger.yaml")
+        ]
+        
+        assert fast == fallback
+        assert [(e.method, e.path, e.requires_auth, e.description) for e in fast[0]] == [
+            ("GET", "/caf\u00e9", True, "Caf\u00e9")
+        ]
+    
+    @pytest.mark.skipif(endpoint_discoverer._optional_import("ijson") is None, reason="ijson not installed")
+    def test_large_json_spec_streamed(self, tmp_path, monkeypatch):
+        """Test streamed JSON specs yield the same endpoints as fully loaded ones"""
+        spec = {
+            "openapi": "3.0.0",
+            "components": {"schemas": {f"Model{i}": {"type": "object"} for i in range(50)}},
+            "paths": {
+                "/items": {"get": {"summary": "List"}, "post": {"security": []}},
+                "/items/{id}": {"parameters": [], "delete": {"description": "Remove"}},
+            },
+            "security": None,
+        }
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_text(json.dumps(spec))
+        discoverer = EndpointDiscoverer(tmp_path)
+        
+        loaded = discoverer.parse_openapi_spec(spec_file)
+        endpoint_discoverer._SPEC_CACHE.clear()
+        monkeypatch.setattr(endpoint_discoverer, "_SPEC_STREAMING_MIN_BYTES", 1)
+        streamed = discoverer.parse_openapi_spec(spec_file)
+        
+        assert streamed == loaded
+        assert len(streamed) == 3
+        assert all(e.requires_auth for e in streamed)
+        assert "components" not in endpoint_discoverer._load_openapi_spec(spec_file, spec_file.stat().st_size)
+    
+    def test_openapi_method_keys(self, tmp_path):
+        """Test operation keys are matched case-insensitively and others skipped"""
+        spec = {
+            "openapi": "3.0.0",
+            "paths": {
+                "/items": {
+                    "get": {},
+                    "POST": {"security": [{"bearer": []}]},
+                    "parameters": [],
+                    "x-internal": {},
+                },
+            },
+        }
+        spec_file = tmp_path / "openapi.json"
+        spec_file.write_text(json.dumps(spec))
+        
+        discoverer = EndpointDiscoverer(tmp_path)
+        endpoints = discoverer.parse_openapi_spec(spec_file)
+        
+        assert [(e.method, e.requires_auth) for e in endpoints] == [("GET", False), ("POST", True)]
+    
     def test_endpoint_string_representation(self):
         """Test Endpoint __str__ method"""
         endpoint = Endpoint(
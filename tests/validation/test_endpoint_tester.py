@@ -11,6 +11,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
 
 from specify_cli.validation.endpoint_discoverer import Endpoint
+from specify_cli.validation import endpoint_tester
 from specify_cli.validation.endpoint_tester import EndpointTester, TestResult, TestStatus
 from specify_cli.utils.retry_policies import ExponentialBackoff
 
@@ -31,6 +32,13 @@ class TestEndpointTester:
         assert tester.max_concurrent == 10
         assert tester.retry_policy.max_attempts == 3
     
+    def test_connection_pool_keepalive(self):
+        """Test idle pooled connections outlive retry backoff delays"""
+        tester = EndpointTester(base_url="https://example.com")
+        
+        assert tester._client_limits.keepalive_expiry == 30.0
+        assert tester._client_limits.keepalive_expiry >= tester.retry_policy.max_delay
+    
     @pytest.mark.asyncio
     async def test_test_endpoint_success(self):
         """Test successful endpoint test"""
@@ -210,9 +218,11 @@ class TestEndpointTester:
         success_results = [r for r in results if r.status == TestStatus.SUCCESS]
         assert len(success_results) == 1
         
-        # Two skipped
+        # Two skipped, after the tested endpoints and in input order
         skipped_results = [r for r in results if r.status == TestStatus.SKIPPED]
         assert len(skipped_results) == 2
+        assert [r.endpoint.path for r in results] == ["/api/public", "/api/secure", "/api/admin"]
+        assert all(r.error_message == "Authentication required (skipped)" for r in skipped_results)
     
     @pytest.mark.asyncio
     async def test_test_multiple_endpoints_mixed_results(self):
@@ -252,6 +262,321 @@ class TestEndpointTester:
         failure_count = sum(1 for r in results if r.status in [TestStatus.FAILURE, TestStatus.AUTH_ERROR])
         assert failure_count == 2
     
+    def test_retry_delay_decorrelated_jitter(self):
+        """Test retry delays stay within the decorrelated jitter bounds"""
+        tester = EndpointTester(
+            base_url="https://example.com",
+            retry_policy=ExponentialBackoff(base_delay=1.0, max_delay=5.0, max_attempts=5),
+        )
+        
+        prev_delay = 1.0
+        for attempt in range(20):
+            delay = tester._retry_delay(attempt, prev_delay)
+            assert 1.0 <= delay <= min(5.0, prev_delay * 3)
+            prev_delay = delay
+    
+    def test_retry_delay_without_jitter(self):
+        """Test policies without jitter keep deterministic backoff"""
+        policy = ExponentialBackoff(base_delay=1.0, max_delay=30.0, jitter=False)
+        tester = EndpointTester(base_url="https://example.com", retry_policy=policy)
+        
+        assert tester._retry_delay(2, prev_delay=1.0) == 4.0
+    
+    def test_connection_pool_sized_from_concurrency(self):
+        """Test pool limits follow max_concurrent unless set explicitly"""
+        default = EndpointTester(base_url="https://example.com")
+        busy = EndpointTester(base_url="https://example.com", max_concurrent=40)
+        explicit = EndpointTester(
+            base_url="https://example.com",
+            max_concurrent=40,
+            max_keepalive_connections=5,
+            max_connections=8,
+        )
+        
+        assert default._client_limits.max_keepalive_connections == 20
+        assert default._client_limits.max_connections == 50
+        assert busy._client_limits.max_keepalive_connections == 40
+        assert busy._client_limits.max_connections == 80
+        assert explicit._client_limits.max_keepalive_connections == 5
+        assert explicit._client_limits.max_connections == 8
+    
+    @pytest.mark.asyncio
+    async def test_shared_client_created_once(self):
+        """Test the HTTP client is created on entry and reused with per-test timeouts"""
+        endpoint = Endpoint(method="GET", path="/api/health")
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        
+        async with EndpointTester(base_url="https://example.com", timeout_seconds=30) as tester:
+            client = tester._http_client
+            assert client is not None
+            
+            with patch.object(httpx.AsyncClient, 'get', return_value=mock_response) as mock_get:
+                await tester.test_endpoint(endpoint)
+                await tester.test_endpoint(endpoint, timeout_seconds=5)
+            
+            assert tester._http_client is client
+            assert [call.kwargs["timeout"] for call in mock_get.call_args_list] == [30, 5]
+        
+        assert tester._http_client is None
+    
+    def test_http2_enabled_when_available(self, monkeypatch):
+        """Test the shared client negotiates HTTP/2 only when h2 is installed"""
+        tester = EndpointTester(base_url="https://example.com")
+        
+        for available in (True, False):
+            monkeypatch.setattr(endpoint_tester, "HTTP2_AVAILABLE", available)
+            with patch('httpx.AsyncClient') as mock_client_class:
+                tester._open_client()
+            
+            assert mock_client_class.call_args.kwargs['http2'] is available
+    
+    @pytest.mark.asyncio
+    async def test_test_multiple_endpoints_bounded_and_ordered(self):
+        """Test at most max_concurrent tests run at once and results keep input order"""
+        endpoints = [Endpoint(method="GET", path=f"/api/{i}") for i in range(12)]
+        tester = EndpointTester(base_url="https://example.com", max_concurrent=3)
+        
+        live = 0
+        peak = 0
+        
+        async def fake_test_endpoint(endpoint, expected_status_codes=None, timeout_seconds=None):
+            nonlocal live, peak
+            live += 1
+            peak = max(peak, live)
+            await asyncio.sleep(0.001 * (12 - int(endpoint.path.rsplit("/", 1)[1])))
+            live -= 1
+            return TestResult(endpoint=endpoint, status=TestStatus.SUCCESS)
+        
+        with patch.object(tester, 'test_endpoint', side_effect=fake_test_endpoint):
+            results = await tester.test_multiple_endpoints(endpoints)
+        
+        assert peak == 3
+        assert [r.endpoint for r in results] == endpoints
+    
+    def test_body_preview_decodes_prefix_only(self):
+        """Test verbose body previews match the decoded text prefix"""
+        body = "caf\u00e9 " * 500
+        response = httpx.Response(200, content=body.encode("utf-8"), headers={"content-type": "text/plain; charset=utf-8"})
+        
+        assert endpoint_tester._body_preview(response) == body[:200]
+        assert endpoint_tester._body_preview(httpx.Response(204)) == "(empty)"
+    
+    @pytest.mark.asyncio
+    async def test_auth_header_prepared_once(self):
+        """Test authenticated tests share one prepared Authorization header"""
+        tester = EndpointTester(base_url="https://example.com", auth_token="tok")
+        endpoints = [
+            Endpoint(method="GET", path="/api/secure", requires_auth=True),
+            Endpoint(method="GET", path="/api/secure2", requires_auth=True),
+            Endpoint(method="GET", path="/health", requires_auth=False),
+        ]
+        
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        seen_headers = []
+        
+        async def capture(*args, **kwargs):
+            seen_headers.append(kwargs['headers'])
+            return mock_response
+        
+        with patch.object(httpx.AsyncClient, 'get', side_effect=capture):
+            for endpoint in endpoints:
+                await tester.test_endpoint(endpoint)
+        
+        assert seen_headers[0] == {'Authorization': 'Bearer tok'}
+        assert seen_headers[0] is seen_headers[1]
+        assert seen_headers[2] == {}
+    
+    @pytest.mark.asyncio
+    async def test_timeout_status_follows_exception_type(self):
+        """Test final status comes from the exception type, not its message"""
+        endpoint = Endpoint(method="GET", path="/api/slow")
+        policy = ExponentialBackoff(base_delay=0.01, max_delay=0.01, max_attempts=1)
+        tester = EndpointTester(base_url="https://example.com", retry_policy=policy)
+        
+        with patch.object(httpx.AsyncClient, 'get', side_effect=httpx.ReadTimeout("")):
+            result = await tester.test_endpoint(endpoint)
+        assert result.status == TestStatus.TIMEOUT
+        
+        with patch.object(httpx.AsyncClient, 'get', side_effect=httpx.ConnectError("proxy timeout header")):
+            result = await tester.test_endpoint(endpoint)
+        assert result.status == TestStatus.FAILURE
+    
+    @pytest.mark.asyncio
+    async def test_summary_counts_logged(self, caplog):
+        """Test the run summary counts passed, failed and skipped results"""
+        import logging
+        caplog.set_level(logging.INFO)
+        endpoints = [
+            Endpoint(method="GET", path="/ok"),
+            Endpoint(method="GET", path="/broken"),
+            Endpoint(method="GET", path="/secure", requires_auth=True),
+        ]
+        tester = EndpointTester(base_url="https://example.com")
+        
+        async def respond(url, *args, **kwargs):
+            response = MagicMock()
+            response.status_code = 200 if url.endswith("/ok") else 500
+            return response
+        
+        with patch.object(httpx.AsyncClient, 'get', side_effect=respond):
+            await tester.test_multiple_endpoints(endpoints, skip_auth_endpoints=True)
+        
+        assert "Test summary: 1 passed, 1 failed, 1 skipped" in caplog.text
+    
+    @pytest.mark.asyncio
+    async def test_make_request_dispatch(self):
+        """Test methods dispatch to the client, with a JSON body only where expected"""
+        tester = EndpointTester(base_url="https://example.com")
+        client = MagicMock()
+        for attr in ("get", "post", "put", "delete", "patch", "head", "options"):
+            setattr(client, attr, AsyncMock(return_value=attr))
+        
+        assert await tester._make_request(client, "post", "u", {}, 5) == "post"
+        client.post.assert_awaited_once_with("u", headers={}, json={}, timeout=5)
+        
+        assert await tester._make_request(client, "GET", "u", {}, 5) == "get"
+        client.get.assert_awaited_once_with("u", headers={}, timeout=5)
+        
+        with pytest.raises(ValueError, match="Unsupported HTTP method"):
+            await tester._make_request(client, "TRACE", "u", {}, 5)
+    
+    @pytest.mark.asyncio
+    async def test_verbose_details_skipped_when_info_disabled(self, caplog):
+        """Test verbose response details are not built when INFO logging is off"""
+        import logging
+        caplog.set_level(logging.WARNING, logger=endpoint_tester.logger.name)
+        endpoint = Endpoint(method="GET", path="/api/users")
+        tester = EndpointTester(base_url="https://example.com", verbose=True)
+        
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        
+        with patch.object(httpx.AsyncClient, 'get', return_value=mock_response), \
+                patch.object(endpoint_tester, '_body_preview') as preview:
+            result = await tester.test_endpoint(endpoint)
+        
+        assert result.status == TestStatus.SUCCESS
+        preview.assert_not_called()
+        assert "Testing:" not in caplog.text
+    
+    @pytest.mark.asyncio
+    async def test_warm_up_before_concurrent_tests(self):
+        """Test one HEAD to the base URL warms the pool before fan-out"""
+        endpoints = [Endpoint(method="GET", path=f"/api/{i}") for i in range(3)]
+        tester = EndpointTester(base_url="https://example.com/", warm_up_connections=True)
+        
+        calls = []
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        
+        async def head(url, **kwargs):
+            calls.append(("HEAD", url))
+            raise httpx.ConnectError("unreachable")
+        
+        async def get(url, **kwargs):
+            calls.append(("GET", url))
+            return mock_response
+        
+        with patch.object(httpx.AsyncClient, 'head', side_effect=head), \
+                patch.object(httpx.AsyncClient, 'get', side_effect=get):
+            results = await tester.test_multiple_endpoints(endpoints)
+            assert calls[0] == ("HEAD", "https://example.com")
+            assert len(calls) == 4
+            
+            # A single endpoint, or warm-up disabled, sends no extra request
+            calls.clear()
+            await tester.test_multiple_endpoints(endpoints[:1])
+            tester.warm_up_connections = False
+            await tester.test_multiple_endpoints(endpoints)
+            assert all(method == "GET" for method, _ in calls)
+        
+        assert all(r.status == TestStatus.SUCCESS for r in results)
+    
+    @pytest.mark.asyncio
+    async def test_direct_calls_bounded_by_max_concurrent(self):
+        """Test concurrent test_endpoint calls outside the batch API are limited"""
+        endpoints = [Endpoint(method="GET", path=f"/api/{i}") for i in range(5)]
+        tester = EndpointTester(base_url="https://example.com", max_concurrent=2)
+        
+        in_flight = 0
+        peak = 0
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        
+        async def get(url, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return mock_response
+        
+        with patch.object(httpx.AsyncClient, 'get', side_effect=get):
+            results = await asyncio.gather(*(tester.test_endpoint(ep) for ep in endpoints))
+        
+        assert peak == 2
+        assert all(r.status == TestStatus.SUCCESS for r in results)
+    
+    @pytest.mark.asyncio
+    async def test_warm_up_off_by_default(self):
+        """Test no warm-up request is sent unless enabled"""
+        endpoints = [Endpoint(method="GET", path=f"/api/{i}") for i in range(3)]
+        tester = EndpointTester(base_url="https://example.com")
+        assert tester.warm_up_connections is False
+        
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        
+        with patch.object(httpx.AsyncClient, 'head', new_callable=AsyncMock) as head, \
+                patch.object(httpx.AsyncClient, 'get', return_value=mock_response):
+            await tester.test_multiple_endpoints(endpoints)
+        
+        head.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_warm_up_request(self):
+        """Test the warm-up HEAD targets base_url with a capped timeout"""
+        tester = EndpointTester(base_url="https://example.com/", timeout_seconds=30)
+        client = MagicMock()
+        client.head = AsyncMock(side_effect=httpx.ConnectError("unreachable"))
+        
+        # Failures are swallowed
+        await tester._warm_up(client)
+        
+        client.head.assert_awaited_once_with(
+            "https://example.com", timeout=EndpointTester.WARM_UP_TIMEOUT_SECONDS
+        )
+    
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_results_to_json(self, use_orjson, monkeypatch):
+        """Test JSON serialization matches to_dict with and without orjson"""
+        import json
+        if use_orjson and not endpoint_tester.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(endpoint_tester, "ORJSON_AVAILABLE", use_orjson)
+        
+        tester = EndpointTester(base_url="https://example.com")
+        results = [
+            TestResult(endpoint=Endpoint(method="GET", path="/café"), status=TestStatus.SUCCESS,
+                       status_code=200, response_time_ms=12.5),
+            TestResult(endpoint=Endpoint(method="POST", path="/api"), status=TestStatus.TIMEOUT,
+                       error_message="Request timeout", retry_count=3),
+        ]
+        
+        assert json.loads(results[1].to_json_bytes()) == results[1].to_dict()
+        assert json.loads(tester.results_to_json(results)) == [r.to_dict() for r in results]
+        assert "café".encode() in tester.results_to_json(results)
+    
+    def test_test_result_uses_slots(self):
+        """Test results carry no per-instance __dict__"""
+        result = TestResult(endpoint=Endpoint(method="GET", path="/"), status=TestStatus.SUCCESS)
+        
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.unknown_field = 1
+    
     def test_get_failed_results(self):
         """Test filtering failed results"""
         results = [
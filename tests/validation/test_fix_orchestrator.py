@@ -10,6 +10,7 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch, AsyncMock
 import subprocess
 
+from specify_cli.validation import fix_orchestrator
 from specify_cli.validation.fix_orchestrator import (
     FixOrchestrator, ErrorCategory, FixStrategy, FixAttempt
 )
@@ -161,6 +162,40 @@ class TestFixOrchestrator:
         assert ErrorCategory.DEPENDENCY_ISSUE in classifications
         assert len(classifications[ErrorCategory.DEPENDENCY_ISSUE]) == 2
     
+    @pytest.mark.parametrize("use_automaton", [True, False])
+    def test_classify_deployment_error_priority(self, use_automaton, tmp_path, monkeypatch):
+        """Test deployment errors take the first matching category in priority order"""
+        if use_automaton and not fix_orchestrator.AHOCORASICK_AVAILABLE:
+            pytest.skip("pyahocorasick not installed")
+        if not use_automaton:
+            monkeypatch.setattr(fix_orchestrator, "_DEPLOYMENT_ERROR_AUTOMATON", None)
+        fix_orchestrator._classify_deployment_error_cached.cache_clear()
+        orchestrator = FixOrchestrator(project_root=tmp_path)
+        
+        cases = {
+            "Network timeout while validating the Bicep schema": ErrorCategory.TEMPLATE_ISSUE,
+            "Parameter refers to a resource that does not exist": ErrorCategory.DEPENDENCY_ISSUE,
+            "Invalid value for AppSetting": ErrorCategory.CONFIGURATION_ISSUE,
+            "Connection reset by peer": ErrorCategory.NETWORK_ISSUE,
+            "AuthorizationFailed: client lacks PERMISSION": ErrorCategory.AUTH_ERROR,
+            "Quota exceeded": ErrorCategory.UNKNOWN,
+        }
+        for message, expected in cases.items():
+            assert orchestrator._classify_deployment_error(message) == expected, message
+    
+    def test_classify_deployment_error_cached(self, tmp_path):
+        """Test repeated deployment errors are classified once"""
+        orchestrator = FixOrchestrator(project_root=tmp_path)
+        classify = fix_orchestrator._classify_deployment_error_cached
+        classify.cache_clear()
+        
+        errors = ["InvalidTemplate: The template is invalid"] * 5
+        classifications = orchestrator._classify_errors([], errors)
+        
+        assert len(classifications[ErrorCategory.TEMPLATE_ISSUE]) == 5
+        assert classify.cache_info().misses == 1
+        assert classify.cache_info().hits == 4
+    
     def test_select_fix_strategy_timeout(self, tmp_path):
         """Test fix strategy selection for timeout errors"""
         orchestrator = FixOrchestrator(project_root=tmp_path)
@@ -182,6 +217,14 @@ class TestFixOrchestrator:
         strategy = orchestrator._select_fix_strategy(ErrorCategory.DEPENDENCY_ISSUE)
         assert strategy == FixStrategy.UPDATE_DEPENDENCIES
     
+    def test_strategy_tables_cover_all_categories(self, tmp_path):
+        """Test every category has a strategy and every handler exists"""
+        orchestrator = FixOrchestrator(project_root=tmp_path)
+        
+        assert set(fix_orchestrator._STRATEGY_MAP) == set(ErrorCategory)
+        for handler in fix_orchestrator._STRATEGY_HANDLERS.values():
+            assert callable(getattr(orchestrator, handler))
+    
     @patch('subprocess.run')
     def test_fix_template_issue_success(self, mock_subprocess, tmp_path):
         """Test successful template fix via /speckit.bicep"""
@@ -224,6 +267,42 @@ class TestFixOrchestrator:
         assert orchestrator.fix_attempts[0].error_message is not None
         assert "Fix failed" in orchestrator.fix_attempts[0].error_message
     
+    @pytest.mark.asyncio
+    async def test_fix_template_issue_async_subprocess(self, tmp_path):
+        """Test template fix runs /speckit.bicep without blocking the event loop"""
+        orchestrator = FixOrchestrator(project_root=tmp_path)
+        
+        process = MagicMock(returncode=1)
+        process.communicate = AsyncMock(return_value=(b"", b"Fix failed"))
+        with patch('asyncio.create_subprocess_exec', AsyncMock(return_value=process)) as create:
+            assert await orchestrator.fix_template_issue("Invalid template") is False
+        
+        assert create.call_args.args == ("specify", "bicep", "--issue", "Invalid template")
+        assert create.call_args.kwargs["cwd"] == tmp_path
+        
+        process.returncode = 0
+        with patch('asyncio.create_subprocess_exec', AsyncMock(return_value=process)):
+            assert await orchestrator.fix_template_issue("Invalid template") is True
+    
+    @pytest.mark.asyncio
+    async def test_fix_template_issue_timeout_kills_process(self, tmp_path, monkeypatch):
+        """Test a template fix that exceeds the timeout is killed"""
+        import asyncio
+        monkeypatch.setattr(fix_orchestrator, "TEMPLATE_FIX_TIMEOUT_SECONDS", 0.01)
+        orchestrator = FixOrchestrator(project_root=tmp_path)
+        
+        async def hang():
+            await asyncio.sleep(10)
+        
+        process = MagicMock(returncode=None)
+        process.communicate = hang
+        process.wait = AsyncMock(return_value=-9)
+        with patch('asyncio.create_subprocess_exec', AsyncMock(return_value=process)):
+            assert await orchestrator.fix_template_issue("Invalid template") is False
+        
+        process.kill.assert_called_once()
+        process.wait.assert_awaited_once()
+    
     @pytest.mark.asyncio
     async def test_attempt_fix_with_mixed_errors(self, tmp_path):
         """Test fix attempt with multiple error types"""
@@ -249,6 +328,54 @@ class TestFixOrchestrator:
         # Check that different error categories were identified
         assert result is not None  # Returns bool, not list
     
+    @pytest.mark.asyncio
+    async def test_dispatch_fixes_runs_categories_concurrently(self, tmp_path):
+        """Test different strategies overlap while a shared strategy runs serially"""
+        import asyncio
+        orchestrator = FixOrchestrator(project_root=tmp_path)
+        running = {"template": 0, "max_template": 0}
+        config_started = asyncio.Event()
+        
+        async def fix_template(messages):
+            running["template"] += 1
+            running["max_template"] = max(running["max_template"], running["template"])
+            # Only completes if the configuration fix runs at the same time
+            await asyncio.wait_for(config_started.wait(), timeout=1)
+            await asyncio.sleep(0)
+            running["template"] -= 1
+            return True
+        
+        async def fix_configuration(messages):
+            config_started.set()
+            return False
+        
+        classifications = {
+            ErrorCategory.SERVER_ERROR: ["500"],
+            ErrorCategory.TEMPLATE_ISSUE: ["InvalidTemplate"],
+            ErrorCategory.CONFIGURATION_ISSUE: ["Invalid value"],
+        }
+        with patch.object(orchestrator, '_fix_template_issues', side_effect=fix_template), \
+                patch.object(orchestrator, '_fix_configuration_issues', side_effect=fix_configuration):
+            result = await orchestrator._dispatch_fixes(classifications)
+        
+        assert result is False
+        assert running["max_template"] == 1
+        assert [a.error_category for a in orchestrator.fix_attempts] == list(classifications)
+        assert [a.success for a in orchestrator.fix_attempts] == [True, True, False]
+    
+    @pytest.mark.asyncio
+    async def test_dispatch_fixes_with_sync_handlers(self, tmp_path):
+        """Test strategies without I/O are applied without awaiting a handler"""
+        orchestrator = FixOrchestrator(project_root=tmp_path)
+        
+        result = await orchestrator._dispatch_fixes({
+            ErrorCategory.DEPENDENCY_ISSUE: ["resource not found"],
+            ErrorCategory.NETWORK_ISSUE: ["connection reset"],
+        })
+        
+        assert result is False
+        assert [a.success for a in orchestrator.fix_attempts] == [False, True]
+    
     def test_get_fix_summary(self, tmp_path):
         """Test fix summary generation"""
         orchestrator = FixOrchestrator(project_root=tmp_path)
@@ -282,6 +409,108 @@ class TestFixOrchestrator:
         assert ErrorCategory.TEMPLATE_ISSUE.value in summary["by_category"]
         assert ErrorCategory.TIMEOUT.value in summary["by_category"]
     
+    def test_fix_summary_counts(self, tmp_path):
+        """Test fix summary counts and lists attempts in order"""
+        orchestrator = FixOrchestrator(project_root=tmp_path)
+        orchestrator.fix_attempts = [
+            FixAttempt(ErrorCategory.TEMPLATE_ISSUE, FixStrategy.UPDATE_TEMPLATE, "Fix template", True),
+            FixAttempt(ErrorCategory.UNKNOWN, FixStrategy.MANUAL_INTERVENTION, "Manual", False),
+            FixAttempt(ErrorCategory.TIMEOUT, FixStrategy.RETRY, "Retry", True),
+        ]
+        
+        summary = orchestrator.get_fix_summary()
+        
+        assert summary["total_attempts"] == 3
+        assert summary["successful_fixes"] == 2
+        assert summary["failed_fixes"] == 1
+        assert summary["circuit_breaker_open"] is False
+        assert [a["category"] for a in summary["attempts"]] == ["template_issue", "unknown", "timeout"]
+        assert summary["attempts"][1] == {
+            "category": "unknown",
+            "strategy": "manual_intervention",
+            "description": "Manual",
+            "success": False,
+        }
+    
+    @pytest.mark.asyncio
+    async def test_fix_summary_counts_recorded_attempts(self, tmp_path):
+        """Test success counts follow recorded attempts and circuit breaker resets"""
+        orchestrator = FixOrchestrator(project_root=tmp_path)
+        
+        await orchestrator._dispatch_fixes({
+            ErrorCategory.TIMEOUT: ["Endpoint timeout"],
+            ErrorCategory.UNKNOWN: ["Quota exceeded"],
+        })
+        summary = orchestrator.get_fix_summary()
+        assert (summary["successful_fixes"], summary["failed_fixes"]) == (1, 1)
+        
+        orchestrator.reset_circuit_breaker()
+        summary = orchestrator.get_fix_summary()
+        assert (summary["total_attempts"], summary["successful_fixes"]) == (0, 0)
+    
+    def test_fix_summary_counts_appended_attempts(self, tmp_path):
+        """Test attempts appended to fix_attempts directly are counted"""
+        orchestrator = FixOrchestrator(project_root=tmp_path)
+        
+        orchestrator.fix_attempts.append(FixAttempt(
+            error_category=ErrorCategory.TIMEOUT,
+            fix_strategy=FixStrategy.RETRY,
+            description="Retried",
+            success=True,
+        ))
+        orchestrator.fix_attempts.append(FixAttempt(
+            error_category=ErrorCategory.UNKNOWN,
+            fix_strategy=FixStrategy.MANUAL_INTERVENTION,
+            description="Manual",
+            success=False,
+        ))
+        
+        summary = orchestrator.get_fix_summary()
+        assert (summary["total_attempts"], summary["successful_fixes"], summary["failed_fixes"]) == (2, 1, 1)
+    
+    def test_fix_summary_counts_only_new_attempts(self, tmp_path):
+        """Test later summaries count appended attempts without rescanning old ones"""
+        read = []
+        
+        class ReadTrackingList(list):
+            def __getitem__(self, index):
+                read.append(index)
+                return super().__getitem__(index)
+        
+        orchestrator = FixOrchestrator(project_root=tmp_path)
+        orchestrator.fix_attempts = ReadTrackingList(
+            FixAttempt(ErrorCategory.TIMEOUT, FixStrategy.RETRY, "Retried", success=True)
+            for _ in range(3)
+        )
+        assert orchestrator.get_fix_summary()["successful_fixes"] == 3
+        
+        read.clear()
+        orchestrator.fix_attempts.append(
+            FixAttempt(ErrorCategory.UNKNOWN, FixStrategy.MANUAL_INTERVENTION, "Manual", success=False)
+        )
+        summary = orchestrator.get_fix_summary()
+        assert (summary["total_attempts"], summary["successful_fixes"], summary["failed_fixes"]) == (4, 3, 1)
+        assert read == [3]
+        
+        # A shortened or replaced list is recounted from scratch
+        orchestrator.fix_attempts.pop(0)
+        assert orchestrator.get_fix_summary()["successful_fixes"] == 2
+        orchestrator.fix_attempts = orchestrator.fix_attempts[2:]
+        assert orchestrator.get_fix_summary()["failed_fixes"] == 1
+    
+    def test_fix_attempt_uses_slots(self):
+        """Test fix attempts carry no per-instance __dict__ and still pickle"""
+        import pickle
+        attempt = FixAttempt(
+            error_category=ErrorCategory.TIMEOUT,
+            fix_strategy=FixStrategy.RETRY,
+            description="Retry",
+            success=True,
+        )
+        
+        assert not hasattr(attempt, "__dict__")
+        assert pickle.loads(pickle.dumps(attempt)) == attempt
+    
     def test_empty_fix_summary(self, tmp_path):
         """Test fix summary with no attempts"""
         orchestrator = FixOrchestrator(project_root=tmp_path)
@@ -0,0 +1,66 @@
+"""
+Unit tests for input_validator.py
+
+Tests the regex pattern guardrails used for endpoint path filters.
+"""
+
+import pytest
+
+from specify_cli.validation.input_validator import (
+    InputValidator,
+    ValidationError,
+    MAX_REGEX_PATTERN_LENGTH,
+)
+
+
+class TestValidateRegexPattern:
+    """Test InputValidator.validate_regex_pattern"""
+
+    @pytest.mark.parametrize("pattern", [
+        r"^/api/.*",
+        r"/users/(\d+)$",
+        r"(/\w+)+",
+        r"^/api(/v\d+)+/users$",
+        r"\w+(\.\w+)*",
+        r"(x(a+))+",
+        r"(GET|POST)+",
+        r"(\d+){1,3}",
+        r"(?i)^/api(/\w+)*",
+    ])
+    def test_delimited_repetition_accepted(self, pattern):
+        """Test that groups starting each repetition with a delimiter are accepted"""
+        assert InputValidator.validate_regex_pattern(pattern) == pattern
+
+    @pytest.mark.parametrize("pattern", [
+        r"(.+)+",
+        r"(\w*)*",
+        r"(?:a+)+",
+        r"((a+))+",
+        r"([a-z]+)*",
+        r"(a*){2,}",
+        r"(?P<segment>[^/]+)+",
+        r"(a|aa)+",
+        r"(a|a)*b",
+        r"(\w+\s?)+",
+        r"(x+x+)+y",
+        r"(x\w+)+",
+    ])
+    def test_nested_unbounded_quantifier_rejected(self, pattern):
+        """Test that repeated groups that can split text several ways are rejected"""
+        with pytest.raises(ValidationError, match="nested unbounded quantifiers"):
+            InputValidator.validate_regex_pattern(pattern)
+
+    def test_empty_pattern_returns_none(self):
+        """Test that no pattern means no filter"""
+        assert InputValidator.validate_regex_pattern(None) is None
+        assert InputValidator.validate_regex_pattern("") is None
+
+    def test_pattern_too_long_rejected(self):
+        """Test the pattern length cap"""
+        with pytest.raises(ValidationError, match="too long"):
+            InputValidator.validate_regex_pattern("a" * (MAX_REGEX_PATTERN_LENGTH + 1))
+
+    def test_invalid_regex_rejected(self):
+        """Test that patterns that don't compile are rejected"""
+        with pytest.raises(ValidationError, match="Invalid regex pattern"):
+            InputValidator.validate_regex_pattern(r"/api/(unclosed")
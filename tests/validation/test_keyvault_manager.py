@@ -4,12 +4,31 @@ Unit tests for keyvault_manager module.
 Tests Key Vault secret management with mocked Azure SDK.
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
-from azure.core.exceptions import ResourceNotFoundError, AzureError
+from azure.core.exceptions import ResourceNotFoundError, AzureError, HttpResponseError
 
 from specify_cli.validation import KeyVaultError, AppSetting, SourceType
+from specify_cli.validation import keyvault_manager
 from specify_cli.validation.keyvault_manager import KeyVaultManager
+from specify_cli.utils.retry_policies import ExponentialBackoff
+
+
+def _http_error(status_code, headers=None):
+    """Build an HttpResponseError carrying the given status and headers."""
+    response = Mock(status_code=status_code, headers=headers or {}, reason="error")
+    response.text.return_value = ""
+    return HttpResponseError(message=f"HTTP {status_code}", response=response)
+
+
+@pytest.fixture(autouse=True)
+def clear_client_pool():
+    """Keep pooled clients from leaking between tests."""
+    keyvault_manager._CLIENT_POOL.clear()
+    yield
+    keyvault_manager._CLIENT_POOL.clear()
 
 
 @pytest.fixture
@@ -147,6 +166,112 @@ class TestKeyVaultManager:
         with pytest.raises(KeyVaultError, match="Failed to get secret"):
             await manager.get_secret("test-secret")
     
+    async def test_store_secret_retries_throttling_with_retry_after(self, mock_secret_client, mock_credential):
+        """Test that a 429 is retried after the server's Retry-After delay."""
+        secret_mock = Mock()
+        secret_mock.id = "https://test-vault.vault.azure.net/secrets/test-secret/version"
+        mock_secret_client.set_secret.side_effect = [
+            _http_error(429, {"Retry-After": "2"}),
+            secret_mock,
+        ]
+        
+        manager = KeyVaultManager("https://test-vault.vault.azure.net/")
+        
+        with patch("specify_cli.validation.keyvault_manager.asyncio.sleep", new=AsyncMock()) as sleep:
+            secret_id = await manager.store_secret("test-secret", "secret-value")
+        
+        assert secret_id == secret_mock.id
+        assert mock_secret_client.set_secret.call_count == 2
+        sleep.assert_awaited_once_with(2.0)
+    
+    async def test_get_secret_retries_unavailable_with_backoff(self, mock_secret_client, mock_credential):
+        """Test that a 503 without Retry-After uses the policy delay."""
+        secret_mock = Mock()
+        secret_mock.value = "secret-value"
+        mock_secret_client.get_secret.side_effect = [_http_error(503), secret_mock]
+        
+        policy = ExponentialBackoff(base_delay=0.5, max_attempts=3, jitter=False)
+        manager = KeyVaultManager("https://test-vault.vault.azure.net/", retry_policy=policy)
+        
+        with patch("specify_cli.validation.keyvault_manager.asyncio.sleep", new=AsyncMock()) as sleep:
+            value = await manager.get_secret("test-secret")
+        
+        assert value == "secret-value"
+        sleep.assert_awaited_once_with(0.5)
+    
+    async def test_retry_exhausted_raises_keyvault_error(self, mock_secret_client, mock_credential):
+        """Test that throttling past max_attempts surfaces as KeyVaultError."""
+        mock_secret_client.begin_delete_secret.side_effect = _http_error(429)
+        
+        policy = ExponentialBackoff(base_delay=0.01, max_attempts=3, jitter=False)
+        manager = KeyVaultManager("https://test-vault.vault.azure.net/", retry_policy=policy)
+        
+        with patch("specify_cli.validation.keyvault_manager.asyncio.sleep", new=AsyncMock()) as sleep:
+            with pytest.raises(KeyVaultError, match="Failed to delete secret"):
+                await manager.delete_secret("test-secret")
+        
+        assert mock_secret_client.begin_delete_secret.call_count == 3
+        assert sleep.await_count == 2
+    
+    async def test_non_retryable_error_is_not_retried(self, mock_secret_client, mock_credential):
+        """Test that non-throttling HTTP errors fail on the first attempt."""
+        mock_secret_client.set_secret.side_effect = _http_error(403)
+        
+        manager = KeyVaultManager("https://test-vault.vault.azure.net/")
+        
+        with pytest.raises(KeyVaultError, match="Failed to store secret"):
+            await manager.store_secret("test-secret", "secret-value")
+        
+        assert mock_secret_client.set_secret.call_count == 1
+    
+    async def test_get_secret_served_from_cache(self, mock_secret_client, mock_credential):
+        """Test that repeated reads within the TTL hit the vault once."""
+        manager = KeyVaultManager("https://test-vault.vault.azure.net/")
+        
+        assert await manager.get_secret("test-secret") == "secret-value"
+        assert await manager.get_secret("TEST_SECRET") == "secret-value"
+        
+        mock_secret_client.get_secret.assert_called_once_with("test-secret")
+    
+    async def test_get_secret_cache_expires(self, mock_secret_client, mock_credential):
+        """Test that an expired cache entry is fetched again."""
+        manager = KeyVaultManager("https://test-vault.vault.azure.net/")
+        manager.SECRET_CACHE_TTL_SECONDS = 0
+        
+        await manager.get_secret("test-secret")
+        await manager.get_secret("test-secret")
+        
+        assert mock_secret_client.get_secret.call_count == 2
+    
+    async def test_get_secret_concurrent_reads_coalesce(self, mock_secret_client, mock_credential):
+        """Test that concurrent readers of one secret share a single request."""
+        async def get_secret_side_effect(name):
+            await asyncio.sleep(0.01)
+            secret_mock = Mock()
+            secret_mock.value = f"value-of-{name}"
+            return secret_mock
+        
+        mock_secret_client.get_secret.side_effect = get_secret_side_effect
+        
+        manager = KeyVaultManager("https://test-vault.vault.azure.net/")
+        
+        values = await asyncio.gather(*(manager.get_secret("test-secret") for _ in range(5)))
+        
+        assert values == ["value-of-test-secret"] * 5
+        mock_secret_client.get_secret.assert_called_once()
+    
+    async def test_store_and_delete_invalidate_cache(self, mock_secret_client, mock_credential):
+        """Test that writes and deletes drop the cached value."""
+        manager = KeyVaultManager("https://test-vault.vault.azure.net/")
+        
+        await manager.get_secret("test-secret")
+        await manager.store_secret("test-secret", "new-value")
+        await manager.get_secret("test-secret")
+        await manager.delete_secret("test-secret")
+        await manager.get_secret("test-secret")
+        
+        assert mock_secret_client.get_secret.call_count == 3
+    
     async def test_store_multiple_secrets(self, mock_secret_client, mock_credential):
         """Test storing multiple secrets in parallel."""
         manager = KeyVaultManager("https://test-vault.vault.azure.net/")
@@ -185,6 +310,88 @@ class TestKeyVaultManager:
         with pytest.raises(KeyVaultError, match="Failed to store multiple secrets"):
             await manager.store_multiple_secrets(secrets)
     
+    async def test_store_multiple_secrets_bounded_concurrency(self, mock_secret_client, mock_credential):
+        """Test that parallel writes never exceed max_parallel_writes."""
+        in_flight = [0]
+        peak = [0]
+        
+        async def set_secret_side_effect(*args, **kwargs):
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0.01)
+            in_flight[0] -= 1
+            secret_mock = Mock()
+            secret_mock.id = f"https://vault/secrets/{kwargs['name']}"
+            return secret_mock
+        
+        mock_secret_client.set_secret.side_effect = set_secret_side_effect
+        
+        manager = KeyVaultManager("https://test-vault.vault.azure.net/", max_parallel_writes=2)
+        
+        secrets = {f"secret{i}": f"value{i}" for i in range(6)}
+        result = await manager.store_multiple_secrets(secrets)
+        
+        assert len(result) == 6
+        assert peak[0] == 2
+    
+    async def test_store_multiple_secrets_in_batches(self, mock_secret_client, mock_credential):
+        """Test that secrets are submitted batch by batch and all results kept."""
+        in_flight = [0]
+        peak = [0]
+        
+        async def set_secret_side_effect(*args, **kwargs):
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0)
+            in_flight[0] -= 1
+            secret_mock = Mock()
+            secret_mock.id = f"https://vault/secrets/{kwargs['name']}"
+            return secret_mock
+        
+        mock_secret_client.set_secret.side_effect = set_secret_side_effect
+        
+        manager = KeyVaultManager("https://test-vault.vault.azure.net/", max_parallel_writes=100)
+        manager.STORE_BATCH_SIZE = 4
+        
+        secrets = {f"secret{i}": f"value{i}" for i in range(10)}
+        result = await manager.store_multiple_secrets(secrets)
+        
+        assert result == {name: f"https://vault/secrets/{name}" for name in secrets}
+        assert peak[0] == 4
+    
+    async def test_store_multiple_secrets_deduplicates_formatted_names(self, mock_secret_client, mock_credential):
+        """Test that names formatting to one secret are written once."""
+        manager = KeyVaultManager("https://test-vault.vault.azure.net/")
+        
+        secrets = {"API_KEY": "old", "api-key": "new", "Other": "value"}
+        result = await manager.store_multiple_secrets(secrets)
+        
+        assert set(result) == set(secrets)
+        assert result["API_KEY"] == result["api-key"]
+        assert mock_secret_client.set_secret.call_count == 2
+        stored = {c.kwargs["name"]: c.kwargs["value"] for c in mock_secret_client.set_secret.call_args_list}
+        assert stored == {"api-key": "new", "other": "value"}
+    
+    async def test_store_multiple_secrets_failure_does_not_cancel_peers(self, mock_secret_client, mock_credential):
+        """Test that one failed write lets the others finish and is reported."""
+        async def set_secret_side_effect(*args, **kwargs):
+            if kwargs["name"] == "secret2":
+                raise AzureError("Throttled")
+            secret_mock = Mock()
+            secret_mock.id = f"https://vault/secrets/{kwargs['name']}"
+            return secret_mock
+        
+        mock_secret_client.set_secret.side_effect = set_secret_side_effect
+        
+        manager = KeyVaultManager("https://test-vault.vault.azure.net/")
+        
+        secrets = {"secret1": "value1", "secret2": "value2", "secret3": "value3"}
+        
+        with pytest.raises(KeyVaultError, match=r"1 of 3 failed\): secret2"):
+            await manager.store_multiple_secrets(secrets)
+        
+        assert mock_secret_client.set_secret.call_count == 3
+    
     async def test_store_app_settings_secure_only(self, mock_secret_client, mock_credential, sample_app_settings):
         """Test storing only secure app settings."""
         manager = KeyVaultManager("https://test-vault.vault.azure.net/")
@@ -225,6 +432,15 @@ class TestKeyVaultManager:
         assert "test-vault" in reference
         assert "SecretName=mysecret" in reference  # Should be lowercase
     
+    async def test_build_app_setting_reference_uses_vault_name_from_init(self, mock_secret_client, mock_credential):
+        """Test that the vault name is resolved once at construction."""
+        manager = KeyVaultManager("https://test-vault.vault.azure.net/")
+        
+        with patch.object(manager, "_extract_vault_name", side_effect=AssertionError):
+            ref = manager.build_app_setting_reference("ApiKey")
+        
+        assert ref == "@Microsoft.KeyVault(VaultName=test-vault;SecretName=apikey)"
+    
     async def test_format_secret_name_basic(self, mock_secret_client, mock_credential):
         """Test basic secret name formatting."""
         manager = KeyVaultManager("https://test-vault.vault.azure.net/")
@@ -276,6 +492,25 @@ class TestKeyVaultManager:
         assert not formatted.startswith("-")
         assert not formatted.endswith("-")
     
+    async def test_format_secret_name_unicode_lowercases_to_valid(self, mock_secret_client, mock_credential):
+        """Test that non-ASCII characters lowercasing to ASCII are kept."""
+        manager = KeyVaultManager("https://test-vault.vault.azure.net/")
+        
+        assert manager._format_secret_name("İd_Ünïcode:Key") == "id-ncode--key"
+    
+    async def test_format_secret_name_is_memoized(self, mock_secret_client, mock_credential):
+        """Test that formatting the same name twice reuses the cached result."""
+        keyvault_manager._format_secret_name_cached.cache_clear()
+        manager = KeyVaultManager("https://test-vault.vault.azure.net/")
+        
+        await manager.store_app_settings([
+            AppSetting("s1", "ApiKey", "value", SourceType.HARDCODED, True, "test")
+        ])
+        
+        info = keyvault_manager._format_secret_name_cached.cache_info()
+        assert info.misses == 1
+        assert info.hits >= 1
+    
     async def test_extract_vault_name(self, mock_secret_client, mock_credential):
         """Test extracting vault name from URL."""
         manager = KeyVaultManager("https://test-vault.vault.azure.net/")
@@ -291,6 +526,12 @@ class TestKeyVaultManager:
         manager2 = KeyVaultManager("https://prod-vault.vault.azure.net")
         assert manager2._extract_vault_name() == "prod-vault"
     
+    async def test_extract_vault_name_edge_cases(self, mock_secret_client, mock_credential):
+        """Test vault name extraction with ports, paths and missing schemes."""
+        assert KeyVaultManager("https://kv-01.vault.azure.net:443/secrets/x")._extract_vault_name() == "kv-01"
+        assert KeyVaultManager("https://cn-vault.vault.azure.cn")._extract_vault_name() == "cn-vault"
+        assert KeyVaultManager("kv-01.vault.azure.net")._extract_vault_name() == "unknown"
+    
     async def test_delete_secret_success(self, mock_secret_client, mock_credential):
         """Test deleting a secret successfully."""
         manager = KeyVaultManager("https://test-vault.vault.azure.net/")
@@ -334,6 +575,93 @@ class TestKeyVaultManager:
         
         mock_secret_client.close.assert_called_once()
         mock_credential.close.assert_called_once()
+    
+    async def test_managers_share_client_per_vault(self, mock_secret_client, mock_credential):
+        """Test that managers for one vault share a client and credential."""
+        with patch("specify_cli.validation.keyvault_manager.SecretClient") as client_cls, \
+                patch("specify_cli.validation.keyvault_manager.DefaultAzureCredential") as cred_cls:
+            client_cls.side_effect = lambda **kwargs: AsyncMock()
+            cred_cls.side_effect = lambda: AsyncMock()
+            
+            first = KeyVaultManager("https://test-vault.vault.azure.net/")
+            second = KeyVaultManager("https://test-vault.vault.azure.net/")
+            other = KeyVaultManager("https://other-vault.vault.azure.net/")
+        
+        assert first.client is second.client
+        assert first.credential is second.credential
+        assert other.client is not first.client
+        assert client_cls.call_count == 2
+        assert cred_cls.call_count == 2
+    
+    async def test_shared_client_closed_by_last_manager(self, mock_secret_client, mock_credential):
+        """Test that the shared client stays open until every manager closes."""
+        first = KeyVaultManager("https://test-vault.vault.azure.net/")
+        second = KeyVaultManager("https://test-vault.vault.azure.net/")
+        
+        await first.close()
+        await first.close()
+        mock_secret_client.close.assert_not_called()
+        
+        await second.close()
+        mock_secret_client.close.assert_called_once()
+        mock_credential.close.assert_called_once()
+        
+        # A later manager gets a fresh client
+        third = KeyVaultManager("https://test-vault.vault.azure.net/")
+        assert keyvault_manager._CLIENT_POOL["https://test-vault.vault.azure.net/"].references == 1
+        await third.close()
+    
+    async def test_credential_warm_up_started_in_event_loop(self, mock_secret_client, mock_credential):
+        """Test that a token request for the vault's cloud starts at construction."""
+        manager = KeyVaultManager("https://test-vault.vault.azure.net/")
+        await asyncio.sleep(0)
+        
+        mock_credential.get_token.assert_awaited_once_with("https://vault.azure.net/.default")
+        
+        # Managers sharing the credential don't start another one
+        KeyVaultManager("https://test-vault.vault.azure.net/")
+        await asyncio.sleep(0)
+        assert mock_credential.get_token.await_count == 1
+        await manager.close()
+    
+    async def test_store_multiple_secrets_waits_for_warm_up(self, mock_secret_client, mock_credential):
+        """Test that batch writes start only after the warm-up token arrives."""
+        events = []
+        
+        async def get_token(scope):
+            await asyncio.sleep(0.01)
+            events.append("token")
+        
+        async def set_secret(**kwargs):
+            events.append("set")
+            return Mock(id=f"https://vault/secrets/{kwargs['name']}")
+        
+        mock_credential.get_token.side_effect = get_token
+        mock_secret_client.set_secret.side_effect = set_secret
+        
+        manager = KeyVaultManager("https://test-vault.vault.azure.net/")
+        await manager.store_multiple_secrets({"a": "1", "b": "2"})
+        
+        assert events == ["token", "set", "set"]
+    
+    async def test_failed_warm_up_does_not_block_writes(self, mock_secret_client, mock_credential):
+        """Test that a warm-up failure is left for the real request to report."""
+        mock_credential.get_token.side_effect = AzureError("no credential")
+        
+        manager = KeyVaultManager("https://test-vault.vault.azure.net/")
+        result = await manager.store_multiple_secrets({"a": "1"})
+        
+        assert set(result) == {"a"}
+    
+    async def test_no_warm_up_outside_event_loop(self, mock_secret_client, mock_credential):
+        """Test that construction without a running loop skips the warm-up."""
+        import concurrent.futures
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            manager = executor.submit(KeyVaultManager, "https://test-vault.vault.azure.net/").result()
+        
+        assert manager._pooled.warm_up is None
+        mock_credential.get_token.assert_not_called()
 
 
 @pytest.mark.asyncio
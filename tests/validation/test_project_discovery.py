@@ -5,6 +5,8 @@ Tests the ProjectDiscovery class for discovering projects with Bicep templates,
 framework detection, caching, and project selection.
 """
 
+import os
+import threading
 import pytest
 from pathlib import Path
 import json
@@ -12,6 +14,7 @@ import tempfile
 import shutil
 from datetime import datetime, timedelta
 
+from specify_cli.validation import project_discovery
 from specify_cli.validation.project_discovery import ProjectDiscovery
 from specify_cli.validation import ProjectInfo, ProjectDiscoveryError
 
@@ -113,6 +116,18 @@ class TestProjectDiscovery:
         python_project = next(p for p in projects if p.name == "python-fastapi")
         assert python_project.bicep_templates_path.name == "bicep"
     
+    def test_last_modified_is_newest_bicep_file(self, tmp_path):
+        """Test that last_modified reflects the most recently changed template"""
+        bicep_path = tmp_path / "api" / "bicep"
+        bicep_path.mkdir(parents=True)
+        for name, mtime in [("main.bicep", 1000), ("storage.bicep", 3000), ("notes.txt", 9000)]:
+            (bicep_path / name).write_text("// bicep")
+            os.utime(bicep_path / name, (mtime, mtime))
+        
+        projects = ProjectDiscovery(tmp_path, use_cache=False).discover_projects()
+        
+        assert projects[0].last_modified == 3000
+    
     def test_get_project_by_name_exact_match(self, discovery):
         """Test getting project by exact name"""
         discovery.discover_projects()
@@ -187,6 +202,36 @@ class TestProjectDiscovery:
         assert len(projects) == 1
         assert projects[0].name == "cached-project"
     
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    def test_cache_round_trip(self, temp_workspace, monkeypatch, orjson_available):
+        """Test that cached projects match a fresh scan with either JSON backend"""
+        if orjson_available and not project_discovery.ORJSON_AVAILABLE:
+            pytest.skip("orjson is not installed")
+        monkeypatch.setattr(project_discovery, "ORJSON_AVAILABLE", orjson_available)
+        
+        scanned = ProjectDiscovery(temp_workspace, use_cache=True).discover_projects()
+        cached = ProjectDiscovery(temp_workspace, use_cache=True)._load_from_cache()
+        
+        assert cached == scanned
+    
+    def test_stdlib_cache_is_compact(self, temp_workspace, monkeypatch):
+        """Test that the json fallback writes the cache without indentation"""
+        monkeypatch.setattr(project_discovery, "ORJSON_AVAILABLE", False)
+        
+        ProjectDiscovery(temp_workspace, use_cache=True).discover_projects()
+        
+        raw = (temp_workspace / ".bicep-cache.json").read_text()
+        assert "\n" not in raw
+        assert ", " not in raw and '": ' not in raw
+    
+    def test_corrupted_cache_is_rescanned(self, temp_workspace):
+        """Test that an unreadable cache file falls back to scanning"""
+        (temp_workspace / ".bicep-cache.json").write_bytes(b"\x80not json")
+        
+        discovery = ProjectDiscovery(temp_workspace, use_cache=True)
+        
+        assert len(discovery.discover_projects()) == 3
+    
     def test_cache_expiry(self, temp_workspace):
         """Test that expired cache is regenerated"""
         # Create expired cache file
@@ -217,6 +262,61 @@ class TestProjectDiscovery:
         project_names = {p.name for p in projects}
         assert "cached-project" not in project_names
     
+    def test_unchanged_workspace_cache_outlives_ttl(self, temp_workspace):
+        """Test that a cache is reused past the TTL while directories are unchanged"""
+        ProjectDiscovery(temp_workspace, use_cache=True).discover_projects()
+        
+        cache_file = temp_workspace / ".bicep-cache.json"
+        cache_data = json.loads(cache_file.read_text())
+        assert cache_data["dir_mtimes"]
+        cache_data["timestamp"] -= ProjectDiscovery.CACHE_TTL + 60
+        cache_data["projects"][0]["name"] = "from-cache"
+        cache_file.write_text(json.dumps(cache_data))
+        
+        projects = ProjectDiscovery(temp_workspace, use_cache=True).discover_projects()
+        
+        assert "from-cache" in {p.name for p in projects}
+    
+    def test_new_project_invalidates_fresh_cache(self, temp_workspace):
+        """Test that adding a project is picked up even while the cache is fresh"""
+        assert len(ProjectDiscovery(temp_workspace, use_cache=True).discover_projects()) == 3
+        
+        go_path = temp_workspace / "go-api"
+        (go_path / "bicep").mkdir(parents=True)
+        (go_path / "bicep" / "main.bicep").write_text("// bicep")
+        
+        projects = ProjectDiscovery(temp_workspace, use_cache=True).discover_projects()
+        
+        assert "go-api" in {p.name for p in projects}
+    
+    def test_new_bicep_directory_invalidates_cache(self, temp_workspace):
+        """Test that adding templates to an existing project is picked up"""
+        ProjectDiscovery(temp_workspace, use_cache=True).discover_projects()
+        
+        (temp_workspace / "no-bicep" / "iac").mkdir()
+        (temp_workspace / "no-bicep" / "iac" / "main.bicep").write_text("// bicep")
+        
+        projects = ProjectDiscovery(temp_workspace, use_cache=True).discover_projects()
+        
+        assert "no-bicep" in {p.name for p in projects}
+    
+    def test_edited_template_invalidates_cache(self, temp_workspace):
+        """Test that editing a template in place is picked up while the cache is fresh"""
+        projects = ProjectDiscovery(temp_workspace, use_cache=True).discover_projects()
+        project = next(p for p in projects if p.bicep_templates_path.name == "bicep")
+        template = project.bicep_templates_path / "main.bicep"
+        bicep_dir_mtime = os.stat(project.bicep_templates_path).st_mtime_ns
+        
+        # Rewriting an existing file leaves its directory's mtime unchanged
+        template.write_text("// edited")
+        os.utime(template, (2_000_000_000, 2_000_000_000))
+        assert os.stat(project.bicep_templates_path).st_mtime_ns == bicep_dir_mtime
+        
+        projects = ProjectDiscovery(temp_workspace, use_cache=True).discover_projects()
+        
+        updated = next(p for p in projects if p.project_id == project.project_id)
+        assert updated.last_modified == 2_000_000_000
+    
     def test_clear_cache(self, temp_workspace):
         """Test that clear_cache removes cache file"""
         discovery = ProjectDiscovery(temp_workspace, use_cache=True)
@@ -244,6 +344,17 @@ class TestProjectDiscovery:
         project_names = {p.name for p in projects}
         assert "some-package" not in project_names
     
+    @pytest.mark.parametrize("excluded", ["__pycache__", "target", "dist", "build"])
+    def test_build_output_directories_ignored(self, temp_workspace, excluded):
+        """Test that build output directories are not scanned"""
+        output = temp_workspace / excluded / "generated"
+        (output / "bicep").mkdir(parents=True)
+        (output / "bicep" / "main.bicep").write_text("// bicep")
+        
+        projects = ProjectDiscovery(temp_workspace, use_cache=False).discover_projects()
+        
+        assert "generated" not in {p.name for p in projects}
+    
     def test_hidden_directories_ignored(self, temp_workspace):
         """Test that hidden directories are not scanned"""
         # Create project in .hidden directory
@@ -260,6 +371,77 @@ class TestProjectDiscovery:
         project_names = {p.name for p in projects}
         assert "project" not in project_names
     
+    def test_excluded_directories_not_entered(self, temp_workspace, monkeypatch):
+        """Test that excluded and hidden subtrees are pruned before being listed"""
+        (temp_workspace / "node_modules" / "pkg" / "deep").mkdir(parents=True)
+        (temp_workspace / ".git" / "objects").mkdir(parents=True)
+        
+        scanned = []
+        real_scandir = os.scandir
+        
+        def recording_scandir(path):
+            scanned.append(Path(path).name)
+            return real_scandir(path)
+        
+        monkeypatch.setattr(
+            "specify_cli.validation.project_discovery.os.scandir", recording_scandir
+        )
+        
+        discovery = ProjectDiscovery(temp_workspace, use_cache=False)
+        projects = discovery.discover_projects()
+        
+        assert len(projects) == 3
+        assert not {"node_modules", "pkg", "deep", ".git", "objects"} & set(scanned)
+    
+    def test_nested_hidden_directories_pruned(self, temp_workspace, monkeypatch):
+        """Test that hidden directories below a project are never listed"""
+        hidden = temp_workspace / "dotnet-api" / ".terraform" / "modules"
+        (hidden / "bicep").mkdir(parents=True)
+        (hidden / "bicep" / "main.bicep").write_text("// bicep")
+        (hidden / "Tool.csproj").write_text("<Project></Project>")
+        
+        scanned = []
+        real_scandir = os.scandir
+        
+        def recording_scandir(path):
+            scanned.append(Path(path).name)
+            return real_scandir(path)
+        
+        monkeypatch.setattr(
+            "specify_cli.validation.project_discovery.os.scandir", recording_scandir
+        )
+        
+        projects = ProjectDiscovery(temp_workspace, use_cache=False).discover_projects()
+        
+        assert "modules" not in {p.name for p in projects}
+        assert ".terraform" not in scanned
+        assert "modules" not in scanned
+    
+    def test_workspace_inside_hidden_directory(self, tmp_path):
+        """Test that only directories below the workspace root are filtered"""
+        workspace = tmp_path / ".cache" / "workspace"
+        project_path = workspace / "api"
+        (project_path / "bicep").mkdir(parents=True)
+        (project_path / "bicep" / "main.bicep").write_text("// bicep")
+        
+        discovery = ProjectDiscovery(workspace, use_cache=False)
+        projects = discovery.discover_projects()
+        
+        assert [p.name for p in projects] == ["api"]
+    
+    def test_max_depth_limits_scan(self, tmp_path):
+        """Test that Bicep directories below max_depth are not discovered"""
+        for parts in [("shallow",), ("a", "b", "deep")]:
+            project_path = tmp_path.joinpath(*parts)
+            (project_path / "bicep").mkdir(parents=True)
+            (project_path / "bicep" / "main.bicep").write_text("// bicep")
+        
+        assert [p.name for p in ProjectDiscovery(tmp_path, use_cache=False).discover_projects()] == ["deep", "shallow"]
+        
+        # "shallow/bicep" is at depth 2, "a/b/deep/bicep" at depth 4
+        discovery = ProjectDiscovery(tmp_path, use_cache=False, max_depth=3)
+        assert [p.name for p in discovery.discover_projects()] == ["shallow"]
+    
     def test_nonexistent_workspace_raises_error(self):
         """Test that nonexistent workspace raises ProjectDiscoveryError"""
         with pytest.raises(ProjectDiscoveryError, match="does not exist"):
@@ -344,6 +526,89 @@ class TestFrameworkDetection:
         assert len(projects) == 1
         assert projects[0].framework == "ruby"
     
+    def test_framework_priority_preserved(self, tmp_path):
+        """Test that earlier frameworks win when several signatures match"""
+        project_path = tmp_path / "mixed"
+        (project_path / "src" / "Api").mkdir(parents=True)
+        (project_path / "package.json").write_text('{"name": "test"}')
+        (project_path / "requirements.txt").write_text("fastapi")
+        (project_path / "src" / "Api" / "Api.csproj").write_text("<Project></Project>")
+        
+        discovery = ProjectDiscovery(tmp_path, use_cache=False)
+        
+        assert discovery._detect_framework(project_path) == "dotnet"
+        
+        (project_path / "src" / "Api" / "Api.csproj").unlink()
+        assert discovery._detect_framework(project_path) == "nodejs"
+    
+    def test_framework_detection_scans_project_once(self, tmp_path, monkeypatch):
+        """Test that detection lists each directory once and skips excluded ones"""
+        project_path = tmp_path / "node-api"
+        (project_path / "node_modules" / "pkg").mkdir(parents=True)
+        (project_path / "src").mkdir()
+        (project_path / "package.json").write_text('{"name": "test"}')
+        
+        scanned = []
+        real_scandir = os.scandir
+        
+        def recording_scandir(path):
+            scanned.append(Path(path).name)
+            return real_scandir(path)
+        
+        monkeypatch.setattr(
+            "specify_cli.validation.project_discovery.os.scandir", recording_scandir
+        )
+        
+        discovery = ProjectDiscovery(tmp_path, use_cache=False)
+        
+        assert discovery._detect_framework(project_path) == "nodejs"
+        assert sorted(scanned) == ["node-api", "src"]
+    
+    def test_framework_signature_only_matches_at_root(self, tmp_path):
+        """Test that named signature files below the project root are ignored"""
+        project_path = tmp_path / "docs-site"
+        (project_path / "examples").mkdir(parents=True)
+        (project_path / "examples" / "package.json").write_text('{"name": "test"}')
+        
+        discovery = ProjectDiscovery(tmp_path, use_cache=False)
+        
+        assert discovery._detect_framework(project_path) == "unknown"
+    
+    def test_frameworks_detected_on_thread_pool(self, temp_workspace, monkeypatch):
+        """Test that many projects are detected concurrently and keep their frameworks"""
+        threads = set()
+        real_detect = ProjectDiscovery._detect_framework
+        
+        def recording_detect(self, project_path):
+            threads.add(threading.get_ident())
+            return real_detect(self, project_path)
+        
+        monkeypatch.setattr(ProjectDiscovery, "_detect_framework", recording_detect)
+        
+        discovery = ProjectDiscovery(temp_workspace, use_cache=False)
+        projects = discovery.discover_projects()
+        
+        assert {p.name: p.framework for p in projects} == {
+            "dotnet-api": "dotnet",
+            "nodejs-express": "nodejs",
+            "python-fastapi": "python",
+        }
+        assert threading.get_ident() not in threads
+    
+    def test_few_projects_detected_serially(self, tmp_path, monkeypatch):
+        """Test that small workspaces skip the thread pool"""
+        (tmp_path / "api" / "bicep").mkdir(parents=True)
+        (tmp_path / "api" / "bicep" / "main.bicep").write_text("// bicep")
+        
+        def fail_executor(*args, **kwargs):
+            raise AssertionError("thread pool should not be used")
+        
+        monkeypatch.setattr(project_discovery, "ThreadPoolExecutor", fail_executor)
+        
+        projects = ProjectDiscovery(tmp_path, use_cache=False).discover_projects()
+        
+        assert [p.name for p in projects] == ["api"]
+    
     def test_unknown_framework_detection(self, tmp_path):
         """Test detection when framework is unknown"""
         unknown_path = tmp_path / "unknown-api"
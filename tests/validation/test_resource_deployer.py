@@ -169,6 +169,87 @@ class TestResourceDeployer:
         # Verify ordered deployment calls
         assert mock_azure_cli.deploy_template.call_count == 3
     
+    async def test_dependency_order_applied(self, mock_azure_cli, sample_deployments):
+        """Test that deployments run in the graph's topological order."""
+        graph = DependencyGraph()
+        # storage0 depends on storage1, which depends on storage2
+        graph.add_dependency(sample_deployments[0].resource_id, sample_deployments[1].resource_id)
+        graph.add_dependency(sample_deployments[1].resource_id, sample_deployments[2].resource_id)
+        
+        deployer = ResourceDeployer(resource_group="test-rg")
+        result = await deployer.deploy_resources(sample_deployments, dependency_graph=graph, show_progress=False)
+        
+        assert [d.resource_name for d in result.deployed_resources] == ["storage-2", "storage-1", "storage-0"]
+    
+    async def test_independent_resources_deploy_concurrently(self, mock_azure_cli, sample_deployments):
+        """Test that resources in the same dependency layer overlap."""
+        graph = DependencyGraph()
+        for deployment in sample_deployments:
+            graph.add_node(deployment.resource_id)
+        
+        deployer = ResourceDeployer(resource_group="test-rg", max_concurrent=2)
+        in_flight = [0]
+        peak = [0]
+        
+        async def fake_deploy(deployment):
+            async with deployer._deployment_sem:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+                await asyncio.sleep(0.01)
+                in_flight[0] -= 1
+            return True
+        
+        with patch.object(deployer, "_deploy_single", side_effect=fake_deploy):
+            result = await deployer.deploy_resources(sample_deployments, dependency_graph=graph, show_progress=False)
+        
+        # Overlapping, but still bounded by max_concurrent
+        assert peak[0] == 2
+        assert result.success is True
+        assert {d.resource_name for d in result.deployed_resources} == {"storage-0", "storage-1", "storage-2"}
+    
+    async def test_dependent_waits_for_dependency_layer(self, mock_azure_cli, sample_deployments):
+        """Test that a dependent starts only after its whole layer below finished."""
+        graph = DependencyGraph()
+        # storage2 depends on storage0 and storage1
+        graph.add_dependency(sample_deployments[2].resource_id, sample_deployments[0].resource_id)
+        graph.add_dependency(sample_deployments[2].resource_id, sample_deployments[1].resource_id)
+        
+        deployer = ResourceDeployer(resource_group="test-rg")
+        events = []
+        
+        async def fake_deploy(deployment):
+            events.append(("start", deployment.resource_name))
+            await asyncio.sleep(0.01)
+            events.append(("end", deployment.resource_name))
+            return deployment.resource_name != "storage-1"
+        
+        with patch.object(deployer, "_deploy_single", side_effect=fake_deploy):
+            result = await deployer.deploy_resources(sample_deployments, dependency_graph=graph, show_progress=False)
+        
+        assert events.index(("start", "storage-2")) > events.index(("end", "storage-0"))
+        assert events.index(("start", "storage-2")) > events.index(("end", "storage-1"))
+        assert [d.resource_name for d in result.deployed_resources] == ["storage-0", "storage-2"]
+        assert result.error_messages == ["Deployment failed for storage-1"]
+    
+    async def test_batch_exception_recorded(self, mock_azure_cli, sample_deployments):
+        """Test that an unexpected exception in a batch doesn't stop its siblings."""
+        graph = DependencyGraph()
+        for deployment in sample_deployments:
+            graph.add_node(deployment.resource_id)
+        
+        deployer = ResourceDeployer(resource_group="test-rg")
+        
+        async def fake_deploy(deployment):
+            if deployment.resource_name == "storage-1":
+                raise RuntimeError("boom")
+            return True
+        
+        with patch.object(deployer, "_deploy_single", side_effect=fake_deploy):
+            result = await deployer.deploy_resources(sample_deployments, dependency_graph=graph, show_progress=False)
+        
+        assert len(result.deployed_resources) == 2
+        assert result.error_messages == [f"Failed to deploy {sample_deployments[1].resource_id}: boom"]
+    
     async def test_deploy_with_circular_dependency(self, mock_azure_cli, sample_deployments):
         """Test deployment fails with circular dependency."""
         graph = DependencyGraph()
@@ -367,3 +448,119 @@ class TestResourceDeployerEdgeCases:
         assert result.success is True
         # Should deploy in original order
         assert len(result.deployed_resources) == 3
+
+
+class TestResourceDeploymentModel:
+    """Test ResourceDeployment dataclass."""
+    
+    def test_arm_name_derived_from_id(self, sample_deployment):
+        """Test that the ARM name comes from the ID, not the display name."""
+        assert sample_deployment.arm_name == "app"
+        assert sample_deployment.resource_name == "test-app"
+    
+    def test_arm_name_not_part_of_equality(self, sample_deployment):
+        """Test that the derived field doesn't affect comparisons."""
+        copy = ResourceDeployment(
+            resource_id=sample_deployment.resource_id,
+            resource_type=sample_deployment.resource_type,
+            resource_name=sample_deployment.resource_name,
+            deployment_order=sample_deployment.deployment_order,
+            deployment_status=sample_deployment.deployment_status,
+            bicep_template_path=sample_deployment.bicep_template_path,
+            output_values={}
+        )
+        
+        assert copy == sample_deployment
+        assert "arm_name" not in repr(copy)
+
+
+@pytest.mark.asyncio
+class TestLegacyResourceDeployerNames:
+    """Test that the legacy deployer addresses resources by ARM name."""
+    
+    @pytest.fixture
+    def legacy_cli(self):
+        with patch("specify_cli.validation.resource_deployer.AzureCLIWrapper") as mock:
+            cli_instance = Mock()
+            cli_instance.get_resource = Mock(return_value={"id": "x"})
+            cli_instance.delete_resource = Mock(return_value=True)
+            mock.return_value = cli_instance
+            yield cli_instance
+    
+    async def test_exists_check_uses_arm_name(self, legacy_cli, sample_deployment):
+        """Test that the existence check looks up the ARM name."""
+        from specify_cli.validation.resource_deployer import ResourceDeployer as LegacyDeployer
+        
+        deployer = LegacyDeployer(resource_group="test-rg")
+        assert await deployer._check_resource_exists(sample_deployment) is True
+        
+        legacy_cli.get_resource.assert_called_once_with("app", "test-rg")
+    
+    async def test_rollback_deletes_arm_name(self, legacy_cli, sample_deployment):
+        """Test that rollback deletes by ARM name, not display name."""
+        from specify_cli.validation.resource_deployer import ResourceDeployer as LegacyDeployer
+        
+        deployer = LegacyDeployer(resource_group="test-rg")
+        deployer.deployed_resources.append(sample_deployment)
+        await deployer._rollback_deployments()
+        
+        legacy_cli.delete_resource.assert_called_once_with("app", "test-rg")
+        assert deployer.deployed_resources == []
+
+
+class TestDependencyGraphCaching:
+    """Test cached topological ordering on DependencyGraph."""
+    
+    def test_ordering_computed_once(self, caplog):
+        """Test that repeated calls reuse the cached order and batches."""
+        import logging
+        caplog.set_level(logging.INFO, logger="specify_cli.utils.dependency_graph")
+        
+        graph = DependencyGraph()
+        graph.add_dependency("app", "plan")
+        graph.add_dependency("app", "storage")
+        
+        first = graph.get_ordered_resources()
+        assert graph.has_cycle() is False
+        second = graph.get_ordered_resources()
+        batches = graph.get_deployment_batches()
+        assert graph.get_deployment_batches() == batches
+        
+        assert first == second
+        assert first[-1] == "app"
+        assert set(batches[0]) == {"plan", "storage"}
+        assert batches[1] == ["app"]
+        
+        messages = [r.getMessage() for r in caplog.records]
+        assert sum(m.startswith("Topological sort complete") for m in messages) == 1
+        assert sum(m.startswith("Created 2 deployment batches") for m in messages) == 1
+    
+    def test_returned_lists_do_not_alias_cache(self):
+        """Test that mutating a returned ordering leaves the cache intact."""
+        graph = DependencyGraph()
+        graph.add_dependency("b", "a")
+        
+        graph.get_ordered_resources().clear()
+        graph.get_deployment_batches()[0].clear()
+        
+        assert graph.get_ordered_resources() == ["a", "b"]
+        assert graph.get_deployment_batches() == [["a"], ["b"]]
+    
+    def test_mutation_invalidates_cache(self):
+        """Test that adding nodes, edges or clearing recomputes the order."""
+        graph = DependencyGraph()
+        graph.add_dependency("b", "a")
+        assert graph.get_ordered_resources() == ["a", "b"]
+        
+        graph.add_dependency("a", "c")
+        assert graph.get_ordered_resources() == ["c", "a", "b"]
+        assert graph.get_deployment_batches() == [["c"], ["a"], ["b"]]
+        
+        graph.add_node("d")
+        assert "d" in graph.get_ordered_resources()
+        
+        graph.add_dependency("c", "b")
+        assert graph.has_cycle() is True
+        
+        graph.clear()
+        assert graph.get_ordered_resources() == []